@@ -1,12 +1,16 @@
 """Benchmark attrs containing other attrs classes."""
 
+from functools import partial
+
 import pytest
 from attrs import define
 
 from cattrs import BaseConverter, Converter, UnstructureStrategy
 
 
-@pytest.mark.parametrize("converter_cls", [BaseConverter, Converter])
+@pytest.mark.parametrize(
+    "converter_cls", [BaseConverter, Converter, partial(Converter, inline_depth=5)]
+)
 @pytest.mark.parametrize(
     "unstructure_strat", [UnstructureStrategy.AS_DICT, UnstructureStrategy.AS_TUPLE]
 )
@@ -67,7 +71,9 @@ def test_unstructure_attrs_nested(benchmark, converter_cls, unstructure_strat):
     benchmark(c.unstructure, inst)
 
 
-@pytest.mark.parametrize("converter_cls", [BaseConverter, Converter])
+@pytest.mark.parametrize(
+    "converter_cls", [BaseConverter, Converter, partial(Converter, inline_depth=5)]
+)
 @pytest.mark.parametrize(
     "unstructure_strat", [UnstructureStrategy.AS_DICT, UnstructureStrategy.AS_TUPLE]
 )
@@ -0,0 +1,44 @@
+"""Benchmark structuring with and without calling `__init__`."""
+
+import pytest
+from attrs import define, field, frozen, validators
+
+from cattrs import Converter
+
+
+@define
+class Slotted:
+    a: int = field(validator=validators.instance_of(int))
+    b: float = field(validator=validators.instance_of(float))
+    c: str = field(validator=validators.instance_of(str))
+    d: list[int] = field(factory=list)
+    e: int = 0
+
+
+@define(slots=False)
+class Dict:
+    a: int = field(validator=validators.instance_of(int))
+    b: float = field(validator=validators.instance_of(float))
+    c: str = field(validator=validators.instance_of(str))
+    d: list[int] = field(factory=list)
+    e: int = 0
+
+
+@frozen
+class Frozen:
+    a: int = field(validator=validators.instance_of(int))
+    b: float = field(validator=validators.instance_of(float))
+    c: str = field(validator=validators.instance_of(str))
+    d: list[int] = field(factory=list)
+    e: int = 0
+
+
+@pytest.mark.parametrize("bypass_init", [False, True])
+@pytest.mark.parametrize("cl", [Slotted, Dict, Frozen])
+def test_structure(benchmark, cl, bypass_init):
+    c = Converter(
+        detailed_validation=False, trust_primitives=True, bypass_init=bypass_init
+    )
+    raw = {"a": 1, "b": 1.0, "c": "a", "d": [1, 2]}
+
+    benchmark(c.structure, raw, cl)
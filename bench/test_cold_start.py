@@ -0,0 +1,41 @@
+"""Benchmark the latency of generating hooks for many classes."""
+
+from dataclasses import field, make_dataclass
+from typing import Optional  # noqa: F401, used by the annotations below
+
+import pytest
+
+from cattrs import Converter
+
+# Stringified annotations, like with `from __future__ import annotations`.
+CLASSES = [
+    make_dataclass(
+        f"C{i}",
+        [
+            ("a", "int"),
+            ("b", "str"),
+            ("c", "Optional[float]", field(default=None)),
+            ("d", "list[int]", field(default_factory=list)),
+        ],
+    )
+    for i in range(200)
+]
+for cl in CLASSES:
+    cl.__module__ = __name__
+
+RAW = {"a": 1, "b": "b", "c": 1.0, "d": [1]}
+
+
+@pytest.mark.parametrize("copy", [False, True])
+def test_structure_unstructure(benchmark, copy):
+    """Generate structure and unstructure hooks for each class, with new converters
+    or copies of one."""
+    base = Converter()
+    make = base.copy if copy else Converter
+
+    def run():
+        c = make()
+        for cl in CLASSES:
+            c.unstructure(c.structure(RAW, cl), cl)
+
+    benchmark(run)
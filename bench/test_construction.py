@@ -0,0 +1,34 @@
+"""Benchmark the latency of making a converter and using it once."""
+
+import pytest
+from attrs import define
+
+from cattrs.preconf.json import make_converter, make_converter_factory
+
+
+@define
+class Inner:
+    a: int
+    b: str
+    c: float
+
+
+@define
+class Outer:
+    inner: Inner
+    inners: list[Inner]
+
+
+RAW = {"inner": {"a": 1, "b": "b", "c": 1.0}, "inners": [{"a": 1, "b": "b", "c": 1.0}]}
+
+
+@pytest.mark.parametrize("factory", [False, True])
+def test_make_then_structure(benchmark, factory):
+    """Make a preconf converter, either directly or from a factory."""
+    if factory:
+        make = make_converter_factory()
+        make().structure(RAW, Outer)
+    else:
+        make = make_converter
+
+    benchmark(lambda: make().structure(RAW, Outer))
@@ -0,0 +1,41 @@
+"""Benchmark the latency of copying a converter, and then using the copy."""
+
+import pytest
+from attrs import define
+
+from cattrs import BaseConverter, Converter
+
+
+@define
+class Inner:
+    a: int
+    b: str
+    c: float
+
+
+@define
+class Outer:
+    inner: Inner
+    inners: list[Inner]
+    mapping: dict[str, Inner]
+
+
+RAW = {
+    "inner": {"a": 1, "b": "b", "c": 1.0},
+    "inners": [{"a": 1, "b": "b", "c": 1.0}],
+    "mapping": {"a": {"a": 1, "b": "b", "c": 1.0}},
+}
+
+
+@pytest.mark.parametrize("converter_cls", [BaseConverter, Converter])
+@pytest.mark.parametrize("tweak", [False, True])
+def test_copy_then_structure(benchmark, converter_cls, tweak):
+    """Copy a warm converter, optionally tweaking the unstructuring side."""
+    c = converter_cls()
+    c.structure(RAW, Outer)
+
+    def copy_then_structure():
+        copy = c.copy(dict_factory=list) if tweak else c.copy()
+        return copy.structure(RAW, Outer)
+
+    benchmark(copy_then_structure)
@@ -0,0 +1,42 @@
+"""Benchmark hook resolution across many distinct types."""
+
+from typing import Optional
+
+import pytest
+from attrs import field, make_class
+
+from cattrs import BaseConverter, Converter
+
+CLASSES = [make_class(f"C{i}", {"a": field(type=int)}) for i in range(2000)]
+TYPES = [
+    *CLASSES,
+    *(list[c] for c in CLASSES),
+    *(Optional[c] for c in CLASSES),
+    *(dict[str, c] for c in CLASSES),
+]
+
+
+@pytest.mark.parametrize("converter_cls", [BaseConverter, Converter])
+def test_resolve_structure_hooks(benchmark, converter_cls):
+    """Resolving structure hooks for thousands of types, bypassing the cache."""
+    c = converter_cls()
+    dispatch = c._structure_func._function_dispatch.dispatch
+
+    def run():
+        for t in TYPES:
+            dispatch(t)
+
+    benchmark(run)
+
+
+@pytest.mark.parametrize("converter_cls", [BaseConverter, Converter])
+def test_resolve_unstructure_hooks(benchmark, converter_cls):
+    """Resolving unstructure hooks for thousands of types, bypassing the cache."""
+    c = converter_cls()
+    dispatch = c._unstructure_func._function_dispatch.dispatch
+
+    def run():
+        for t in TYPES:
+            dispatch(t)
+
+    benchmark(run)
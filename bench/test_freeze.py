@@ -0,0 +1,34 @@
+"""Benchmark dispatch overhead for small payloads, with frozen converters."""
+
+import pytest
+from attrs import define
+
+from cattrs import Converter
+
+
+@define
+class Small:
+    a: int
+    b: str
+
+
+@pytest.mark.parametrize("dispatch_cache", ["strong", "weak"])
+@pytest.mark.parametrize("frozen", [False, True])
+def test_structure_small(benchmark, dispatch_cache, frozen):
+    c = Converter(dispatch_cache=dispatch_cache)
+    c.structure({"a": 1, "b": "b"}, Small)
+    if frozen:
+        c.freeze()
+
+    benchmark(c.structure, {"a": 1, "b": "b"}, Small)
+
+
+@pytest.mark.parametrize("dispatch_cache", ["strong", "weak"])
+@pytest.mark.parametrize("frozen", [False, True])
+def test_unstructure_small(benchmark, dispatch_cache, frozen):
+    c = Converter(dispatch_cache=dispatch_cache)
+    c.unstructure(Small(1, "b"))
+    if frozen:
+        c.freeze()
+
+    benchmark(c.unstructure, Small(1, "b"))
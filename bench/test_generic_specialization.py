@@ -0,0 +1,34 @@
+"""Benchmark generating hooks for many parametrizations of a generic class."""
+
+from typing import Generic, Optional, TypeVar
+
+from attrs import define, field, make_class
+
+from cattrs import Converter
+
+T = TypeVar("T")
+
+
+@define
+class Page(Generic[T]):
+    items: list[T]
+    total: int
+    next: Optional[str] = None
+
+
+PAYLOADS = [
+    make_class(f"Payload{i}", {"a": field(type=int), "b": field(type=str)})
+    for i in range(200)
+]
+RAW = {"items": [{"a": 1, "b": "b"}], "total": 1}
+
+
+def test_structure_unstructure(benchmark):
+    """Generate structure and unstructure hooks for each parametrization."""
+
+    def run():
+        c = Converter()
+        for payload in PAYLOADS:
+            c.unstructure(c.structure(RAW, Page[payload]), Page[payload])
+
+    benchmark(run)
@@ -0,0 +1,33 @@
+"""Benchmark unstructuring with `omit_if_default`."""
+
+from typing import Optional
+
+from attrs import Factory, define
+
+from cattrs import Converter
+
+
+@define
+class C:
+    a: int
+    b: list[int] = Factory(list)
+    c: dict[str, int] = Factory(dict)
+    d: set[str] = Factory(set)
+    e: Optional[str] = None
+    f: int = 0
+
+
+def test_unstructure_defaults(benchmark):
+    """Unstructure instances whose fields are mostly defaults."""
+    c = Converter(omit_if_default=True)
+    insts = [C(i) for i in range(100)]
+
+    benchmark(c.unstructure, insts, list[C])
+
+
+def test_unstructure_values(benchmark):
+    """Unstructure instances whose fields are not defaults."""
+    c = Converter(omit_if_default=True)
+    insts = [C(i, [i], {"a": i}, {"b"}, "e", 1) for i in range(100)]
+
+    benchmark(c.unstructure, insts, list[C])
@@ -0,0 +1,58 @@
+"""Benchmark structuring classes with mostly optional fields, like API models."""
+
+from typing import Optional
+
+import pytest
+from attrs import Factory, define
+
+from cattrs import Converter
+
+
+@define
+class Model:
+    id: int
+    name: Optional[str] = None
+    description: Optional[str] = None
+    tags: list[str] = Factory(list)
+    score: float = 0.0
+    count: int = 0
+    active: bool = True
+    parent: Optional[int] = None
+
+
+SPARSE = [{"id": i, "name": "name"} for i in range(100)]
+FULL = [
+    {
+        "id": i,
+        "name": "name",
+        "description": "description",
+        "tags": ["a", "b"],
+        "score": 1.5,
+        "count": i,
+        "active": False,
+        "parent": i - 1,
+    }
+    for i in range(100)
+]
+
+
+@pytest.mark.parametrize("forbid_extra_keys", [False, True])
+@pytest.mark.parametrize("detailed_validation", [True, False])
+def test_structure_sparse(benchmark, forbid_extra_keys, detailed_validation):
+    """Structure payloads with only a few of the optional fields."""
+    c = Converter(
+        forbid_extra_keys=forbid_extra_keys, detailed_validation=detailed_validation
+    )
+
+    benchmark(c.structure, SPARSE, list[Model])
+
+
+@pytest.mark.parametrize("forbid_extra_keys", [False, True])
+@pytest.mark.parametrize("detailed_validation", [True, False])
+def test_structure_full(benchmark, forbid_extra_keys, detailed_validation):
+    """Structure payloads with all of the optional fields."""
+    c = Converter(
+        forbid_extra_keys=forbid_extra_keys, detailed_validation=detailed_validation
+    )
+
+    benchmark(c.structure, FULL, list[Model])
@@ -1,4 +1,5 @@
 import pytest
+from attrs import define
 
 from cattrs import BaseConverter, Converter
 
@@ -15,3 +16,46 @@ def test_unstructure_float(benchmark, converter_cls):
     c = converter_cls()
 
     benchmark(c.unstructure, 15.0)
+
+
+@define
+class Primitives:
+    a: int
+    b: float
+    c: str
+    d: bytes
+    e: int
+    f: float
+    g: str
+    h: bytes
+
+
+@pytest.mark.parametrize("trust_primitives", [False, True])
+@pytest.mark.parametrize("detailed_validation", [True, "optimistic", False])
+def test_structure_attrs_primitives(benchmark, trust_primitives, detailed_validation):
+    c = Converter(
+        trust_primitives=trust_primitives, detailed_validation=detailed_validation
+    )
+    raw = c.unstructure(Primitives(1, 1.0, "a", b"a", 2, 2.0, "b", b"b"))
+
+    benchmark(c.structure, raw, Primitives)
+
+
+@pytest.mark.parametrize("trust_primitives", [False, True])
+@pytest.mark.parametrize("detailed_validation", [True, "optimistic", False])
+def test_structure_list_int(benchmark, trust_primitives, detailed_validation):
+    c = Converter(
+        trust_primitives=trust_primitives, detailed_validation=detailed_validation
+    )
+
+    benchmark(c.structure, list(range(100)), list[int])
+
+
+@pytest.mark.parametrize("trust_primitives", [False, True])
+@pytest.mark.parametrize("detailed_validation", [True, "optimistic", False])
+def test_structure_dict_str_str(benchmark, trust_primitives, detailed_validation):
+    c = Converter(
+        trust_primitives=trust_primitives, detailed_validation=detailed_validation
+    )
+
+    benchmark(c.structure, {str(i): str(i) for i in range(100)}, dict[str, str])
@@ -0,0 +1,63 @@
+"""Benchmark recursive classes."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import pytest
+from attrs import define
+
+from cattrs import Converter
+
+
+@define
+class TreeNode:
+    value: int
+    children: list[TreeNode]
+
+
+@define
+class ListNode:
+    value: int
+    next: Optional[ListNode] = None
+
+
+def _tree(depth: int) -> TreeNode:
+    return TreeNode(depth, [_tree(depth - 1) for _ in range(3)] if depth else [])
+
+
+def _linked_list(length: int) -> ListNode:
+    res = None
+    for i in range(length):
+        res = ListNode(i, res)
+    return res
+
+
+@pytest.mark.parametrize("detailed_validation", [True, False])
+def test_structure_tree(benchmark, detailed_validation):
+    c = Converter(detailed_validation=detailed_validation)
+    raw = c.unstructure(_tree(5))
+
+    benchmark(c.structure, raw, TreeNode)
+
+
+def test_unstructure_tree(benchmark):
+    c = Converter()
+    inst = _tree(5)
+
+    benchmark(c.unstructure, inst)
+
+
+@pytest.mark.parametrize("detailed_validation", [True, False])
+def test_structure_linked_list(benchmark, detailed_validation):
+    c = Converter(detailed_validation=detailed_validation)
+    raw = c.unstructure(_linked_list(200))
+
+    benchmark(c.structure, raw, ListNode)
+
+
+def test_unstructure_linked_list(benchmark):
+    c = Converter()
+    inst = _linked_list(200)
+
+    benchmark(c.unstructure, inst)
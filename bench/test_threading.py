@@ -0,0 +1,48 @@
+"""Benchmark structuring and unstructuring from several threads.
+
+Every thread does the same amount of work, so on free-threaded Python the
+timings should stay flat as threads are added.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from attrs import define
+
+from cattrs import BaseConverter, Converter
+
+
+@define
+class Inner:
+    a: int
+    b: str
+    c: float
+
+
+@define
+class Outer:
+    inner: Inner
+    inners: list[Inner]
+    mapping: dict[str, Inner]
+
+
+RAW = {
+    "inner": {"a": 1, "b": "b", "c": 1.0},
+    "inners": [{"a": i, "b": "b", "c": 1.0} for i in range(10)],
+    "mapping": {str(i): {"a": i, "b": "b", "c": 1.0} for i in range(10)},
+}
+ROUNDS = 200
+
+
+@pytest.mark.parametrize("converter_cls", [BaseConverter, Converter])
+@pytest.mark.parametrize("threads", [1, 2, 4, 8])
+def test_threaded_roundtrip(benchmark, converter_cls, threads):
+    c = converter_cls()
+    c.unstructure(c.structure(RAW, Outer))
+
+    def work(_):
+        for _ in range(ROUNDS):
+            c.unstructure(c.structure(RAW, Outer))
+
+    with ThreadPoolExecutor(threads) as pool:
+        benchmark(lambda: list(pool.map(work, range(threads))))
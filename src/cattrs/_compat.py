@@ -8,12 +8,13 @@ from collections.abc import Sequence as AbcSequence
 from collections.abc import Set as AbcSet
 from dataclasses import MISSING, Field, is_dataclass
 from dataclasses import fields as dataclass_fields
-from functools import partial
+from functools import partial, wraps
 from inspect import signature as _signature
 from types import GenericAlias
 from typing import (
     Annotated,
     Any,
+    Callable,
     Deque,
     Dict,
     Final,
@@ -25,6 +26,7 @@ from typing import (
     Optional,
     Protocol,
     Tuple,
+    TypeVar,
     Union,
     _AnnotatedAlias,
     _GenericAlias,
@@ -96,21 +98,49 @@ except ImportError:  # pragma: no cover
     ANIES = frozenset([Any])
 
 NoneType = type(None)
+_type = type
 
+P = TypeVar("P", bound=Callable[[Any], bool])
 
+# Coarse type kinds, used by `FunctionDispatch` to only evaluate the predicates
+# that can possibly match a given type.
+KIND_CLASS: Final = 1  # Ordinary classes.
+KIND_ALIAS: Final = 2  # Generic aliases and other forms with an `__origin__`.
+KIND_UNION: Final = 4  # Unions, including optionals.
+KIND_OTHER: Final = 8  # Everything else: type variables, newtypes, strings...
+KIND_ANY: Final = KIND_CLASS | KIND_ALIAS | KIND_UNION | KIND_OTHER
+
+
+def matches_kinds(kinds: int) -> Callable[[P], P]:
+    """Mark a predicate as only ever matching types of the given kinds.
+
+    Unmarked predicates are assumed to be able to match any kind of type.
+    """
+
+    def mark(predicate: P) -> P:
+        predicate._cattrs_kinds = kinds
+        return predicate
+
+    return mark
+
+
+@matches_kinds(KIND_UNION)
 def is_optional(typ: Any) -> bool:
     return is_union_type(typ) and NoneType in typ.__args__ and len(typ.__args__) == 2
 
 
+@matches_kinds(KIND_CLASS | KIND_ALIAS)
 def is_typeddict(cls: Any):
     """Thin wrapper around typing(_extensions).is_typeddict"""
     return _is_typeddict(getattr(cls, "__origin__", cls))
 
 
+@matches_kinds(KIND_CLASS | KIND_ALIAS)
 def has(cls):
     return hasattr(cls, "__attrs_attrs__") or hasattr(cls, "__dataclass_fields__")
 
 
+@matches_kinds(KIND_CLASS | KIND_ALIAS)
 def has_with_generic(cls):
     """Test whether the class if a normal or generic attrs or dataclass."""
     return has(cls) or has(get_origin(cls))
@@ -130,10 +160,59 @@ def fields_dict(type) -> dict[str, Union[Attribute, Field]]:
     return attrs_fields_dict(type)
 
 
+# Results of introspecting classes (and code generated for them) are cached on the
+# classes themselves, under this attribute.
+# Like the weak dispatch caches, this does not keep the classes alive.
+_CLASS_CACHE_ATTR = "__cattrs_class_cache__"
+
+_T = TypeVar("_T")
+
+
+def class_cache(cl: Any) -> Optional[dict[Any, Any]]:
+    """Return the cache stored on a class, creating it if needed.
+
+    Returns `None` for other types, like generic aliases, and for classes that
+    cannot hold attributes.
+    """
+    if not isinstance(cl, type):
+        return None
+    cache = cl.__dict__.get(_CLASS_CACHE_ATTR)
+    if cache is None:
+        try:
+            setattr(cl, _CLASS_CACHE_ATTR, {})
+        except Exception:
+            # Builtins and extension types.
+            return None
+        cache = cl.__dict__[_CLASS_CACHE_ATTR]
+    return cache
+
+
+def cache_per_class(fn: Callable[[type], _T]) -> Callable[[type], _T]:
+    """Cache the results of `fn` on the classes it is called with, using
+    `class_cache`."""
+
+    @wraps(fn)
+    def cached(cl: type) -> _T:
+        cache = class_cache(cl)
+        if cache is None:
+            return fn(cl)
+        if fn in cache:
+            return cache[fn]
+        res = cache[fn] = fn(cl)
+        return res
+
+    return cached
+
+
+@cache_per_class
 def adapted_fields(cl: type) -> list[Attribute]:
     """Return the attrs format of `fields()` for attrs and dataclasses.
 
     Resolves `attrs` stringified annotations, if present.
+    The results are cached on the classes.
+
+    .. versionchanged:: NEXT
+        The results are cached.
     """
     if is_dataclass(cl):
         attrs = dataclass_fields(cl)
@@ -183,11 +262,13 @@ def is_subclass(obj: type, bases) -> bool:
         return False
 
 
+@matches_kinds(KIND_ALIAS)
 def is_hetero_tuple(type: Any) -> bool:
     origin = getattr(type, "__origin__", None)
     return origin is tuple and ... not in type.__args__
 
 
+@matches_kinds(KIND_CLASS)
 def is_protocol(type: Any) -> bool:
     return is_subclass(type, Protocol) and getattr(type, "_is_protocol", False)
 
@@ -215,6 +296,7 @@ try:
     # Not present on 3.9.0, so we try carefully.
     from typing import _LiteralGenericAlias
 
+    @matches_kinds(KIND_ALIAS | KIND_OTHER)
     def is_literal(type: Any) -> bool:
         """Is this a literal?"""
         return type in LITERALS or (
@@ -240,10 +322,12 @@ FrozenSetSubscriptable = frozenset
 TupleSubscriptable = tuple
 
 
+@matches_kinds(KIND_ALIAS)
 def is_annotated(type) -> bool:
     return getattr(type, "__class__", None) is _AnnotatedAlias
 
 
+@matches_kinds(KIND_CLASS | KIND_ALIAS)
 def is_tuple(type):
     return (
         type in (Tuple, tuple)
@@ -254,6 +338,7 @@ def is_tuple(type):
 
 if sys.version_info >= (3, 14):
 
+    @matches_kinds(KIND_UNION)
     def is_union_type(obj):
         from types import UnionType  # noqa: PLC0415
 
@@ -269,6 +354,7 @@ if sys.version_info >= (3, 14):
 else:
     from typing import _UnionGenericAlias
 
+    @matches_kinds(KIND_UNION)
     def is_union_type(obj):
         from types import UnionType  # noqa: PLC0415
 
@@ -289,6 +375,19 @@ else:
         from typing_extensions import NotRequired, Required
 
 
+def type_kind(type: Any) -> int:
+    """Classify a type into one of the coarse `KIND_*` kinds."""
+    # `isinstance` would be fooled by generic aliases forwarding `__class__`.
+    # Classes are checked first since they are by far the most common.
+    if issubclass(_type(type), _type):
+        return KIND_CLASS
+    if is_union_type(type):
+        return KIND_UNION
+    if getattr(type, "__origin__", None) is not None:
+        return KIND_ALIAS
+    return KIND_OTHER
+
+
 def get_notrequired_base(type) -> Union[Any, NothingType]:
     if is_annotated(type):
         # Handle `Annotated[NotRequired[int]]`
@@ -298,6 +397,7 @@ def get_notrequired_base(type) -> Union[Any, NothingType]:
     return NOTHING
 
 
+@matches_kinds(KIND_CLASS | KIND_ALIAS)
 def is_mutable_sequence(type: Any) -> bool:
     """A predicate function for mutable sequences.
 
@@ -317,6 +417,7 @@ def is_mutable_sequence(type: Any) -> bool:
     )
 
 
+@matches_kinds(KIND_CLASS | KIND_ALIAS)
 def is_sequence(type: Any) -> bool:
     """A predicate function for sequences.
 
@@ -338,6 +439,7 @@ def is_sequence(type: Any) -> bool:
     )
 
 
+@matches_kinds(KIND_CLASS | KIND_ALIAS)
 def is_deque(type):
     return (
         type in (deque, Deque)
@@ -346,6 +448,7 @@ def is_deque(type):
     )
 
 
+@matches_kinds(KIND_CLASS | KIND_ALIAS)
 def is_mutable_set(type: Any) -> bool:
     """A predicate function for (mutable) sets.
 
@@ -361,6 +464,7 @@ def is_mutable_set(type: Any) -> bool:
     )
 
 
+@matches_kinds(KIND_CLASS | KIND_ALIAS)
 def is_frozenset(type: Any) -> bool:
     """A predicate function for frozensets.
 
@@ -379,6 +483,7 @@ def is_bare(type):
     )
 
 
+@matches_kinds(KIND_CLASS | KIND_ALIAS)
 def is_mapping(type: Any) -> bool:
     """A predicate function for mappings."""
     return (
@@ -393,6 +498,7 @@ def is_mapping(type: Any) -> bool:
     )
 
 
+@matches_kinds(KIND_CLASS | KIND_ALIAS)
 def is_counter(type):
     return (
         type in (Counter, TypingCounter) or getattr(type, "__origin__", None) is Counter
@@ -425,6 +531,7 @@ def get_full_type_hints(obj, globalns=None, localns=None):
     return get_type_hints(obj, globalns, localns, include_extras=True)
 
 
+@matches_kinds(KIND_ALIAS)
 def is_generic_attrs(type) -> bool:
     """Return True for both specialized (A[int]) and unspecialized (A) generics."""
     return is_generic(type) and has(type.__origin__)
@@ -0,0 +1,94 @@
+"""Rebinding hooks, factories and predicates to other objects, for cloning."""
+
+from __future__ import annotations
+
+from functools import partial
+from types import BuiltinMethodType, CellType, FunctionType, MethodType
+from typing import Any
+
+_EMPTY = object()
+
+
+def rebind(obj: Any, subs: dict[int, Any], memo: dict[int, Any]) -> Any:
+    """Return `obj` with references to the keys of `subs` (object ids) replaced by
+    the corresponding values.
+
+    References are looked for in bound methods, function closures and defaults,
+    and partials, recursively. Objects not needing changes are returned as-is.
+
+    :param memo: Already rebound objects, by id.
+    """
+    key = id(obj)
+    if key in subs:
+        return subs[key]
+    if key in memo:
+        return memo[key]
+    # Break cycles: recursive references stay as they are.
+    memo[key] = obj
+
+    res = obj
+    if isinstance(obj, MethodType):
+        owner = rebind(obj.__self__, subs, memo)
+        if owner is not obj.__self__:
+            res = MethodType(obj.__func__, owner)
+    elif isinstance(obj, BuiltinMethodType):
+        # Bound methods of builtins, like `dict.__getitem__`.
+        owner = getattr(obj, "__self__", None)
+        if owner is not None and id(owner) in subs:
+            res = getattr(subs[id(owner)], obj.__name__)
+    elif isinstance(obj, FunctionType):
+        res = _rebind_function(obj, subs, memo)
+    elif isinstance(obj, partial):
+        func = rebind(obj.func, subs, memo)
+        args = tuple(rebind(a, subs, memo) for a in obj.args)
+        keywords = {k: rebind(v, subs, memo) for k, v in obj.keywords.items()}
+        if (
+            func is not obj.func
+            or any(a is not b for a, b in zip(args, obj.args))
+            or any(v is not obj.keywords[k] for k, v in keywords.items())
+        ):
+            res = partial(func, *args, **keywords)
+
+    memo[key] = res
+    return res
+
+
+def _rebind_function(
+    fn: FunctionType, subs: dict[int, Any], memo: dict[int, Any]
+) -> FunctionType:
+    changed = False
+
+    closure = fn.__closure__
+    if closure:
+        contents = []
+        for cell in closure:
+            try:
+                content = cell.cell_contents
+            except ValueError:  # An empty cell.
+                contents.append(_EMPTY)
+                continue
+            new_content = rebind(content, subs, memo)
+            changed = changed or new_content is not content
+            contents.append(new_content)
+        if changed:
+            closure = tuple(
+                CellType() if c is _EMPTY else CellType(c) for c in contents
+            )
+
+    defaults = fn.__defaults__
+    if defaults:
+        new_defaults = tuple(rebind(d, subs, memo) for d in defaults)
+        if any(a is not b for a, b in zip(new_defaults, defaults)):
+            defaults = new_defaults
+            changed = True
+
+    if not changed:
+        return fn
+
+    res = FunctionType(fn.__code__, fn.__globals__, fn.__name__, defaults, closure)
+    res.__kwdefaults__ = fn.__kwdefaults__
+    res.__qualname__ = fn.__qualname__
+    res.__module__ = fn.__module__
+    res.__doc__ = fn.__doc__
+    res.__dict__.update(fn.__dict__)
+    return res
@@ -0,0 +1,95 @@
+"""Walking type graphs, for warming up converters."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import Any, ForwardRef, TypeVar
+
+from attrs import NOTHING
+from typing_extensions import Self
+
+from ._compat import (
+    adapted_fields,
+    get_args,
+    get_final_base,
+    get_newtype_base,
+    get_notrequired_base,
+    get_origin,
+    has,
+    is_annotated,
+    is_generic,
+    is_literal,
+    is_typeddict,
+    is_union_type,
+)
+from ._generics import deep_copy_with
+from .gen._generics import generate_mapping
+from .gen.typeddicts import _adapted_fields as adapted_typeddict_fields
+from .typealiases import get_type_alias_base, is_type_alias
+
+__all__ = ["walk_types"]
+
+
+def walk_types(types: Iterable[Any]) -> Iterator[Any]:
+    """Yield the given types, and every type nested in them, once each.
+
+    Nested types are the field types of _attrs_ classes, dataclasses and
+    TypedDicts (with type variables substituted for generic classes), the
+    arguments of generics and the members of unions, and the bases of NewTypes,
+    type aliases and `Annotated` and `Final` types.
+    """
+    seen: set[Any] = set()
+    pending = list(types)
+    pending.reverse()
+    while pending:
+        typ = pending.pop()
+        try:
+            if typ in seen:
+                continue
+            seen.add(typ)
+        except TypeError:  # Unhashable, like some `Annotated` metadata.
+            pass
+        yield typ
+        nested = [t for t in _nested_types(typ) if _is_type(t)]
+        nested.reverse()
+        pending.extend(nested)
+
+
+def _is_type(typ: Any) -> bool:
+    return typ is not Ellipsis and not isinstance(typ, (str, ForwardRef, TypeVar))
+
+
+def _nested_types(typ: Any) -> list[Any]:
+    if (base := get_newtype_base(typ)) is not None:
+        return [base]
+    if is_annotated(typ):
+        return [get_args(typ)[0]]
+    if (base := get_final_base(typ)) is not None:
+        return [base]
+    if is_type_alias(typ):
+        return [get_type_alias_base(typ)]
+    if is_literal(typ):
+        return []
+    if is_union_type(typ):
+        return list(get_args(typ))
+
+    origin = get_origin(typ)
+    cl = origin if origin is not None else typ
+    if has(cl) or is_typeddict(cl):
+        mapping = generate_mapping(typ) if is_generic(typ) else {}
+        attrs = adapted_fields(cl) if has(cl) else adapted_typeddict_fields(cl)
+        res = []
+        for t in (a.type for a in attrs):
+            if t is None:
+                continue
+            if (base := get_notrequired_base(t)) is not NOTHING:
+                t = base
+            if t is Self:
+                t = typ
+            elif isinstance(t, TypeVar):
+                t = mapping.get(t.__name__, t)
+            else:
+                t = deep_copy_with(t, mapping, typ)
+            res.append(t)
+        return res
+    return list(get_args(typ))
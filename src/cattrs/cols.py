@@ -11,6 +11,8 @@ from attrs import NOTHING, Attribute, NothingType
 
 from ._compat import (
     ANIES,
+    KIND_ALIAS,
+    KIND_CLASS,
     AbcSet,
     get_args,
     get_full_type_hints,
@@ -21,6 +23,7 @@ from ._compat import (
     is_mutable_sequence,
     is_sequence,
     is_subclass,
+    matches_kinds,
 )
 from ._compat import is_mutable_set as is_set
 from .dispatch import StructureHook, UnstructureHook
@@ -36,6 +39,16 @@ from .gen import (
     mapping_unstructure_factory,
 )
 from .gen import make_iterable_unstructure_fn as iterable_unstructure_factory
+from .gen._lc import LinecacheMode
+from .gen._shared import (
+    InlineHook,
+    LateStructureHook,
+    bind_late_hooks,
+    bind_structure_hook,
+    inline_copy,
+    inline_iterable,
+    validation_variant,
+)
 
 if TYPE_CHECKING:
     from .converters import BaseConverter
@@ -63,16 +76,19 @@ __all__ = [
 ]
 
 
+@matches_kinds(KIND_CLASS | KIND_ALIAS)
 def is_any_set(type) -> bool:
     """A predicate function for both mutable and frozensets."""
     return is_set(type) or is_frozenset(type)
 
 
+@matches_kinds(KIND_CLASS | KIND_ALIAS)
 def is_abstract_set(type) -> bool:
     """A predicate function for abstract (collection.abc) sets."""
     return type is AbcSet or (getattr(type, "__origin__", None) is AbcSet)
 
 
+@matches_kinds(KIND_CLASS)
 def is_namedtuple(type: Any) -> bool:
     """A predicate function for named tuples."""
 
@@ -101,6 +117,11 @@ def list_structure_factory(type: type, converter: BaseConverter) -> StructureHoo
     """A hook factory for structuring lists.
 
     Converts any given iterable into a list.
+
+    ..  versionchanged:: NEXT
+        Lists of elements trusted to be of the right type are just copied.
+    ..  versionchanged:: NEXT
+        Optimistic detailed validation is supported.
     """
 
     if is_bare(type) or type.__args__[0] in ANIES:
@@ -108,6 +129,7 @@ def list_structure_factory(type: type, converter: BaseConverter) -> StructureHoo
         def structure_list(obj: Iterable[T], _: type = type) -> list[T]:
             return list(obj)
 
+        structure_list._cattrs_inline = inline_copy(list)
         return structure_list
 
     elem_type = type.__args__[0]
@@ -116,19 +138,30 @@ def list_structure_factory(type: type, converter: BaseConverter) -> StructureHoo
         handler = converter.get_structure_hook(elem_type)
     except RecursionError:
         # Break the cycle by using late binding.
-        handler = converter.structure
+        handler = LateStructureHook(converter, elem_type)
+
+    if handler == converter._structure_trusted:
+
+        def structure_list(obj: Iterable[T], _: type = type) -> list[T]:
+            return list(obj)
+
+        structure_list._cattrs_inline = inline_copy(list)
 
-    if converter.detailed_validation:
+    elif converter.detailed_validation:
+        detailed_handler = validation_variant(handler, elem_type, converter, True)
 
         def structure_list(
-            obj: Iterable[T], _: type = type, _handler=handler, _elem_type=elem_type
+            obj: Iterable[T],
+            _: type = type,
+            _handler=detailed_handler,
+            _elem_type=elem_type,
         ) -> list[T]:
             errors = []
             res = []
             ix = 0  # Avoid `enumerate` for performance.
             for e in obj:
                 try:
-                    res.append(handler(e, _elem_type))
+                    res.append(_handler(e, _elem_type))
                 except Exception as e:
                     msg = IterableValidationNote(
                         f"Structuring {type} @ index {ix}", ix, elem_type
@@ -144,6 +177,42 @@ def list_structure_factory(type: type, converter: BaseConverter) -> StructureHoo
 
             return res
 
+        if converter.detailed_validation == "optimistic":
+            detailed_structure_list = structure_list
+            handler = validation_variant(handler, elem_type, converter, False)
+
+            def fast_structure_list(
+                obj: Iterable[T], _: type = type, _handler=handler, _elem_type=elem_type
+            ) -> list[T]:
+                return [_handler(e, _elem_type) for e in obj]
+
+            def structure_list(
+                obj: Iterable[T],
+                _: type = type,
+                _handler=handler,
+                _elem_type=elem_type,
+                _detailed=detailed_structure_list,
+            ) -> list[T]:
+                if obj.__class__ is not list and obj.__class__ is not tuple:
+                    # One-shot iterables need to survive the fallback.
+                    obj = list(obj)
+                try:
+                    return [_handler(e, _elem_type) for e in obj]
+                except Exception:
+                    # Nested one-shot iterables may have been consumed, so
+                    # the detailed pass is only trusted to raise.
+                    _detailed(obj, _)
+                    raise
+
+            structure_list._cattrs_inline = _inline_structure_iterable(
+                list, handler, elem_type, converter
+            )
+            # Hooks calling this one call either variant directly instead.
+            structure_list._cattrs_fast = fast_structure_list
+            structure_list._cattrs_detailed = detailed_structure_list
+            bind_late_hooks(fast_structure_list)
+            bind_late_hooks(detailed_structure_list)
+
     else:
 
         def structure_list(
@@ -151,6 +220,11 @@ def list_structure_factory(type: type, converter: BaseConverter) -> StructureHoo
         ) -> list[T]:
             return [_handler(e, _elem_type) for e in obj]
 
+        structure_list._cattrs_inline = _inline_structure_iterable(
+            list, handler, elem_type, converter
+        )
+
+    bind_late_hooks(structure_list)
     return structure_list
 
 
@@ -160,6 +234,9 @@ def homogenous_tuple_structure_factory(
     """A hook factory for homogeneous (all elements the same, indeterminate length) tuples.
 
     Converts any given iterable into a tuple.
+
+    ..  versionchanged:: NEXT
+        Tuples of elements trusted to be of the right type are just copied.
     """
 
     if is_bare(type) or type.__args__[0] in ANIES:
@@ -167,6 +244,7 @@ def homogenous_tuple_structure_factory(
         def structure_tuple(obj: Iterable[T], _: type = type) -> tuple[T, ...]:
             return tuple(obj)
 
+        structure_tuple._cattrs_inline = inline_copy(tuple)
         return structure_tuple
 
     elem_type = type.__args__[0]
@@ -175,15 +253,44 @@ def homogenous_tuple_structure_factory(
         handler = converter.get_structure_hook(elem_type)
     except RecursionError:
         # Break the cycle by using late binding.
-        handler = converter.structure
+        handler = LateStructureHook(converter, elem_type)
+
+    if handler == converter._structure_trusted:
 
-    if converter.detailed_validation:
+        def structure_tuple(obj: Iterable[T], _: type = type) -> tuple[T, ...]:
+            return tuple(obj)
+
+        structure_tuple._cattrs_inline = inline_copy(tuple)
+
+    elif converter.detailed_validation:
         # We have to structure into a list first anyway.
         list_structure = list_structure_factory(type, converter)
 
         def structure_tuple(obj: Iterable[T], _: type = type) -> tuple[T, ...]:
             return tuple(list_structure(obj, _))
 
+        if converter.detailed_validation == "optimistic":
+            structure_tuple._cattrs_inline = _inline_structure_iterable(
+                tuple,
+                validation_variant(handler, elem_type, converter, False),
+                elem_type,
+                converter,
+            )
+
+            def fast_structure_tuple(
+                obj: Iterable[T], _: type = type, _list=list_structure._cattrs_fast
+            ) -> tuple[T, ...]:
+                return tuple(_list(obj, _))
+
+            def detailed_structure_tuple(
+                obj: Iterable[T], _: type = type, _list=list_structure._cattrs_detailed
+            ) -> tuple[T, ...]:
+                return tuple(_list(obj, _))
+
+            # Hooks calling this one call either variant directly instead.
+            structure_tuple._cattrs_fast = fast_structure_tuple
+            structure_tuple._cattrs_detailed = detailed_structure_tuple
+
     else:
 
         def structure_tuple(
@@ -191,9 +298,24 @@ def homogenous_tuple_structure_factory(
         ) -> tuple[T, ...]:
             return tuple([_handler(e, _elem_type) for e in obj])
 
+        structure_tuple._cattrs_inline = _inline_structure_iterable(
+            tuple, handler, elem_type, converter
+        )
+
+    bind_late_hooks(structure_tuple)
     return structure_tuple
 
 
+def _inline_structure_iterable(
+    cl: type, handler: StructureHook, elem_type: Any, converter: BaseConverter
+) -> InlineHook:
+    """Inline a hook structuring iterables into `cl` without detailed validation."""
+    bound = bind_structure_hook(handler, elem_type, converter)
+    return inline_iterable(
+        cl, lambda inlining, e: inlining.structure(handler, bound, elem_type, e)
+    )
+
+
 def namedtuple_unstructure_factory(
     cl: type[tuple], converter: BaseConverter, unstructure_to: Any = None
 ) -> UnstructureHook:
@@ -247,7 +369,7 @@ def namedtuple_dict_structure_factory(
     converter: BaseConverter,
     detailed_validation: bool | Literal["from_converter"] = "from_converter",
     forbid_extra_keys: bool = False,
-    use_linecache: bool = True,
+    use_linecache: LinecacheMode | Literal["from_converter"] = "from_converter",
     /,
     **kwargs: AttributeOverride,
 ) -> StructureHook:
@@ -255,9 +377,14 @@ def namedtuple_dict_structure_factory(
 
     :param forbid_extra_keys: Whether the hook should raise a `ForbiddenExtraKeysError`
         if unknown keys are encountered.
-    :param use_linecache: Whether to store the source code in the Python linecache.
+    :param use_linecache: Whether to store the source code in the Python linecache,
+        or register it lazily (`lazy`), when formatting tracebacks. Takes its value
+        from the given converter by default.
 
     .. versionadded:: 24.1.0
+    .. versionchanged:: NEXT
+        `use_linecache` can be `lazy`, and takes its value from the given converter
+        by default.
     """
     try:
         working_set = already_generating.working_set
@@ -290,7 +417,7 @@ def namedtuple_dict_unstructure_factory(
     cl: type[tuple],
     converter: BaseConverter,
     omit_if_default: bool = False,
-    use_linecache: bool = True,
+    use_linecache: LinecacheMode | Literal["from_converter"] = "from_converter",
     /,
     **kwargs: AttributeOverride,
 ) -> UnstructureHook:
@@ -298,9 +425,14 @@ def namedtuple_dict_unstructure_factory(
 
     :param omit_if_default: When true, attributes equal to their default values
         will be omitted in the result dictionary.
-    :param use_linecache: Whether to store the source code in the Python linecache.
+    :param use_linecache: Whether to store the source code in the Python linecache,
+        or register it lazily (`lazy`), when formatting tracebacks. Takes its value
+        from the given converter by default.
 
     .. versionadded:: 24.1.0
+    .. versionchanged:: NEXT
+        `use_linecache` can be `lazy`, and takes its value from the given converter
+        by default.
     """
     try:
         working_set = already_generating.working_set
@@ -327,6 +459,7 @@ def namedtuple_dict_unstructure_factory(
             del already_generating.working_set
 
 
+@matches_kinds(KIND_ALIAS)
 def is_defaultdict(type: Any) -> bool:
     """Is this type a defaultdict?
 
@@ -4,14 +4,18 @@ from collections import Counter, deque
 from collections.abc import Callable, Iterable
 from collections.abc import Mapping as AbcMapping
 from collections.abc import MutableMapping as AbcMutableMapping
+from concurrent.futures import Future
 from dataclasses import Field
 from enum import Enum
+from functools import partial
 from inspect import Signature
 from inspect import signature as inspect_signature
 from pathlib import Path
-from typing import Any, Optional, Tuple, TypeVar, overload
+from threading import Thread
+from time import perf_counter
+from typing import Any, Literal, Optional, Tuple, TypeVar, overload
 
-from attrs import Attribute, resolve_types
+from attrs import Attribute, define, resolve_types
 from attrs import has as attrs_has
 from typing_extensions import Self
 
@@ -32,6 +36,7 @@ from ._compat import (
     Sequence,
     Set,
     TypeAlias,
+    adapted_fields,
     fields,
     get_final_base,
     get_newtype_base,
@@ -43,7 +48,6 @@ from ._compat import (
     is_counter,
     is_deque,
     is_frozenset,
-    is_generic,
     is_generic_attrs,
     is_hetero_tuple,
     is_literal,
@@ -58,6 +62,8 @@ from ._compat import (
     is_union_type,
     signature,
 )
+from ._rebind import rebind
+from ._warmup import walk_types
 from .cols import (
     defaultdict_structure_factory,
     homogenous_tuple_structure_factory,
@@ -74,6 +80,8 @@ from .cols import (
 )
 from .disambiguators import create_default_dis_func, is_supported_union
 from .dispatch import (
+    DispatchCacheMode,
+    DispatchStats,
     HookFactory,
     MultiStrategyDispatch,
     StructuredValue,
@@ -100,7 +108,11 @@ from .gen import (
     make_dict_unstructure_fn,
     make_hetero_tuple_structure_fn,
     make_hetero_tuple_unstructure_fn,
+    make_tuple_structure_fn,
+    make_tuple_unstructure_fn,
 )
+from .gen._lc import LinecacheMode
+from .gen._shared import bind_structure_hook
 from .gen.typeddicts import make_dict_structure_fn as make_typeddict_dict_struct_fn
 from .gen.typeddicts import make_dict_unstructure_fn as make_typeddict_dict_unstruct_fn
 from .literals import is_literal_containing_enums
@@ -156,6 +168,9 @@ UnstructureHookT = TypeVar("UnstructureHookT", bound=UnstructureHook)
 StructureHookT = TypeVar("StructureHookT", bound=StructureHook)
 CounterT = TypeVar("CounterT", bound=Counter)
 
+# The primitives structured as is by converters trusting primitives.
+_TRUSTED_PRIMITIVES = (str, bytes, int, float)
+
 
 class UnstructureStrategy(Enum):
     """`attrs` classes unstructuring strategies."""
@@ -164,6 +179,36 @@ class UnstructureStrategy(Enum):
     AS_TUPLE = "astuple"
 
 
+@define(frozen=True)
+class ConverterStats:
+    """Statistics collected by a converter, see `BaseConverter.stats()`.
+
+    .. versionadded:: NEXT
+    """
+
+    structure: DispatchStats
+    unstructure: DispatchStats
+
+
+@define(frozen=True)
+class WarmupReport:
+    """The outcome of `BaseConverter.warmup()`.
+
+    :ivar structure: The types structure hooks were generated for, including
+        hooks generated for nested types.
+    :ivar unstructure: The types unstructure hooks were generated for.
+    :ivar errors: The errors raised while getting hooks, by direction and type.
+    :ivar duration: The time the warmup took, in seconds.
+
+    .. versionadded:: NEXT
+    """
+
+    structure: list[Any]
+    unstructure: list[Any]
+    errors: dict[tuple[Literal["structure", "unstructure"], Any], Exception]
+    duration: float
+
+
 def _is_extended_factory(factory: Callable) -> bool:
     """Does this factory also accept a converter arg?"""
     # We use the original `inspect.signature` to not evaluate string
@@ -180,6 +225,8 @@ class BaseConverter:
 
     __slots__ = (
         "_dict_factory",
+        "_dispatch_cache",
+        "_dispatch_cache_maxsize",
         "_prefer_attrib_converters",
         "_struct_copy_skip",
         "_structure_attrs",
@@ -201,6 +248,8 @@ class BaseConverter:
         structure_fallback_factory: HookFactory[StructureHook] = lambda t: raise_error(
             None, t
         ),
+        dispatch_cache: DispatchCacheMode = "strong",
+        dispatch_cache_maxsize: int | None = None,
     ) -> None:
         """
         :param detailed_validation: Whether to use a slightly slower mode for detailed
@@ -209,15 +258,27 @@ class BaseConverter:
             registered unstructuring hooks match.
         :param structure_fallback_factory: A hook factory to be called when no
             registered structuring hooks match.
+        :param dispatch_cache: How hooks are cached. `strong` caches keep every
+            type ever un/structured (and its hook) alive for the lifetime of the
+            converter. `weak` caches let classes (and their hooks) be garbage
+            collected, which is useful for long-running processes creating classes
+            dynamically.
+        :param dispatch_cache_maxsize: For `weak` caches, bounds the number of
+            cached typing constructs (generic aliases, unions, literals...) that
+            cannot be cached weakly, evicting the least recently used ones.
+            For `strong` caches, bounds the entire cache.
 
         ..  versionadded:: 23.2.0 *unstructure_fallback_factory*
         ..  versionadded:: 23.2.0 *structure_fallback_factory*
         ..  versionchanged:: 24.2.0
             The default `structure_fallback_factory` now raises errors for missing handlers
             more eagerly, surfacing problems earlier.
+        ..  versionadded:: NEXT *dispatch_cache* and *dispatch_cache_maxsize*
         """
         unstruct_strat = UnstructureStrategy(unstruct_strat)
         self._prefer_attrib_converters = prefer_attrib_converters
+        self._dispatch_cache = dispatch_cache
+        self._dispatch_cache_maxsize = dispatch_cache_maxsize
 
         self.detailed_validation = detailed_validation
         self._union_struct_registry: dict[Any, Callable[[Any, type[T]], T]] = {}
@@ -231,7 +292,10 @@ class BaseConverter:
             self._structure_attrs = self.structure_attrs_fromtuple
 
         self._unstructure_func = MultiStrategyDispatch(
-            unstructure_fallback_factory, self
+            unstructure_fallback_factory,
+            self,
+            cache=dispatch_cache,
+            cache_maxsize=dispatch_cache_maxsize,
         )
         self._unstructure_func.register_cls_list(
             [(bytes, identity), (str, identity), (Path, str)]
@@ -271,7 +335,12 @@ class BaseConverter:
         # Per-instance register of to-attrs converters.
         # Singledispatch dispatches based on the first argument, so we
         # store the function and switch the arguments in self.loads.
-        self._structure_func = MultiStrategyDispatch(structure_fallback_factory, self)
+        self._structure_func = MultiStrategyDispatch(
+            structure_fallback_factory,
+            self,
+            cache=dispatch_cache,
+            cache_maxsize=dispatch_cache_maxsize,
+        )
         self._structure_func.register_func_list(
             [
                 (
@@ -342,6 +411,170 @@ class BaseConverter:
             else UnstructureStrategy.AS_TUPLE
         )
 
+    @property
+    def frozen(self) -> bool:
+        """Whether the converter has been frozen using `freeze()`.
+
+        .. versionadded:: NEXT
+        """
+        return self._structure_func.frozen
+
+    def enable_stats(self) -> None:
+        """Start collecting statistics, discarding any collected so far.
+
+        Collecting statistics slows down dispatch somewhat, so it's disabled by
+        default.
+
+        .. versionadded:: NEXT
+        """
+        self._unstructure_func.enable_stats()
+        self._structure_func.enable_stats()
+
+    def disable_stats(self) -> None:
+        """Stop collecting statistics, keeping the ones collected so far.
+
+        .. versionadded:: NEXT
+        """
+        self._unstructure_func.disable_stats()
+        self._structure_func.disable_stats()
+
+    def stats(self) -> ConverterStats:
+        """Return a snapshot of the statistics collected so far.
+
+        Statistics include dispatch cache hits and misses, cache sizes, the number
+        of hooks generated and the time spent generating them.
+        They need to be enabled first, using `enable_stats()`; if they never were,
+        only the cache sizes are reported.
+
+        .. versionadded:: NEXT
+        """
+        return ConverterStats(
+            self._structure_func.stats(), self._unstructure_func.stats()
+        )
+
+    def freeze(self) -> None:
+        """Freeze the converter, after which hooks cannot be registered anymore.
+
+        Un/structuring types the converter hasn't seen yet still works; their hooks
+        are generated and cached on first use, as usual.
+        Frozen converters always use plain dictionaries as their dispatch caches, so
+        dispatching is a single dictionary lookup.
+
+        Registering hooks on a frozen converter raises a `FrozenConverterError`.
+        Copies of frozen converters are not frozen.
+
+        .. versionadded:: NEXT
+        """
+        self._unstructure_func.freeze()
+        self._structure_func.freeze()
+
+    @overload
+    def warmup(
+        self,
+        types: Iterable[Any],
+        directions: Iterable[Literal["structure", "unstructure"]] = ...,
+        *,
+        background: Literal[False] = False,
+    ) -> WarmupReport: ...
+
+    @overload
+    def warmup(
+        self,
+        types: Iterable[Any],
+        directions: Iterable[Literal["structure", "unstructure"]] = ...,
+        *,
+        background: Literal[True],
+    ) -> Future[WarmupReport]: ...
+
+    def warmup(
+        self,
+        types: Iterable[Any],
+        directions: Iterable[Literal["structure", "unstructure"]] = (
+            "structure",
+            "unstructure",
+        ),
+        *,
+        background: bool = False,
+    ) -> WarmupReport | Future[WarmupReport]:
+        """Generate the hooks for the given types, and every type nested in them,
+        ahead of time.
+
+        Nested types are the field types of _attrs_ classes, dataclasses and
+        TypedDicts, the arguments of generics (like collections) and the members of
+        unions, and the bases of NewTypes, type aliases and `Annotated` types.
+
+        Errors raised while getting hooks (for example, for types the converter
+        cannot handle) do not stop the warmup, and are reported instead.
+
+        Warming up before forking worker processes lets them inherit the hooks.
+        Background warmups need to finish before forking.
+
+        :param directions: Whether to generate structure hooks, unstructure hooks,
+            or both.
+        :param background: Whether to warm up in a background thread, returning a
+            future of the report instead of the report.
+
+        .. versionadded:: NEXT
+        """
+        types = list(types)
+        directions = list(directions)
+        for direction in directions:
+            if direction not in ("structure", "unstructure"):
+                raise ValueError(f"Unknown direction: {direction!r}")
+
+        if not background:
+            return self._warmup(types, directions)
+
+        res: Future[WarmupReport] = Future()
+
+        def run() -> None:
+            if not res.set_running_or_notify_cancel():
+                return
+            try:
+                res.set_result(self._warmup(types, directions))
+            except BaseException as exc:
+                res.set_exception(exc)
+
+        Thread(target=run, name="cattrs-warmup", daemon=True).start()
+        return res
+
+    def _warmup(
+        self, types: list[Any], directions: list[Literal["structure", "unstructure"]]
+    ) -> WarmupReport:
+        start = perf_counter()
+        dispatches = {
+            "structure": self._structure_func,
+            "unstructure": self._unstructure_func,
+        }
+        before = {d: set(dispatches[d]._cache) for d in directions}
+        errors = {}
+        for typ in walk_types(types):
+            for direction in directions:
+                if direction == "structure":
+                    if typ is NoneType:
+                        # Only structured as a member of unions.
+                        continue
+                    hook_types = [typ]
+                else:
+                    # Objects are unstructured by their runtime class by default.
+                    origin = get_origin(typ)
+                    hook_types = [typ, origin] if isinstance(origin, type) else [typ]
+                for hook_type in hook_types:
+                    try:
+                        dispatches[direction].get_hook(hook_type)
+                    except Exception as exc:
+                        errors[(direction, hook_type)] = exc
+        generated = {
+            d: [t for t in dispatches[d]._cache if t not in before[d]]
+            for d in directions
+        }
+        return WarmupReport(
+            generated.get("structure", []),
+            generated.get("unstructure", []),
+            errors,
+            perf_counter() - start,
+        )
+
     @overload
     def register_unstructure_hook(self, cls: UnstructureHookT) -> UnstructureHookT: ...
 
@@ -473,11 +706,7 @@ class BaseConverter:
 
         .. versionadded:: 24.1.0
         """
-        return (
-            self._unstructure_func.dispatch(type)
-            if cache_result
-            else self._unstructure_func.dispatch_without_caching(type)
-        )
+        return self._unstructure_func.get_hook(type, cache_result)
 
     @overload
     def register_structure_hook(self, cl: StructureHookT) -> StructureHookT: ...
@@ -516,8 +745,8 @@ class BaseConverter:
         if attrs_has(cl):
             resolve_types(cl)
         if is_union_type(cl):
+            self._structure_func.invalidate([cl])
             self._union_struct_registry[cl] = func
-            self._structure_func.clear_cache()
         elif is_type_alias(cl):
             # Type aliases are special-cased.
             self._structure_func.register_func_list([(lambda t: t is cl, func)])
@@ -613,11 +842,31 @@ class BaseConverter:
 
         .. versionadded:: 24.1.0
         """
-        return (
-            self._structure_func.dispatch(type)
-            if cache_result
-            else self._structure_func.dispatch_without_caching(type)
-        )
+        return self._structure_func.get_hook(type, cache_result)
+
+    def get_bound_structure_hook(
+        self, type: Any, cache_result: bool = True
+    ) -> Callable[[UnstructuredValue], StructuredValue]:
+        """Get the structure hook for the given type, bound to the type.
+
+        The returned hook takes a single argument, the value to structure.
+        Hooks that can be bound without wrapping them (hooks that just call the
+        type, and generated hooks) are returned directly; other hooks are
+        wrapped.
+
+        :param cache_result: Whether to cache the underlying hook.
+
+        .. versionadded:: NEXT
+        """
+        hook = self._structure_func.get_hook(type, cache_result)
+        bound = bind_structure_hook(hook, type, self)
+        if bound is not None:
+            return bound
+
+        def bound_structure_hook(obj: UnstructuredValue, _hook=hook, _type=type):
+            return _hook(obj, _type)
+
+        return bound_structure_hook
 
     # Classes to Python primitives.
     def unstructure_attrs_asdict(self, obj: Any) -> dict[str, Any]:
@@ -696,12 +945,14 @@ class BaseConverter:
             def structure_attrs_union(obj, _) -> cl:
                 if obj is None:
                     return None
-                return self.structure(obj, dis_fn(obj))
+                cl = dis_fn(obj)
+                return self._detailed_hook(cl)(obj, cl)
 
         else:
 
             def structure_attrs_union(obj, _):
-                return self.structure(obj, dis_fn(obj))
+                cl = dis_fn(obj)
+                return self._detailed_hook(cl)(obj, cl)
 
         return structure_attrs_union
 
@@ -715,6 +966,15 @@ class BaseConverter:
         """
         return cl(obj)
 
+    @staticmethod
+    def _structure_trusted(obj: Any, _: Any) -> Any:
+        """Return ``obj`` as is, trusting it to already be of the right type.
+
+        Generated hooks and collection hooks recognize this hook, and skip calling
+        it altogether.
+        """
+        return obj
+
     @staticmethod
     def _structure_simple_literal(val, type):
         if val not in type.__args__:
@@ -794,7 +1054,7 @@ class BaseConverter:
             res = deque(obj)
         else:
             elem_type = cl.__args__[0]
-            handler = self._structure_func.dispatch(elem_type)
+            handler = self._detailed_hook(elem_type)
             if self.detailed_validation:
                 errors = []
                 res = deque()
@@ -825,7 +1085,9 @@ class BaseConverter:
         if is_bare(cl) or cl.__args__[0] in ANIES:
             return structure_to(obj)
         elem_type = cl.__args__[0]
-        handler = self._structure_func.dispatch(elem_type)
+        handler = self._detailed_hook(elem_type)
+        if handler == self._structure_trusted:
+            return structure_to(obj)
         if self.detailed_validation:
             errors = []
             res = set()
@@ -863,8 +1125,8 @@ class BaseConverter:
         key_type, val_type = cl.__args__
 
         if self.detailed_validation:
-            key_handler = self._structure_func.dispatch(key_type)
-            val_handler = self._structure_func.dispatch(val_type)
+            key_handler = self._detailed_hook(key_type)
+            val_handler = self._detailed_hook(val_type)
             errors = []
             res = {}
 
@@ -913,6 +1175,30 @@ class BaseConverter:
         # We can't actually have a Union of a Union, so this is safe.
         return self._structure_func.dispatch(other)(obj, other)
 
+    def _structure_detailed_optional(self, obj, union):
+        """Like `_structure_optional`, for optimistic detailed validation."""
+        if obj is None:
+            return None
+        if AnnotationForwardRef is not None and isinstance(union, AnnotationForwardRef):
+            union = union.evaluate()
+        union_params = union.__args__
+        other = union_params[0] if union_params[1] is NoneType else union_params[1]
+        return self._detailed_hook(other)(obj, other)
+
+    def _detailed_hook(self, type: Any) -> StructureHook:
+        """Dispatch the hook for `type` for hooks dispatching at run time.
+
+        These hooks don't know whether they're called during the fast or the
+        detailed pass of optimistic detailed validation, so they always use the
+        detailed variants; see `validation_variant`.
+        """
+        hook = self._structure_func.dispatch(type)
+        if self.detailed_validation != "optimistic":
+            return hook
+        if hook == self._structure_optional:
+            return self._structure_detailed_optional
+        return getattr(hook, "_cattrs_detailed", hook)
+
     def gen_structure_hetero_tuple(self, cl: Any) -> HeteroTupleStructureFn:
         """Generate a heterogeneous tuple structure function."""
         return make_hetero_tuple_structure_fn(
@@ -929,7 +1215,7 @@ class BaseConverter:
         if has_ellipsis:
             # We're dealing with a homogeneous tuple, tuple[int, ...]
             tup_type = tup_params[0]
-            conv = self._structure_func.dispatch(tup_type)
+            conv = self._detailed_hook(tup_type)
             if self.detailed_validation:
                 errors = []
                 res = []
@@ -959,7 +1245,7 @@ class BaseConverter:
             res = []
             for ix, (t, e) in enumerate(zip(tup_params, obj)):
                 try:
-                    conv = self._structure_func.dispatch(t)
+                    conv = self._detailed_hook(t)
                     res.append(conv(e, t))
                 except Exception as exc:
                     msg = IterableValidationNote(
@@ -1023,8 +1309,14 @@ class BaseConverter:
     ) -> Self:
         """Create a copy of the converter, keeping all existing custom hooks.
 
+        For each direction (structuring and unstructuring) configured the same way,
+        the copy shares the hooks of this converter until either of them changes.
+
         :param detailed_validation: Whether to use a slightly slower mode for detailed
             validation errors.
+
+        ..  versionchanged:: NEXT
+            Copies share the hooks of the original converter until they diverge.
         """
         res = self.__class__(
             dict_factory if dict_factory is not None else self._dict_factory,
@@ -1047,23 +1339,107 @@ class BaseConverter:
                 if detailed_validation is not None
                 else self.detailed_validation
             ),
+            dispatch_cache=self._dispatch_cache,
+            dispatch_cache_maxsize=self._dispatch_cache_maxsize,
         )
 
         self._unstructure_func.copy_to(res._unstructure_func, self._unstruct_copy_skip)
         self._structure_func.copy_to(res._structure_func, self._struct_copy_skip)
+        self._share_hooks_with(res)
 
         return res
 
+    def _clone(self, stable: dict[int, Any] | None = None) -> Self:
+        """Create a copy of this converter without configuring it again.
+
+        The copy gets all attributes and registrations of this converter, with
+        references to this converter (in bound methods, closures...) replaced by
+        references to the copy. It shares the hooks of this converter until either
+        of them changes, like copies made using `copy()`.
+
+        :param stable: Objects known not to need rebinding, by id. Updated in
+            place, to make further clones of this converter cheaper.
+        """
+        cls = self.__class__
+        res = cls.__new__(cls)
+        subs: dict[int, Any] = {id(self): res}
+
+        attrs = {}
+        for c in cls.__mro__:
+            for name in c.__dict__.get("__slots__", ()):
+                if name not in ("__dict__", "__weakref__") and hasattr(self, name):
+                    attrs[name] = getattr(self, name)
+        attrs.update(getattr(self, "__dict__", {}))
+
+        dispatches = {}
+        for name, value in attrs.items():
+            if isinstance(value, MultiStrategyDispatch):
+                dispatches[name] = subs[id(value)] = MultiStrategyDispatch(
+                    value._fallback_factory,
+                    res,
+                    cache=self._dispatch_cache,
+                    cache_maxsize=self._dispatch_cache_maxsize,
+                )
+            elif value.__class__ is dict:
+                subs[id(value)] = {}
+
+        memo: dict[int, Any] = dict(stable) if stable is not None else {}
+        for name, value in attrs.items():
+            if name in dispatches:
+                value.clone_into(
+                    dispatches[name], partial(rebind, subs=subs, memo=memo)
+                )
+                setattr(res, name, dispatches[name])
+            elif value.__class__ is dict:
+                copy = subs[id(value)]
+                copy.update((k, rebind(v, subs, memo)) for k, v in value.items())
+                setattr(res, name, copy)
+            else:
+                setattr(res, name, rebind(value, subs, memo))
+
+        if stable is not None and len(memo) > len(stable):
+            stable.update((k, v) for k, v in memo.items() if id(v) == k)
+        return res
+
+    def _structure_options(self) -> tuple:
+        """The options the structure hooks of this converter depend on."""
+        return (
+            self._structure_func._fallback_factory,
+            self.unstruct_strat,
+            self.detailed_validation,
+            self._prefer_attrib_converters,
+            self._union_struct_registry,
+        )
+
+    def _unstructure_options(self) -> tuple:
+        """The options the unstructure hooks of this converter depend on."""
+        return (
+            self._unstructure_func._fallback_factory,
+            self._dict_factory,
+            self.unstruct_strat,
+        )
+
+    def _share_hooks_with(self, copy: BaseConverter) -> None:
+        """Let a fresh copy share our hooks, for directions configured the same."""
+        if copy._structure_options() == self._structure_options():
+            copy._structure_func.share_hooks_from(self._structure_func)
+        if copy._unstructure_options() == self._unstructure_options():
+            copy._unstructure_func.share_hooks_from(self._unstructure_func)
+
 
 class Converter(BaseConverter):
     """A converter which generates specialized un/structuring functions."""
 
     __slots__ = (
         "_unstruct_collection_overrides",
+        "bypass_init",
         "forbid_extra_keys",
+        "inline_depth",
         "omit_if_default",
+        "trust_primitives",
         "type_overrides",
         "use_alias",
+        "use_linecache",
     )
 
     def __init__(
@@ -1075,22 +1451,59 @@ class Converter(BaseConverter):
         type_overrides: Mapping[type, AttributeOverride] = {},
         unstruct_collection_overrides: Mapping[type, UnstructureHook] = {},
         prefer_attrib_converters: bool = False,
-        detailed_validation: bool = True,
+        detailed_validation: bool | Literal["optimistic"] = True,
         unstructure_fallback_factory: HookFactory[UnstructureHook] = lambda _: identity,
         structure_fallback_factory: HookFactory[StructureHook] = lambda t: raise_error(
             None, t
         ),
         use_alias: bool = False,
+        dispatch_cache: DispatchCacheMode = "strong",
+        dispatch_cache_maxsize: int | None = None,
+        inline_depth: int = 0,
+        trust_primitives: bool = False,
+        bypass_init: bool = False,
+        use_linecache: LinecacheMode = True,
     ):
         """
         :param detailed_validation: Whether to use a slightly slower mode for detailed
-            validation errors.
+            validation errors. If `optimistic`, the hooks generated for _attrs_
+            classes, dataclasses, lists, tuples and dictionaries use the faster
+            mode, falling back to the slower mode to produce the errors only when
+            structuring fails.
         :param unstructure_fallback_factory: A hook factory to be called when no
             registered unstructuring hooks match.
         :param structure_fallback_factory: A hook factory to be called when no
             registered structuring hooks match.
         :param use_alias: Whether to use the field alias instead of the field name as
             the un/structured dictionary key by default.
+        :param dispatch_cache: How hooks are cached. `strong` caches keep every
+            type ever un/structured (and its hook) alive for the lifetime of the
+            converter. `weak` caches let classes (and their hooks) be garbage
+            collected, which is useful for long-running processes creating classes
+            dynamically.
+        :param dispatch_cache_maxsize: For `weak` caches, bounds the number of
+            cached typing constructs (generic aliases, unions, literals...) that
+            cannot be cached weakly, evicting the least recently used ones.
+            For `strong` caches, bounds the entire cache.
+        :param inline_depth: How many levels of nested _attrs_ classes and
+            dataclasses are inlined into the generated hooks of the classes
+            containing them, saving a function call per nested instance. Recursive
+            classes are never inlined, and structure hooks are only inlined without
+            detailed validation, for classes without optional fields.
+        :param trust_primitives: Whether to trust `str`, `bytes`, `int` and `float`
+            values to already be of the right type when structuring, instead of
+            converting them by calling the type. Generated hooks then use these
+            values as is, and hooks for collections of them just copy the
+            collections. Only use this for input that has already been validated,
+            or comes from a trusted source.
+        :param bypass_init: Whether structure hooks generated for _attrs_ classes
+            and dataclasses create instances without calling `__init__`, setting
+            their fields directly. This skips validators, _attrs_ converters and
+            `on_setattr` hooks, so is also only for trusted input.
+        :param use_linecache: Whether to store the source code of generated hooks in
+            the Python linecache, for tracebacks to show it. If `lazy`, the source
+            code is kept with the hooks instead, and only added to the linecache
+            when formatting tracebacks going through them.
 
         ..  versionadded:: 23.2.0 *unstructure_fallback_factory*
         ..  versionadded:: 23.2.0 *structure_fallback_factory*
@@ -1098,6 +1511,12 @@ class Converter(BaseConverter):
             The default `structure_fallback_factory` now raises errors for missing handlers
             more eagerly, surfacing problems earlier.
         ..  versionadded:: 25.2.0 *use_alias*
+        ..  versionadded:: NEXT *dispatch_cache* and *dispatch_cache_maxsize*
+        ..  versionadded:: NEXT *inline_depth*
+        ..  versionadded:: NEXT *trust_primitives*
+        ..  versionadded:: NEXT *bypass_init*
+        ..  versionadded:: NEXT *use_linecache*
+        ..  versionchanged:: NEXT *detailed_validation* can be `optimistic`.
         """
         super().__init__(
             dict_factory=dict_factory,
@@ -1106,11 +1525,17 @@ class Converter(BaseConverter):
             detailed_validation=detailed_validation,
             unstructure_fallback_factory=unstructure_fallback_factory,
             structure_fallback_factory=structure_fallback_factory,
+            dispatch_cache=dispatch_cache,
+            dispatch_cache_maxsize=dispatch_cache_maxsize,
         )
         self.omit_if_default = omit_if_default
         self.forbid_extra_keys = forbid_extra_keys
         self.type_overrides = dict(type_overrides)
         self.use_alias = use_alias
+        self.inline_depth = inline_depth
+        self.trust_primitives = trust_primitives
+        self.bypass_init = bypass_init
+        self.use_linecache = use_linecache
 
         unstruct_collection_overrides = {
             get_origin(k) or k: v for k, v in unstruct_collection_overrides.items()
@@ -1167,6 +1592,13 @@ class Converter(BaseConverter):
             self.register_structure_hook_factory(
                 has_with_generic, self.gen_structure_attrs_fromdict
             )
+        else:
+            self.register_unstructure_hook_factory(
+                has_with_generic, self.gen_unstructure_attrs_astuple
+            )
+            self.register_structure_hook_factory(
+                has_with_generic, self.gen_structure_attrs_fromtuple
+            )
         self.register_unstructure_hook_factory(
             is_annotated, self.gen_unstructure_annotated
         )
@@ -1222,6 +1654,19 @@ class Converter(BaseConverter):
         self.register_structure_hook_factory(
             lambda t: get_newtype_base(t) is not None, self.get_structure_newtype
         )
+        if trust_primitives:
+            # The singledispatch would also hand subclasses (`bool`, `IntEnum`)
+            # the trusted hook, so the primitives are moved to exact predicates.
+            self._structure_func.unregister_cls_list(_TRUSTED_PRIMITIVES)
+            self._structure_func.register_func_list(
+                [
+                    (
+                        lambda t: is_subclass(t, _TRUSTED_PRIMITIVES),
+                        self._structure_call,
+                    ),
+                    (lambda t: t in _TRUSTED_PRIMITIVES, self._structure_trusted),
+                ]
+            )
 
         # We keep these so we can more correctly copy the hooks.
         self._struct_copy_skip = self._structure_func.get_num_fns()
@@ -1291,10 +1736,8 @@ class Converter(BaseConverter):
         self, cl: type[T]
     ) -> Callable[[T], dict[str, Any]]:
         origin = get_origin(cl)
-        attribs = fields(origin or cl)
-        if attrs_has(cl) and any(isinstance(a.type, str) for a in attribs):
-            # PEP 563 annotations - need to be resolved.
-            resolve_types(origin or cl)
+        # Resolves PEP 563 annotations, if present.
+        attribs = adapted_fields(origin or cl)
         attrib_overrides = {
             a.name: self.type_overrides[a.type]
             for a in attribs
@@ -1305,6 +1748,24 @@ class Converter(BaseConverter):
             cl, self, _cattrs_omit_if_default=self.omit_if_default, **attrib_overrides
         )
 
+    def gen_unstructure_attrs_astuple(
+        self, cl: type[T]
+    ) -> Callable[[T], tuple[Any, ...]]:
+        """Generate a tuple unstructuring hook for an _attrs_ class or dataclass.
+
+        .. versionadded:: NEXT
+        """
+        origin = get_origin(cl)
+        # Resolves PEP 563 annotations, if present.
+        attribs = adapted_fields(origin or cl)
+        attrib_overrides = {
+            a.name: self.type_overrides[a.type]
+            for a in attribs
+            if a.type in self.type_overrides
+        }
+
+        return make_tuple_unstructure_fn(cl, self, **attrib_overrides)
+
     def gen_unstructure_optional(self, cl: type[T]) -> Callable[[T], Any]:
         """Generate an unstructuring hook for optional types."""
         union_params = cl.__args__
@@ -1333,10 +1794,8 @@ class Converter(BaseConverter):
         self, cl: type[T]
     ) -> Callable[[Mapping[str, Any], Any], T]:
         origin = get_origin(cl)
-        attribs = fields(origin or cl if is_generic(cl) else cl)
-        if attrs_has(cl) and any(isinstance(a.type, str) for a in attribs):
-            # PEP 563 annotations - need to be resolved.
-            resolve_types(origin or cl)
+        # Resolves PEP 563 annotations, if present.
+        attribs = adapted_fields(origin or cl)
         attrib_overrides = {
             a.name: self.type_overrides[a.type]
             for a in attribs
@@ -1352,6 +1811,29 @@ class Converter(BaseConverter):
             **attrib_overrides,
         )
 
+    def gen_structure_attrs_fromtuple(
+        self, cl: type[T]
+    ) -> Callable[[Sequence[Any], Any], T]:
+        """Generate a tuple structuring hook for an _attrs_ class or dataclass.
+
+        .. versionadded:: NEXT
+        """
+        origin = get_origin(cl)
+        # Resolves PEP 563 annotations, if present.
+        attribs = adapted_fields(origin or cl)
+        attrib_overrides = {
+            a.name: self.type_overrides[a.type]
+            for a in attribs
+            if a.type in self.type_overrides
+        }
+        return make_tuple_structure_fn(
+            cl,
+            self,
+            _cattrs_prefer_attrib_converters=self._prefer_attrib_converters,
+            _cattrs_detailed_validation=self.detailed_validation,
+            **attrib_overrides,
+        )
+
     def gen_unstructure_iterable(
         self, cl: Any, unstructure_to: Any = None
     ) -> IterableUnstructureFn:
@@ -1426,13 +1908,23 @@ class Converter(BaseConverter):
         type_overrides: Mapping[type, AttributeOverride] | None = None,
         unstruct_collection_overrides: Mapping[type, UnstructureHook] | None = None,
         prefer_attrib_converters: bool | None = None,
-        detailed_validation: bool | None = None,
+        detailed_validation: bool | Literal["optimistic"] | None = None,
         use_alias: bool | None = None,
+        inline_depth: int | None = None,
+        trust_primitives: bool | None = None,
+        bypass_init: bool | None = None,
+        use_linecache: LinecacheMode | None = None,
     ) -> Self:
         """Create a copy of the converter, keeping all existing custom hooks.
 
+        For each direction (structuring and unstructuring) configured the same way,
+        the copy shares the hooks of this converter until either of them changes.
+
         :param detailed_validation: Whether to use a slightly slower mode for detailed
             validation errors.
+
+        ..  versionchanged:: NEXT
+            Copies share the hooks of the original converter until they diverge.
         """
         res = self.__class__(
             dict_factory if dict_factory is not None else self._dict_factory,
@@ -1468,14 +1960,61 @@ class Converter(BaseConverter):
                 else self.detailed_validation
             ),
             use_alias=(use_alias if use_alias is not None else self.use_alias),
+            dispatch_cache=self._dispatch_cache,
+            dispatch_cache_maxsize=self._dispatch_cache_maxsize,
+            inline_depth=(
+                inline_depth if inline_depth is not None else self.inline_depth
+            ),
+            trust_primitives=(
+                trust_primitives
+                if trust_primitives is not None
+                else self.trust_primitives
+            ),
+            bypass_init=bypass_init if bypass_init is not None else self.bypass_init,
+            use_linecache=(
+                use_linecache if use_linecache is not None else self.use_linecache
+            ),
         )
 
         self._unstructure_func.copy_to(
             res._unstructure_func, skip=self._unstruct_copy_skip
         )
         self._structure_func.copy_to(res._structure_func, skip=self._struct_copy_skip)
+        if res.trust_primitives and not self.trust_primitives:
+            # The hooks for primitives were copied over, so we remove them again,
+            # unless they were customized.
+            registry = res._structure_func._single_dispatch.registry
+            res._structure_func.unregister_cls_list(
+                [
+                    t
+                    for t in _TRUSTED_PRIMITIVES
+                    if registry.get(t) == self._structure_call
+                ]
+            )
+        self._share_hooks_with(res)
 
         return res
 
+    def _structure_options(self) -> tuple:
+        return (
+            *super()._structure_options(),
+            self.forbid_extra_keys,
+            self.type_overrides,
+            self.use_alias,
+            self.inline_depth,
+            self.trust_primitives,
+            self.bypass_init,
+        )
+
+    def _unstructure_options(self) -> tuple:
+        return (
+            *super()._unstructure_options(),
+            self.omit_if_default,
+            self.type_overrides,
+            self._unstruct_collection_overrides,
+            self.use_alias,
+            self.inline_depth,
+        )
+
 
 GenConverter: TypeAlias = Converter
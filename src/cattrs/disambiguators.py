@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING, Any, Callable, Literal, Union, get_origin
 from attrs import NOTHING, Attribute, AttrsInstance
 
 from ._compat import (
+    KIND_UNION,
     NoneType,
     adapted_fields,
     fields_dict,
@@ -19,6 +20,7 @@ from ._compat import (
     has,
     is_literal,
     is_union_type,
+    matches_kinds,
 )
 from .gen import AttributeOverride
 
@@ -28,6 +30,7 @@ if TYPE_CHECKING:
 __all__ = ["create_default_dis_func", "is_supported_union"]
 
 
+@matches_kinds(KIND_UNION)
 def is_supported_union(typ: Any) -> bool:
     """Whether the type is a union of attrs classes or dataclasses."""
     return is_union_type(typ) and all(
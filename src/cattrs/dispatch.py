@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from functools import lru_cache, singledispatch
+from collections import OrderedDict
+from collections.abc import Collection, Iterable, Iterator
+from contextlib import suppress
+from functools import singledispatch
+from itertools import count
+from threading import Event, Lock, RLock, get_ident, local
+from time import perf_counter
 from typing import TYPE_CHECKING, Any, Callable, Generic, Literal, TypeVar
+from weakref import WeakSet, finalize, ref
 
-from attrs import Factory, define
+from attrs import Factory, define, evolve, field
 
-from ._compat import TypeAlias
+from ._compat import KIND_ANY, TypeAlias, type_kind
+from .errors import FrozenConverterError
 from .fns import Predicate
 
 if TYPE_CHECKING:
@@ -20,6 +28,7 @@ UnstructureHook: TypeAlias = Callable[[StructuredValue], UnstructuredValue]
 
 Hook = TypeVar("Hook", StructureHook, UnstructureHook)
 HookFactory: TypeAlias = Callable[[TargetType], Hook]
+DispatchCacheMode: TypeAlias = Literal["strong", "weak"]
 
 
 @define
@@ -27,6 +36,36 @@ class _DispatchNotFound:
     """A dummy object to help signify a dispatch not found."""
 
 
+@define
+class DispatchStats:
+    """Statistics collected by a `MultiStrategyDispatch`.
+
+    :ivar hits: The number of dispatches served from the cache.
+    :ivar misses: The number of dispatches that had to resolve a hook.
+    :ivar resolutions: The number of hooks resolved, including uncached ones.
+    :ivar predicate_calls: The number of predicates evaluated while resolving hooks.
+    :ivar compiled: The number of generated functions compiled.
+    :ivar compile_time: The time spent compiling generated functions, in seconds.
+    :ivar code_cache_hits: The number of generated functions loaded from the code
+        cache (see `cattrs.gen.set_code_cache`) instead of compiled.
+    :ivar generation_times: The time spent resolving the hook for each type, in
+        seconds. This includes resolving (and generating) hooks for nested types.
+    :ivar cache_size: The number of cached hooks, when the statistics were taken.
+
+    .. versionadded:: NEXT
+    """
+
+    hits: int = 0
+    misses: int = 0
+    resolutions: int = 0
+    predicate_calls: int = 0
+    compiled: int = 0
+    compile_time: float = 0.0
+    code_cache_hits: int = 0
+    generation_times: dict[Any, float] = Factory(dict)
+    cache_size: int = 0
+
+
 @define
 class FunctionDispatch:
     """
@@ -36,17 +75,33 @@ class FunctionDispatch:
 
     objects that help determine dispatch should be instantiated objects.
 
+    Predicates are indexed by the kinds of types they can match (see
+    `cattrs._compat.matches_kinds`), so only the relevant subset of predicates
+    is evaluated for any given type. Predicates are still evaluated in
+    registration order.
+
+    Registering never mutates the handler list or the index in place; they are
+    replaced instead, so dispatching is safe while another thread registers.
+
     :param converter: A converter to be used for factories that require converters.
 
     ..  versionchanged:: 24.1.0
         Support for factories that require converters, hence this requires a
         converter when creating.
+    ..  versionchanged:: NEXT
+        Predicates are indexed by type kind.
+    ..  versionchanged:: NEXT
+        Registering is safe while other threads dispatch.
     """
 
     _converter: BaseConverter
     _handler_pairs: list[tuple[Predicate, Callable[[Any, Any], Any], bool, bool]] = (
         Factory(list)
     )
+    _index: dict[int, list[tuple[Predicate, Callable[[Any, Any], Any], bool, bool]]] = (
+        field(factory=dict, init=False)
+    )
+    _stats: DispatchStats | None = field(default=None, init=False)
 
     def register(
         self,
@@ -55,13 +110,44 @@ class FunctionDispatch:
         is_generator=False,
         takes_converter=False,
     ) -> None:
-        self._handler_pairs.insert(0, (predicate, func, is_generator, takes_converter))
+        self._handler_pairs = [
+            (predicate, func, is_generator, takes_converter),
+            *self._handler_pairs,
+        ]
+        self._index = {}
+
+    def _handlers_for(
+        self, typ: Any
+    ) -> list[tuple[Predicate, Callable[[Any, Any], Any], bool, bool]]:
+        """Return the handler pairs that could possibly handle `typ`, in order."""
+        # The index is read before the handlers: it's reset after the handlers
+        # change, so an index built from stale handlers is never kept.
+        index = self._index
+        pairs = self._handler_pairs
+        try:
+            kind = type_kind(typ)
+        except Exception:
+            return pairs
+        try:
+            return index[kind]
+        except KeyError:
+            res = index[kind] = [
+                pair
+                for pair in pairs
+                if getattr(pair[0], "_cattrs_kinds", KIND_ANY) & kind
+            ]
+            return res
 
     def dispatch(self, typ: Any) -> Callable[..., Any] | None:
         """
         Return the appropriate handler for the object passed.
         """
-        for can_handle, handler, is_generator, takes_converter in self._handler_pairs:
+        stats = self._stats
+        for can_handle, handler, is_generator, takes_converter in self._handlers_for(
+            typ
+        ):
+            if stats is not None:
+                stats.predicate_calls += 1
             # can handle could raise an exception here
             # such as issubclass being called on an instance.
             # it's easier to just ignore that case.
@@ -83,42 +169,423 @@ class FunctionDispatch:
 
     def copy_to(self, other: FunctionDispatch, skip: int = 0) -> None:
         other._handler_pairs = self._handler_pairs[:-skip] + other._handler_pairs
+        other._index = {}
+
+
+# The hooks currently being generated, with their dependencies, per thread.
+_generating = local()
+
+# A dependency is a (weak reference to a) dispatch and a type dispatched on.
+Dependencies: TypeAlias = "set[tuple[ref[MultiStrategyDispatch], TargetType]]"
+_Frame: TypeAlias = "tuple[MultiStrategyDispatch, TargetType, Dependencies]"
+
+
+def _generation_stack() -> list[_Frame]:
+    try:
+        return _generating.stack
+    except AttributeError:
+        stack = _generating.stack = []
+        return stack
+
+
+class _Guard:
+    """Marks a hook as being generated by a thread, so other threads can wait for
+    it instead of generating it again."""
+
+    __slots__ = ("done", "owner", "result")
+
+    def __init__(self, owner: int) -> None:
+        self.owner = owner
+        self.done = Event()
+        self.result: tuple[Hook, Dependencies] | None = None
+
+
+# Protects the guards of all dispatches, and the guards threads are waiting on.
+_guards_lock = Lock()
+_waiting_on: dict[int, _Guard] = {}
+
+# Serializes changes to dispatches: registrations, invalidations, storing resolved
+# hooks and recording dependencies. Dispatching cached hooks never takes it.
+# Reentrant, since invalidations can cascade into other dispatches.
+_registry_lock = RLock()
+
+
+def _would_deadlock(guard: _Guard, thread: int) -> bool:
+    """Whether waiting on the guard would make the thread (transitively) wait on
+    itself."""
+    owner = guard.owner
+    while owner != thread:
+        guard = _waiting_on.get(owner)
+        if guard is None:
+            return False
+        owner = guard.owner
+    return True
+
+
+class _StrongDispatchCache(dict):
+    """The default dispatch cache, holding every dispatched type (and its hook)
+    strongly."""
+
+    __slots__ = ("_resolve", "deps")
+
+    def __init__(self, resolve: Callable[[TargetType], Hook]) -> None:
+        super().__init__()
+        self._resolve = resolve
+        self.deps: dict[TargetType, Dependencies] = {}
+
+    def __missing__(self, typ: TargetType) -> Hook:
+        return self._resolve(typ)
+
+    def store(self, typ: TargetType, hook: Hook, deps: Dependencies) -> None:
+        self[typ] = hook
+        if deps:
+            self.deps[typ] = deps
+
+    def get_deps(self, typ: TargetType) -> Dependencies:
+        return self.deps.get(typ, ())
+
+    def iter_deps(self) -> Iterable[tuple[TargetType, Dependencies]]:
+        return list(self.deps.items())
+
+    def forget(self, typ: TargetType) -> None:
+        self.pop(typ, None)
+        self.deps.pop(typ, None)
+
+    def cache_clear(self) -> None:
+        self.clear()
+        self.deps.clear()
+
+
+class _LRUDispatchCache:
+    """A dispatch cache holding a bounded number of types, evicting the least
+    recently used ones.
+
+    Since every hit reorders the cache, hits take a (per-cache) lock.
+    """
+
+    __slots__ = ("_entries", "_lock", "_maxsize", "_resolve", "deps")
+
+    def __init__(self, resolve: Callable[[TargetType], Hook], maxsize: int) -> None:
+        self._resolve = resolve
+        self._maxsize = maxsize
+        self._entries: OrderedDict[TargetType, Hook] = OrderedDict()
+        self._lock = Lock()
+        self.deps: dict[TargetType, Dependencies] = {}
+
+    def __call__(self, typ: TargetType) -> Hook:
+        entries = self._entries
+        try:
+            with self._lock:
+                entries.move_to_end(typ)
+                return entries[typ]
+        except KeyError:
+            return self._resolve(typ)
+
+    __getitem__ = __call__
+
+    def store(self, typ: TargetType, hook: Hook, deps: Dependencies) -> None:
+        entries = self._entries
+        with self._lock:
+            entries[typ] = hook
+            if deps:
+                self.deps[typ] = deps
+            while len(entries) > self._maxsize:
+                self.deps.pop(entries.popitem(last=False)[0], None)
+
+    def __contains__(self, typ: TargetType) -> bool:
+        return typ in self._entries
+
+    def keys(self) -> Iterable[TargetType]:
+        with self._lock:
+            return list(self._entries)
+
+    def __iter__(self) -> Iterator[TargetType]:
+        return iter(self.keys())
+
+    def get_deps(self, typ: TargetType) -> Dependencies:
+        return self.deps.get(typ, ())
+
+    def iter_deps(self) -> Iterable[tuple[TargetType, Dependencies]]:
+        return list(self.deps.items())
+
+    def forget(self, typ: TargetType) -> None:
+        with self._lock:
+            self._entries.pop(typ, None)
+            self.deps.pop(typ, None)
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.deps.clear()
+
+
+# Hooks (and their dependencies) for classes are stored on the classes themselves,
+# under these attributes, in dictionaries keyed by cache tokens.
+# Since classes are only referenced from their own dictionaries, hooks referencing
+# their classes (which most generated hooks do) do not keep them alive.
+_CLASS_CACHE_ATTR = "__cattrs_dispatch_cache__"
+_CLASS_DEPS_ATTR = "__cattrs_dispatch_deps__"
+_cache_tokens = count()
+
+
+def _purge_class_entries(token: int, classes: WeakSet[type]) -> None:
+    for cl in list(classes):
+        cl.__dict__.get(_CLASS_CACHE_ATTR, {}).pop(token, None)
+        cl.__dict__.get(_CLASS_DEPS_ATTR, {}).pop(token, None)
+
+
+class _WeakDispatchCache:
+    """A dispatch cache that does not keep classes alive.
+
+    Hooks for classes are stored on the classes. Types that cannot hold
+    attributes (builtins and extension types) are immortal anyway, and are held
+    strongly. Everything else (typing constructs, generic aliases, unions...) is
+    held in an LRU cache, bounded by `maxsize` if given.
+    """
+
+    __slots__ = (
+        "__weakref__",
+        "_classes",
+        "_finalizer",
+        "_others",
+        "_resolve",
+        "_strong",
+        "_strong_deps",
+        "_token",
+    )
+
+    def __init__(
+        self, resolve: Callable[[TargetType], Hook], maxsize: int | None = None
+    ) -> None:
+        self._resolve = resolve
+        self._token = next(_cache_tokens)
+        self._classes: WeakSet[type] = WeakSet()
+        self._strong: dict[type, Hook] = {}
+        self._strong_deps: dict[type, Dependencies] = {}
+        self._others = (
+            _StrongDispatchCache(resolve)
+            if maxsize is None
+            else _LRUDispatchCache(resolve, maxsize)
+        )
+        self._finalizer = finalize(
+            self, _purge_class_entries, self._token, self._classes
+        )
+
+    def __call__(self, typ: TargetType) -> Hook:
+        if not issubclass(type(typ), type):
+            return self._others[typ]
+        entries = typ.__dict__.get(_CLASS_CACHE_ATTR)
+        if entries is not None:
+            res = entries.get(self._token)
+            if res is not None:
+                return res
+        else:
+            res = self._strong.get(typ)
+            if res is not None:
+                return res
+        return self._resolve(typ)
+
+    __getitem__ = __call__
+
+    def store(self, typ: TargetType, hook: Hook, deps: Dependencies) -> None:
+        if not issubclass(type(typ), type):
+            self._others.store(typ, hook, deps)
+            return
+        entries = typ.__dict__.get(_CLASS_CACHE_ATTR)
+        if entries is None:
+            try:
+                setattr(typ, _CLASS_CACHE_ATTR, {self._token: hook})
+                setattr(typ, _CLASS_DEPS_ATTR, {})
+            except Exception:
+                self._strong[typ] = hook
+                if deps:
+                    self._strong_deps[typ] = deps
+                return
+        else:
+            entries[self._token] = hook
+        if deps:
+            typ.__dict__[_CLASS_DEPS_ATTR][self._token] = deps
+        self._classes.add(typ)
+
+    def __contains__(self, typ: TargetType) -> bool:
+        if not issubclass(type(typ), type):
+            return typ in self._others
+        return (
+            self._token in typ.__dict__.get(_CLASS_CACHE_ATTR, ())
+            or typ in self._strong
+        )
+
+    def keys(self) -> Iterable[TargetType]:
+        return [
+            *(cl for cl in self._classes if cl in self),
+            *self._strong,
+            *self._others.keys(),
+        ]
+
+    def __iter__(self) -> Iterator[TargetType]:
+        return iter(self.keys())
+
+    def get_deps(self, typ: TargetType) -> Dependencies:
+        if not issubclass(type(typ), type):
+            return self._others.get_deps(typ)
+        return typ.__dict__.get(_CLASS_DEPS_ATTR, {}).get(
+            self._token
+        ) or self._strong_deps.get(typ, ())
+
+    def iter_deps(self) -> Iterable[tuple[TargetType, Dependencies]]:
+        res = [
+            (cl, deps)
+            for cl in self._classes
+            if (deps := cl.__dict__.get(_CLASS_DEPS_ATTR, {}).get(self._token))
+        ]
+        res.extend(self._strong_deps.items())
+        res.extend(self._others.iter_deps())
+        return res
+
+    def forget(self, typ: TargetType) -> None:
+        if not issubclass(type(typ), type):
+            self._others.forget(typ)
+            return
+        typ.__dict__.get(_CLASS_CACHE_ATTR, {}).pop(self._token, None)
+        typ.__dict__.get(_CLASS_DEPS_ATTR, {}).pop(self._token, None)
+        self._strong.pop(typ, None)
+        self._strong_deps.pop(typ, None)
+
+    def cache_clear(self) -> None:
+        _purge_class_entries(self._token, self._classes)
+        self._classes.clear()
+        self._strong.clear()
+        self._strong_deps.clear()
+        self._others.cache_clear()
+
 
+def _single_dispatches_to(typ: TargetType, cls: type) -> bool:
+    """Whether a singledispatch hook registered for `cls` may apply to `typ`."""
+    mro = getattr(typ, "__mro__", None)
+    if mro is None:
+        return False
+    if cls in mro:
+        return True
+    try:
+        return issubclass(mro[0], cls)
+    except Exception:
+        return False
 
-@define(init=False)
+
+def _matches(predicate: Predicate, typ: TargetType) -> bool:
+    try:
+        return bool(predicate(typ))
+    except Exception:
+        return False
+
+
+@define(init=False, eq=False)
 class MultiStrategyDispatch(Generic[Hook]):
     """
     MultiStrategyDispatch uses a combination of exact-match dispatch,
     singledispatch, and FunctionDispatch.
 
+    The dispatch keeps track of the hooks each cached hook was built from
+    (through `get_hook`), even across dispatches. When hooks are registered,
+    only the cached hooks affected by the registration, and their dependents,
+    are invalidated.
+
+    Dispatching is safe from any number of threads, including on free-threaded
+    Python, and dispatching cached hooks does not take any locks (unless the
+    cache is bounded). Registrations are serialized, and replace the
+    singledispatch and predicate lists instead of mutating them, so threads
+    dispatching concurrently see either the old or the new hooks.
+
     :param fallback_factory: A hook factory to be called when a hook cannot be
         produced.
     :param converter: A converter to be used for factories that require converters.
+    :param cache: The dispatch cache mode. `strong` caches hold every dispatched
+        type, and its hook, for the lifetime of the dispatch. `weak` caches do not
+        keep classes alive, and hold other types (generic aliases, unions...) in an
+        LRU cache.
+    :param cache_maxsize: The maximum size of the LRU cache for non-class types
+        for `weak` caches, or of the entire cache for `strong` caches. `None`
+        means unbounded.
 
     .. versionchanged:: 23.2.0
         Fallbacks are now factories.
     .. versionchanged:: 24.1.0
         Support for factories that require converters, hence this requires a
         converter when creating.
+    .. versionadded:: NEXT *cache* and *cache_maxsize*
+    .. versionchanged:: NEXT
+        Registrations invalidate only the affected cached hooks.
+    .. versionadded:: NEXT *freeze()*
+    .. versionadded:: NEXT *enable_stats()*, *disable_stats()* and *stats()*
+    .. versionadded:: NEXT *share_hooks_from()*
+    .. versionadded:: NEXT *clone_into()*
+    .. versionchanged:: NEXT
+        Registering is safe while other threads dispatch.
     """
 
     _fallback_factory: HookFactory[Hook]
     _direct_dispatch: dict[TargetType, Hook]
     _function_dispatch: FunctionDispatch
     _single_dispatch: Any
-    dispatch: Callable[[TargetType, BaseConverter], Hook]
+    _cache: Any
+    _epoch: int
+    _direct_deps: dict[TargetType, Dependencies]
+    _dependents: WeakSet[MultiStrategyDispatch]
+    _guards: dict[TargetType, _Guard]
+    _parent: ref[MultiStrategyDispatch] | None
+    _shared: set[TargetType]
+    _sharers: WeakSet[MultiStrategyDispatch]
+    dispatch: Callable[[TargetType], Hook]
+    frozen: bool
+    _stats: DispatchStats | None
+    _stopped_stats: DispatchStats | None
 
     def __init__(
-        self, fallback_factory: HookFactory[Hook], converter: BaseConverter
+        self,
+        fallback_factory: HookFactory[Hook],
+        converter: BaseConverter,
+        cache: DispatchCacheMode = "strong",
+        cache_maxsize: int | None = None,
     ) -> None:
         self._fallback_factory = fallback_factory
         self._direct_dispatch = {}
         self._function_dispatch = FunctionDispatch(converter)
         self._single_dispatch = singledispatch(_DispatchNotFound)
-        self.dispatch = lru_cache(maxsize=None)(self.dispatch_without_caching)
+        self._epoch = 0
+        self._direct_deps = {}
+        self._dependents = WeakSet()
+        self._guards = {}
+        self._parent = None
+        self._shared = set()
+        self._sharers = WeakSet()
+        self.frozen = False
+        self._stats = self._stopped_stats = None
+        if cache == "weak":
+            self._cache = _WeakDispatchCache(self._resolve_cached, cache_maxsize)
+        elif cache == "strong":
+            if cache_maxsize is None:
+                self._cache = _StrongDispatchCache(self._resolve_cached)
+            else:
+                self._cache = _LRUDispatchCache(self._resolve_cached, cache_maxsize)
+        else:
+            raise ValueError(f"Unknown dispatch cache mode: {cache!r}")
+        self._set_dispatch()
 
-    def dispatch_without_caching(self, typ: TargetType) -> Hook:
-        """Dispatch on the type but without caching the result."""
+    def _set_dispatch(self) -> None:
+        # Statistics are collected by swapping in a slower dispatch, so there's no
+        # overhead when they are disabled.
+        self.dispatch = (
+            self._cache.__getitem__ if self._stats is None else self._counting_dispatch
+        )
+
+    def _counting_dispatch(self, typ: TargetType) -> Hook:
+        if typ in self._cache:
+            self._stats.hits += 1
+        else:
+            self._stats.misses += 1
+        return self._cache[typ]
+
+    def _dispatch(self, typ: TargetType) -> Hook:
         try:
             dispatch = self._single_dispatch.dispatch(typ)
             if dispatch is not _DispatchNotFound:
@@ -128,20 +595,306 @@ class MultiStrategyDispatch(Generic[Hook]):
 
         direct_dispatch = self._direct_dispatch.get(typ)
         if direct_dispatch is not None:
+            direct_deps = self._direct_deps.get(typ)
+            if direct_deps:
+                # The hook is being resolved, so it's on top of the stack.
+                _generation_stack()[-1][2].update(direct_deps)
             return direct_dispatch
 
         res = self._function_dispatch.dispatch(typ)
         return res if res is not None else self._fallback_factory(typ)
 
-    def register_cls_list(self, cls_and_handler, direct: bool = False) -> None:
-        """Register a class to direct or singledispatch."""
-        for cls, handler in cls_and_handler:
-            if direct:
-                self._direct_dispatch[cls] = handler
+    def _resolve(self, typ: TargetType) -> tuple[Hook, Dependencies]:
+        """Dispatch on the type, recording the dependencies of the produced hook.
+
+        Dependencies are transitive, and also recorded as dependencies of the hook
+        being generated one level up, if any.
+        """
+        stack = _generation_stack()
+        deps: Dependencies = set()
+        stack.append((self, typ, deps))
+        stats = self._stats
+        if stats is not None:
+            start = perf_counter()
+        key = (ref(self), typ)
+        try:
+            res = self._dispatch(typ)
+        finally:
+            stack.pop()
+            if stack:
+                # Recorded even if dispatching fails, since the hook one level up
+                # may still be produced (using late binding, for recursive types).
+                stack[-1][2].add(key)
+        if stats is not None:
+            stats.resolutions += 1
+            with suppress(TypeError):  # Unhashable types.
+                stats.generation_times[typ] = (
+                    stats.generation_times.get(typ, 0.0) + perf_counter() - start
+                )
+        deps.discard(key)
+        with _registry_lock:
+            for dispatch_ref, _ in deps:
+                dispatch = dispatch_ref()
+                if dispatch is not None and dispatch is not self:
+                    dispatch._dependents.add(self)
+        if stack:
+            stack[-1][2].update(deps)
+        return res, deps
+
+    def _resolve_cached(self, typ: TargetType) -> Hook:
+        """Resolve the hook for a type missing from the cache, and cache it.
+
+        Only one thread generates the hook for any given type, while other threads
+        wait for it. Threads re-entering the generation of a type (for recursive
+        types), or generating mutually dependent hooks, do not wait, but rely on
+        the usual recursion detection instead.
+        """
+        epoch = self._epoch
+        if self._parent is not None and (parent := self._parent()) is not None:
+            res = parent.dispatch(typ)
+            deps = {(self._parent, typ)}
+            deps.update(parent._cache.get_deps(typ))
+            with _registry_lock:
+                if self._epoch == epoch:
+                    self._cache.store(typ, res, deps)
+                    self._shared.add(typ)
+            return res
+
+        thread = get_ident()
+        cached = False
+        with _guards_lock:
+            guard = self._guards.get(typ)
+            if guard is None:
+                # The hook may have been generated by another thread in the meantime.
+                cached = typ in self._cache
+                if not cached:
+                    guard = self._guards[typ] = _Guard(thread)
+            elif _would_deadlock(guard, thread):
+                guard = None
             else:
-                self._single_dispatch.register(cls, handler)
-                self.clear_direct()
-        self.dispatch.cache_clear()
+                _waiting_on[thread] = guard
+
+        if cached:
+            return self._cache[typ]
+        if guard is None:
+            res, deps = self._resolve(typ)
+            self._store(typ, res, deps, epoch)
+            return res
+        if guard.owner == thread:
+            try:
+                res, deps = guard.result = self._resolve(typ)
+                self._store(typ, res, deps, epoch)
+            finally:
+                with _guards_lock:
+                    self._guards.pop(typ, None)
+                guard.done.set()
+            return res
+
+        try:
+            guard.done.wait()
+        finally:
+            with _guards_lock:
+                del _waiting_on[thread]
+        if guard.result is None:
+            # The generation failed in the other thread, so it'll probably fail here
+            # too, but with the proper exception.
+            return self._resolve_cached(typ)
+        return guard.result[0]
+
+    def _store(
+        self, typ: TargetType, hook: Hook, deps: Dependencies, epoch: int
+    ) -> None:
+        """Cache a resolved hook, unless hooks were invalidated since resolution
+        started (by a registration in another thread), since it may be stale."""
+        with _registry_lock:
+            if self._epoch == epoch:
+                self._cache.store(typ, hook, deps)
+
+    def dispatch_without_caching(self, typ: TargetType) -> Hook:
+        """Dispatch on the type but without caching the result."""
+        return self._resolve(typ)[0]
+
+    def get_hook(self, typ: TargetType, cache_result: bool = True) -> Hook:
+        """Dispatch on the type, recording the result as a dependency of the hook
+        currently being generated, if any.
+
+        .. versionadded:: NEXT
+        """
+        if not cache_result:
+            res = self._resolve(typ)[0]
+        else:
+            res = self.dispatch(typ)
+            stack = getattr(_generating, "stack", None)
+            if stack:
+                parent = stack[-1][2]
+                parent.add((ref(self), typ))
+                parent.update(self._cache.get_deps(typ))
+        # Used for exporting hooks, see `cattrs.gen.export`.
+        observer = getattr(_generating, "observer", None)
+        if observer is not None:
+            observer.hook_fetched(self, typ, res)
+        return res
+
+    def _iter_deps(self) -> list[tuple[TargetType, Dependencies]]:
+        res = list(self._cache.iter_deps())
+        res.extend(self._direct_deps.items())
+        return res
+
+    def _known_types(self) -> set[TargetType]:
+        """All types this dispatch has cached hooks for, or is known to have
+        produced hooks for."""
+        res = set(self._cache.keys())
+        res.update(self._direct_dispatch)
+        self_ref = ref(self)
+        for dispatch in (self, *self._dependents):
+            for _, deps in dispatch._iter_deps():
+                res.update(t for d, t in deps if d == self_ref)
+        return res
+
+    def invalidate(self, types: Iterable[TargetType]) -> None:
+        """Invalidate the cached hooks for the given types, and all cached hooks
+        depending on them.
+
+        .. versionadded:: NEXT
+        """
+        types = list(types)
+        if not types:
+            return
+        self._check_not_frozen()
+        with _registry_lock:
+            self._diverge()
+            self._invalidate(types)
+
+    def _invalidate(self, types: Iterable[TargetType]) -> None:
+        self_ref = ref(self)
+        keys = {(self_ref, t) for t in types}
+        for _, t in keys:
+            self._forget(t)
+        for dispatch in (self, *self._dependents):
+            for t, deps in dispatch._iter_deps():
+                if not keys.isdisjoint(deps):
+                    dispatch._forget(t)
+
+    def _check_not_frozen(self) -> None:
+        if self.frozen:
+            raise FrozenConverterError(
+                "Hooks cannot be registered on a frozen converter. Register all hooks "
+                "before freezing, or use a copy of the converter."
+            )
+
+    def _forget(self, typ: TargetType) -> None:
+        self._epoch += 1
+        self._cache.forget(typ)
+        self._direct_dispatch.pop(typ, None)
+        self._direct_deps.pop(typ, None)
+
+    def share_hooks_from(self, other: MultiStrategyDispatch) -> None:
+        """Share the hooks of another dispatch, which must be configured the same
+        way, instead of resolving them again.
+
+        Hooks are resolved by (and cached in) the other dispatch, and reused here.
+        As soon as either dispatch changes (because hooks are registered, or
+        hooks are invalidated), the shared hooks are dropped from this dispatch
+        and it goes back to resolving its own hooks.
+
+        .. versionadded:: NEXT
+        """
+        with _registry_lock:
+            self._fork()
+            self._parent = ref(other)
+            other._sharers.add(self)
+
+    def _fork(self) -> None:
+        """Stop sharing the hooks of the parent dispatch."""
+        if self._parent is None:
+            return
+        parent = self._parent()
+        self._parent = None
+        if parent is not None:
+            parent._sharers.discard(self)
+        # Dispatches sharing our hooks were really sharing our parent's hooks.
+        for sharer in list(self._sharers):
+            sharer._fork()
+        shared, self._shared = self._shared, set()
+        self._invalidate(shared)
+
+    def _diverge(self) -> None:
+        """Stop sharing hooks, in either direction, since this dispatch is about
+        to change."""
+        self._fork()
+        for sharer in list(self._sharers):
+            sharer._fork()
+
+    def register_cls_list(
+        self, cls_and_handler, direct: bool = False, deps: Dependencies | None = None
+    ) -> None:
+        """Register a class to direct or singledispatch.
+
+        :param deps: The dependencies of hooks registered to direct dispatch, if
+            known beforehand.
+        """
+        if direct:
+            stack = getattr(_generating, "stack", None)
+            with _registry_lock:
+                for cls, handler in cls_and_handler:
+                    if cls in self._cache:
+                        self._invalidate([cls])
+                    self._direct_dispatch[cls] = handler
+                    if deps is not None:
+                        self._direct_deps[cls] = deps
+                    elif stack and stack[-1][0] is self and stack[-1][1] == cls:
+                        # Registered while being generated, so we know the
+                        # dependencies.
+                        self._direct_deps[cls] = stack[-1][2]
+                for dispatch_ref, _ in deps or ():
+                    dispatch = dispatch_ref()
+                    if dispatch is not None and dispatch is not self:
+                        dispatch._dependents.add(self)
+            return
+
+        self._check_not_frozen()
+        cls_and_handler = list(cls_and_handler)
+        with _registry_lock:
+            self._diverge()
+            self._register_single(cls_and_handler)
+            self._invalidate(
+                t
+                for t in self._known_types()
+                if any(_single_dispatches_to(t, cls) for cls, _ in cls_and_handler)
+            )
+
+    def unregister_cls_list(self, classes: Iterable[type]) -> None:
+        """Remove the hooks registered to singledispatch for the given classes.
+
+        .. versionadded:: NEXT
+        """
+        self._check_not_frozen()
+        classes = set(classes)
+        with _registry_lock:
+            self._diverge()
+            self._register_single((), remove=classes)
+            self._invalidate(
+                t
+                for t in self._known_types()
+                if any(_single_dispatches_to(t, cls) for cls in classes)
+            )
+
+    def _register_single(
+        self,
+        cls_and_handler: Iterable[tuple[type, Hook]],
+        remove: Collection[type] = (),
+    ) -> None:
+        """Replace the singledispatch with one also holding the given hooks, and
+        without the hooks for the classes in `remove`.
+
+        The singledispatch is never mutated, since other threads (and other
+        dispatches, see `clone_into`) may be using it.
+        """
+        res = singledispatch(_DispatchNotFound)
+        for cls, handler in (*self._single_dispatch.registry.items(), *cls_and_handler):
+            if cls is not object and cls not in remove:
+                res.register(cls, handler)
+        self._single_dispatch = res
 
     def register_func_list(
         self,
@@ -159,35 +912,131 @@ class MultiStrategyDispatch(Generic[Hook]):
             handlers. If a handler is registered in `extended` mode, it's a
             factory that requires a converter.
         """
-        for tup in pred_and_handler:
-            if len(tup) == 2:
-                func, handler = tup
-                self._function_dispatch.register(func, handler)
-            else:
-                func, handler, is_gen = tup
-                if is_gen == "extended":
-                    self._function_dispatch.register(
-                        func, handler, is_generator=is_gen, takes_converter=True
-                    )
+        self._check_not_frozen()
+        with _registry_lock:
+            self._diverge()
+            for tup in pred_and_handler:
+                if len(tup) == 2:
+                    func, handler = tup
+                    self._function_dispatch.register(func, handler)
                 else:
-                    self._function_dispatch.register(func, handler, is_generator=is_gen)
-        self.clear_direct()
-        self.dispatch.cache_clear()
+                    func, handler, is_gen = tup
+                    if is_gen == "extended":
+                        self._function_dispatch.register(
+                            func, handler, is_generator=is_gen, takes_converter=True
+                        )
+                    else:
+                        self._function_dispatch.register(
+                            func, handler, is_generator=is_gen
+                        )
+            self._invalidate(
+                t
+                for t in self._known_types()
+                if any(_matches(tup[0], t) for tup in pred_and_handler)
+            )
 
     def clear_direct(self) -> None:
         """Clear the direct dispatch."""
-        self._direct_dispatch.clear()
+        with _registry_lock:
+            self._epoch += 1
+            self._direct_dispatch.clear()
+            self._direct_deps.clear()
 
     def clear_cache(self) -> None:
         """Clear all caches."""
-        self._direct_dispatch.clear()
-        self.dispatch.cache_clear()
+        with _registry_lock:
+            self.clear_direct()
+            self._cache.cache_clear()
+            self._shared.clear()
+
+    def freeze(self) -> None:
+        """Freeze the dispatch.
+
+        The dispatch cache is converted into a plain dictionary, if it isn't one
+        already, making dispatch a single dictionary lookup. Types not yet seen are
+        still resolved on first use, and then cached.
+
+        Registering hooks on a frozen dispatch raises a `FrozenConverterError`.
+
+        .. versionadded:: NEXT
+        """
+        if not isinstance(self._cache, _StrongDispatchCache):
+            cache = _StrongDispatchCache(self._resolve_cached)
+            for typ in self._cache:
+                cache.store(typ, self._cache[typ], self._cache.get_deps(typ))
+            self._cache.cache_clear()
+            self._cache = cache
+            self._set_dispatch()
+        self.frozen = True
+
+    def enable_stats(self) -> None:
+        """Start collecting statistics, discarding any collected so far.
+
+        .. versionadded:: NEXT
+        """
+        self._stats = self._function_dispatch._stats = DispatchStats()
+        self._stopped_stats = None
+        self._set_dispatch()
+
+    def disable_stats(self) -> None:
+        """Stop collecting statistics, keeping the ones collected so far.
+
+        .. versionadded:: NEXT
+        """
+        if self._stats is not None:
+            self._stopped_stats = self._stats
+        self._stats = self._function_dispatch._stats = None
+        self._set_dispatch()
+
+    def stats(self) -> DispatchStats:
+        """Return a snapshot of the collected statistics.
+
+        If statistics were never collected, only the cache size is reported.
+
+        .. versionadded:: NEXT
+        """
+        stats = self._stats or self._stopped_stats or DispatchStats()
+        return evolve(
+            stats,
+            generation_times=dict(stats.generation_times),
+            cache_size=len(list(self._cache.keys())),
+        )
 
     def get_num_fns(self) -> int:
         return self._function_dispatch.get_num_fns()
 
     def copy_to(self, other: MultiStrategyDispatch, skip: int = 0) -> None:
         self._function_dispatch.copy_to(other._function_dispatch, skip=skip)
-        for cls, fn in self._single_dispatch.registry.items():
-            other._single_dispatch.register(cls, fn)
+        other._register_single(self._single_dispatch.registry.items())
         other.clear_cache()
+
+    def clone_into(
+        self, other: MultiStrategyDispatch, rebind: Callable[[Any], Any]
+    ) -> None:
+        """Copy all registrations into a fresh dispatch, passing every hook, factory
+        and predicate through `rebind` first, and share our hooks with it.
+
+        Unlike `copy_to`, this does not require the other dispatch to be set up
+        by registering hooks first.
+
+        .. versionadded:: NEXT
+        """
+        other._fallback_factory = rebind(self._fallback_factory)
+        other._function_dispatch._handler_pairs = [
+            (rebind(pred), rebind(handler), is_gen, takes_converter)
+            for pred, handler, is_gen, takes_converter in (
+                self._function_dispatch._handler_pairs
+            )
+        ]
+        other._function_dispatch._index = {}
+        registry = [
+            (cls, fn, rebind(fn))
+            for cls, fn in self._single_dispatch.registry.items()
+            if cls is not object
+        ]
+        if all(fn is rebound for _, fn, rebound in registry):
+            # Registrations replace the singledispatch, so it can be shared.
+            other._single_dispatch = self._single_dispatch
+        else:
+            other._register_single((cls, rebound) for cls, _, rebound in registry)
+        other.share_hooks_from(self)
@@ -10,6 +10,14 @@ class CattrsError(Exception):
     """Base ``cattrs`` exception."""
 
 
+class FrozenConverterError(CattrsError):
+    """
+    Error raised when registering hooks on a frozen converter.
+
+    .. versionadded:: NEXT
+    """
+
+
 class StructureHandlerNotFoundError(CattrsError):
     """
     Error raised when structuring cannot find a handler for converting inputs into
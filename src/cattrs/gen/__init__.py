@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-import re
-from collections.abc import Callable, Iterable, Mapping
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import is_dataclass
+from inspect import getattr_static
+from types import MemberDescriptorType, NoneType
 from typing import TYPE_CHECKING, Any, Final, Literal, TypeVar
 
-from attrs import NOTHING, Attribute, Converter, Factory, evolve
+from attrs import NOTHING, Attribute, ClassProps, Converter, Factory, evolve, has
 from typing_extensions import NoDefault
 
 from .._compat import (
@@ -30,10 +32,24 @@ from ..errors import (
 )
 from ..fns import identity
 from ..types import SimpleStructureHook
-from ._consts import AttributeOverride, already_generating, neutral
+from ._compile import compile_and_exec, set_code_cache
+from ._consts import AttributeOverride, already_generating, neutral, pure_factories
 from ._generics import generate_mapping
-from ._lc import generate_unique_filename
-from ._shared import _annotated_override_or_default, find_structure_handler
+from ._lc import LinecacheMode, set_linecache_limit, source_filename
+from ._shared import (
+    InlineHook,
+    Inlining,
+    LateUnstructureHook,
+    _annotated_override_or_default,
+    bind_late_hooks,
+    bind_structure_hook,
+    can_iterate,
+    find_structure_handler,
+    inline_class,
+    inline_copy,
+    inline_iterable,
+    validation_variant,
+)
 
 if TYPE_CHECKING:
     from ..converters import BaseConverter
@@ -48,6 +64,10 @@ __all__ = [
     "make_iterable_unstructure_fn",
     "make_mapping_structure_fn",
     "make_mapping_unstructure_fn",
+    "make_tuple_structure_fn",
+    "make_tuple_unstructure_fn",
+    "set_code_cache",
+    "set_linecache_limit",
 ]
 
 
@@ -74,9 +94,12 @@ def make_dict_unstructure_fn_from_attrs(
     converter: BaseConverter,
     typevar_map: dict[str, Any] = {},
     _cattrs_omit_if_default: bool = False,
-    _cattrs_use_linecache: bool = True,
+    _cattrs_use_linecache: LinecacheMode | Literal["from_converter"] = (
+        "from_converter"
+    ),
     _cattrs_use_alias: bool | Literal["from_converter"] = "from_converter",
     _cattrs_include_init_false: bool = False,
+    _cattrs_inline_depth: int | Literal["from_converter"] = "from_converter",
     **kwargs: AttributeOverride,
 ) -> Callable[[T], dict[str, Any]]:
     """
@@ -91,10 +114,15 @@ def make_dict_unstructure_fn_from_attrs(
         module name and qualname.
     :param _cattrs_omit_if_default: if true, attributes equal to their default values
         will be omitted in the result dictionary.
+    :param _cattrs_use_linecache: Whether to store the source code in the Python
+        linecache, or register it lazily (`lazy`), when formatting tracebacks.
+        Takes its value from the given converter by default.
     :param _cattrs_use_alias: If true, the attribute alias will be used as the
         dictionary key by default.
     :param _cattrs_include_init_false: If true, _attrs_ fields marked as `init=False`
         will be included.
+    :param _cattrs_inline_depth: How many levels of nested class hooks generated by
+        cattrs are inlined into this function, instead of being called.
 
     .. versionadded:: 24.1.0
     .. versionchanged:: 25.2.0
@@ -107,6 +135,9 @@ def make_dict_unstructure_fn_from_attrs(
         When `_cattrs_omit_if_default` is true and the attribute has an attrs converter
         specified, the converter is applied to the default value before checking if it
         is equal to the attribute's value.
+    .. versionchanged:: NEXT
+        `_cattrs_use_linecache` can be `lazy`, and takes its value from the given
+        converter by default.
     """
 
     fn_name = "unstructure_" + cl.__name__
@@ -114,10 +145,17 @@ def make_dict_unstructure_fn_from_attrs(
     lines = []
     invocation_lines = []
     internal_arg_parts = {}
+    # The fields, as (key, attribute name, hook) triples, for inlining this
+    # function into others.
+    inline_fields = []
 
     if _cattrs_use_alias == "from_converter":
         # BaseConverter doesn't have it so we're careful.
         _cattrs_use_alias = getattr(converter, "use_alias", False)
+    if _cattrs_inline_depth == "from_converter":
+        # BaseConverter doesn't have it so we're careful.
+        _cattrs_inline_depth = getattr(converter, "inline_depth", 0)
+    inlining = Inlining(internal_arg_parts, _cattrs_inline_depth)
 
     for a in attrs:
         attr_name = a.name
@@ -143,46 +181,19 @@ def make_dict_unstructure_fn_from_attrs(
         # For each attribute, we try resolving the type here and now.
         # If a type is manually overwritten, this function should be
         # regenerated.
-        handler = None
-        if override.unstruct_hook is not None:
-            handler = override.unstruct_hook
-        else:
-            if a.type is not None:
-                t = a.type
-                if isinstance(t, TypeVar):
-                    if t.__name__ in typevar_map:
-                        t = typevar_map[t.__name__]
-                    else:
-                        handler = converter.unstructure
-                elif is_generic(t) and not is_bare(t) and not is_annotated(t):
-                    t = deep_copy_with(t, typevar_map, cl)
-
-                if handler is None:
-                    if (
-                        is_bare_final(t)
-                        and a.default is not NOTHING
-                        and not isinstance(a.default, Factory)
-                    ):
-                        # This is a special case where we can use the
-                        # type of the default to dispatch on.
-                        t = a.default.__class__
-                    try:
-                        handler = converter.get_unstructure_hook(t, cache_result=False)
-                    except RecursionError:
-                        # There's a circular reference somewhere down the line
-                        handler = converter.unstructure
-            else:
-                handler = converter.unstructure
+        handler = _find_unstructure_handler(a, override, cl, converter, typevar_map)
 
         is_identity = handler == identity
 
-        if not is_identity:
+        if is_identity:
+            invoke = f"instance.{attr_name}"
+        elif (inlined := inlining.inline(handler, f"instance.{attr_name}")) is not None:
+            invoke = inlined
+        else:
             unstruct_handler_name = f"__c_unstr_{attr_name}"
             globs[unstruct_handler_name] = handler
             internal_arg_parts[unstruct_handler_name] = handler
             invoke = f"{unstruct_handler_name}(instance.{attr_name})"
-        else:
-            invoke = f"instance.{attr_name}"
 
         if d is not NOTHING and (
             (_cattrs_omit_if_default and override.omit_if_default is not False)
@@ -190,6 +201,13 @@ def make_dict_unstructure_fn_from_attrs(
         ):
             def_name = f"__c_def_{attr_name}"
 
+            if (
+                isinstance(d, Factory)
+                and not d.takes_self
+                and d.factory in pure_factories
+            ):
+                # The default is only compared against, so a single one does.
+                d = d.factory()
             if isinstance(d, Factory):
                 globs[def_name] = d.factory
                 internal_arg_parts[def_name] = d.factory
@@ -214,15 +232,20 @@ def make_dict_unstructure_fn_from_attrs(
                     internal_arg_parts[conv_name] = c
                     def_str = f"{conv_name}({def_str})"
                 else:
-                    globs[def_name] = c(d)
-                    internal_arg_parts[def_name] = c(d)
+                    d = c(d)
+                    globs[def_name] = d
+                    internal_arg_parts[def_name] = d
 
-            lines.append(f"  if instance.{attr_name} != {def_str}:")
+            if d is None and def_str == def_name:
+                lines.append(f"  if instance.{attr_name} is not None:")
+            else:
+                lines.append(f"  if instance.{attr_name} != {def_str}:")
             lines.append(f"    res['{kn}'] = {invoke}")
 
         else:
             # No default or no override.
             invocation_lines.append(f"'{kn}': {invoke},")
+            inline_fields.append((kn, attr_name, None if is_identity else handler))
 
     internal_arg_line = ", ".join([f"{i}={i}" for i in internal_arg_parts])
     if internal_arg_line:
@@ -239,25 +262,90 @@ def make_dict_unstructure_fn_from_attrs(
         + ["  return res"]
     )
     script = "\n".join(total_lines)
-    fname = generate_unique_filename(
-        cl, "unstructure", lines=total_lines if _cattrs_use_linecache else []
+    if _cattrs_use_linecache == "from_converter":
+        # BaseConverter doesn't have it so we're careful.
+        _cattrs_use_linecache = getattr(converter, "use_linecache", True)
+    fname = source_filename(
+        cl, "unstructure", total_lines, _cattrs_use_linecache, globs
     )
 
-    eval(compile(script, fname, "exec"), globs)
+    compile_and_exec(script, fname, globs, cl)
 
     res = globs[fn_name]
     res.overrides = kwargs
+    if not lines:
+        res._cattrs_inline = _inline_dict_unstructure(inline_fields)
 
     return res
 
 
+def _find_unstructure_handler(
+    a: Attribute,
+    override: AttributeOverride,
+    cl: type,
+    converter: BaseConverter,
+    typevar_map: dict[str, Any],
+) -> UnstructureHook:
+    """Find the unstructure hook to use for an attribute."""
+    if override.unstruct_hook is not None:
+        return override.unstruct_hook
+    if a.type is None:
+        return converter.unstructure
+    t = a.type
+    if isinstance(t, TypeVar):
+        if t.__name__ not in typevar_map:
+            return converter.unstructure
+        t = typevar_map[t.__name__]
+    elif is_generic(t) and not is_bare(t) and not is_annotated(t):
+        t = deep_copy_with(t, typevar_map, cl)
+
+    if (
+        is_bare_final(t)
+        and a.default is not NOTHING
+        and not isinstance(a.default, Factory)
+    ):
+        # This is a special case where we can use the
+        # type of the default to dispatch on.
+        t = a.default.__class__
+    try:
+        return converter.get_unstructure_hook(t, cache_result=False)
+    except RecursionError:
+        # There's a circular reference somewhere down the line
+        return LateUnstructureHook(converter, t)
+
+
+def _inline_dict_unstructure(fields: list[tuple[str, str, Any]]) -> InlineHook:
+    """Inline a dict unstructuring function without conditional fields."""
+
+    @inline_class
+    def inline(instance: str, inlining: Inlining) -> str:
+        items = []
+        for kn, attr_name, handler in fields:
+            if not items and len(fields) > 1:
+                # The instance is only evaluated once.
+                local = inlining.new_local()
+                invoke = f"({local} := {instance}).{attr_name}"
+                instance = local
+            else:
+                invoke = f"{instance}.{attr_name}"
+            if handler is not None:
+                invoke = inlining.call(handler, invoke)
+            items.append(f"'{kn}': {invoke}")
+        return f"{{{', '.join(items)}}}"
+
+    return inline
+
+
 def make_dict_unstructure_fn(
     cl: type[T],
     converter: BaseConverter,
     _cattrs_omit_if_default: bool = False,
-    _cattrs_use_linecache: bool = True,
+    _cattrs_use_linecache: LinecacheMode | Literal["from_converter"] = (
+        "from_converter"
+    ),
     _cattrs_use_alias: bool | Literal["from_converter"] = "from_converter",
     _cattrs_include_init_false: bool = False,
+    _cattrs_inline_depth: int | Literal["from_converter"] = "from_converter",
     **kwargs: AttributeOverride,
 ) -> Callable[[T], dict[str, Any]]:
     """
@@ -269,10 +357,16 @@ def make_dict_unstructure_fn(
 
     :param _cattrs_omit_if_default: if true, attributes equal to their default values
         will be omitted in the result dictionary.
+    :param _cattrs_use_linecache: Whether to store the source code in the Python
+        linecache, or register it lazily (`lazy`), when formatting tracebacks.
+        Takes its value from the given converter by default.
     :param _cattrs_use_alias: If true, the attribute alias will be used as the
         dictionary key by default.
     :param _cattrs_include_init_false: If true, _attrs_ fields marked as `init=False`
         will be included.
+    :param _cattrs_inline_depth: How many levels of nested class hooks generated by
+        cattrs are inlined into this function, instead of being called. Takes its
+        value from the given converter by default.
 
     .. versionadded:: 23.2.0 *_cattrs_use_alias*
     .. versionadded:: 23.2.0 *_cattrs_include_init_false*
@@ -282,6 +376,10 @@ def make_dict_unstructure_fn(
     .. versionchanged:: 26.1.0
         `typing.Annotated[T, override()]` is now recognized and can be used to customize
         unstructuring.
+    .. versionadded:: NEXT *_cattrs_inline_depth*
+    .. versionchanged:: NEXT
+        `_cattrs_use_linecache` can be `lazy`, and takes its value from the given
+        converter by default.
     """
     origin = get_origin(cl)
     attrs = adapted_fields(origin or cl)  # type: ignore
@@ -318,6 +416,7 @@ def make_dict_unstructure_fn(
             _cattrs_use_linecache=_cattrs_use_linecache,
             _cattrs_use_alias=_cattrs_use_alias,
             _cattrs_include_init_false=_cattrs_include_init_false,
+            _cattrs_inline_depth=_cattrs_inline_depth,
             **kwargs,
         )
     finally:
@@ -332,13 +431,19 @@ def make_dict_structure_fn_from_attrs(
     converter: BaseConverter,
     typevar_map: dict[str, Any] = {},
     _cattrs_forbid_extra_keys: bool | Literal["from_converter"] = "from_converter",
-    _cattrs_use_linecache: bool = True,
+    _cattrs_use_linecache: LinecacheMode | Literal["from_converter"] = (
+        "from_converter"
+    ),
     _cattrs_prefer_attrib_converters: (
         bool | Literal["from_converter"]
     ) = "from_converter",
-    _cattrs_detailed_validation: bool | Literal["from_converter"] = "from_converter",
+    _cattrs_detailed_validation: (
+        bool | Literal["optimistic", "from_converter"]
+    ) = "from_converter",
     _cattrs_use_alias: bool | Literal["from_converter"] = "from_converter",
     _cattrs_include_init_false: bool = False,
+    _cattrs_inline_depth: int | Literal["from_converter"] = "from_converter",
+    _cattrs_bypass_init: bool | Literal["from_converter"] = "from_converter",
     **kwargs: AttributeOverride,
 ) -> SimpleStructureHook[Mapping[str, Any], T]:
     """
@@ -352,15 +457,23 @@ def make_dict_structure_fn_from_attrs(
     :param _cattrs_forbid_extra_keys: Whether the structuring function should raise a
         `ForbiddenExtraKeysError` if unknown keys are encountered.
     :param _cattrs_use_linecache: Whether to store the source code in the Python
-        linecache.
+        linecache, or register it lazily (`lazy`), when formatting tracebacks.
+        Takes its value from the given converter by default.
     :param _cattrs_prefer_attrib_converters: If an _attrs_ converter is present on a
         field, use it instead of processing the field normally.
     :param _cattrs_detailed_validation: Whether to use a slower mode that produces
-        more detailed errors.
+        more detailed errors. If `optimistic`, the faster mode is used, and the
+        slower mode only to produce the errors if it fails.
     :param _cattrs_use_alias: If true, the attribute alias will be used as the
         dictionary key by default.
     :param _cattrs_include_init_false: If true, _attrs_ fields marked as `init=False`
         will be included.
+    :param _cattrs_inline_depth: How many levels of nested class hooks generated by
+        cattrs are inlined into this function, instead of being called. Only used
+        without detailed validation.
+    :param _cattrs_bypass_init: Whether to create instances without calling
+        `__init__`, setting their fields directly. This skips validators, and
+        _attrs_ converters and `on_setattr` hooks.
 
     .. versionadded:: 24.1.0
     .. versionchanged:: 25.2.0
@@ -369,29 +482,25 @@ def make_dict_structure_fn_from_attrs(
     .. versionchanged:: 26.1.0
         `typing.Annotated[T, override()]` is now recognized and can be used to customize
         unstructuring.
+    .. versionadded:: NEXT *_cattrs_inline_depth* and *_cattrs_bypass_init*
+    .. versionchanged:: NEXT
+        `_cattrs_detailed_validation` can be `optimistic`, and `_cattrs_use_linecache`
+        `lazy`. `_cattrs_use_linecache` takes its value from the given converter by
+        default.
     """
 
     cl_name = cl.__name__
     fn_name = "structure_" + cl_name
 
-    # We have generic parameters and need to generate a unique name for the function
+    # The function is named after the class only, so parametrizations of generic
+    # classes share their code; see `compile_and_exec`.
     for p in getattr(cl, "__parameters__", ()):
-        # This is nasty, I am not sure how best to handle `typing.List[str]` or
-        # `TClass[int, int]` as a parameter type here
-        try:
-            name_base = typevar_map[p.__name__]
-        except KeyError:
-            pn = p.__name__
+        pn = p.__name__
+        if pn not in typevar_map:
             raise StructureHandlerNotFoundError(
                 f"Missing type for generic argument {pn}, specify it when structuring.",
                 p,
-            ) from None
-        name = getattr(name_base, "__name__", None) or str(name_base)
-        # `<>` can be present in lambdas
-        # `|` can be present in unions
-        name = re.sub(r"[\[\.\] ,<>]", "_", name)
-        name = re.sub(r"\|", "u", name)
-        fn_name += f"_{name}"
+            )
 
     internal_arg_parts = {"__cl": cl}
     globs = {}
@@ -409,8 +518,47 @@ def make_dict_structure_fn_from_attrs(
         _cattrs_use_alias = getattr(converter, "use_alias", False)
     if _cattrs_detailed_validation == "from_converter":
         _cattrs_detailed_validation = converter.detailed_validation
+    variants = {}
+    if _cattrs_detailed_validation == "optimistic":
+        # The function generated is the fast one, falling back to the detailed one.
+        # Hooks calling this one call either variant directly instead.
+        for attr, detailed in (("_cattrs_fast", False), ("_cattrs_detailed", True)):
+            variants[attr] = make_dict_structure_fn_from_attrs(
+                attrs,
+                cl,
+                converter,
+                typevar_map,
+                _cattrs_forbid_extra_keys=_cattrs_forbid_extra_keys,
+                _cattrs_use_linecache=_cattrs_use_linecache,
+                _cattrs_prefer_attrib_converters=_cattrs_prefer_attrib_converters,
+                _cattrs_detailed_validation=detailed,
+                _cattrs_use_alias=_cattrs_use_alias,
+                _cattrs_include_init_false=_cattrs_include_init_false,
+                _cattrs_inline_depth=_cattrs_inline_depth,
+                _cattrs_bypass_init=_cattrs_bypass_init,
+                **kwargs,
+            )
+        internal_arg_parts["__c_detailed"] = variants["_cattrs_detailed"]
+        _cattrs_detailed_validation = False
     if _cattrs_prefer_attrib_converters == "from_converter":
         _cattrs_prefer_attrib_converters = converter._prefer_attrib_converters
+    if _cattrs_inline_depth == "from_converter":
+        # BaseConverter doesn't have it so we're careful.
+        _cattrs_inline_depth = getattr(converter, "inline_depth", 0)
+    inlining = Inlining(internal_arg_parts, _cattrs_inline_depth)
+    if _cattrs_bypass_init == "from_converter":
+        # BaseConverter doesn't have it so we're careful.
+        _cattrs_bypass_init = getattr(converter, "bypass_init", False)
+    _cattrs_bypass_init = _cattrs_bypass_init and _can_bypass_init(
+        cl, attrs, _cattrs_prefer_attrib_converters
+    )
+    # When bypassing `__init__`, the expressions for the values of the fields
+    # passed to it, or `None` for optional fields structured into `res`.
+    init_values: dict[str, str | None] = {}
+    # The fields, as (key, keyword, hook, type) tuples, for inlining this function
+    # into others. The type is `None` for hooks taking a single argument.
+    # Only functions structuring required arguments are inlined.
+    inline_fields = []
 
     if _cattrs_forbid_extra_keys:
         globs["__c_a"] = allowed_fields
@@ -449,7 +597,11 @@ def make_dict_structure_fn_from_attrs(
                 handler = override.struct_hook
             else:
                 handler = find_structure_handler(
-                    a, t, converter, _cattrs_prefer_attrib_converters
+                    a,
+                    t,
+                    converter,
+                    _cattrs_prefer_attrib_converters,
+                    _cattrs_detailed_validation,
                 )
 
             struct_handler_name = f"__c_structure_{an}"
@@ -476,8 +628,9 @@ def make_dict_structure_fn_from_attrs(
                 type_name = f"__c_type_{an}"
                 internal_arg_parts[type_name] = t
                 if handler is not None:
-                    if handler == converter._structure_call:
-                        internal_arg_parts[struct_handler_name] = t
+                    bound = bind_structure_hook(handler, t, converter)
+                    if bound is not None:
+                        internal_arg_parts[struct_handler_name] = bound
                         pi_lines.append(
                             f"{i}instance.{an} = {struct_handler_name}(o['{kn}'])"
                         )
@@ -498,6 +651,7 @@ def make_dict_structure_fn_from_attrs(
                 pi_lines.append(f"{i}errors.append(e)")
 
             else:
+                init_values[an] = f"res['{ian}']" if a.default is NOTHING else None
                 if a.default is not NOTHING:
                     lines.append(f"{i}if '{kn}' in o:")
                     i = f"{i}  "
@@ -506,8 +660,9 @@ def make_dict_structure_fn_from_attrs(
                 type_name = f"__c_type_{an}"
                 internal_arg_parts[type_name] = t
                 if handler:
-                    if handler == converter._structure_call:
-                        internal_arg_parts[struct_handler_name] = t
+                    bound = bind_structure_hook(handler, t, converter)
+                    if bound is not None:
+                        internal_arg_parts[struct_handler_name] = bound
                         lines.append(
                             f"{i}res['{ian}'] = {struct_handler_name}(o['{kn}'])"
                         )
@@ -527,9 +682,8 @@ def make_dict_structure_fn_from_attrs(
 
         if _cattrs_forbid_extra_keys:
             post_lines += [
-                "  unknown_fields = set(o.keys()) - __c_a",
-                "  if unknown_fields:",
-                "    errors.append(__c_feke('', __cl, unknown_fields))",
+                "  if not o.keys() <= __c_a:",
+                "    errors.append(__c_feke('', __cl, set(o.keys()) - __c_a))",
             ]
 
         post_lines.append(
@@ -558,6 +712,12 @@ def make_dict_structure_fn_from_attrs(
             pi_lines.append("  return instance")
     else:
         non_required = []
+        # Arguments are passed by position until one is left out, and by keyword
+        # after that.
+        positional = True
+        kwarg_lines = []
+        # Optional args with defaults taking `self` go through `res`.
+        res_lines = []
         # The first loop deals with required args.
         for a in attrs:
             an = a.name
@@ -570,6 +730,8 @@ def make_dict_structure_fn_from_attrs(
                     kwargs[an] = override
 
             if override.omit:
+                if a.init and not a.kw_only:
+                    positional = False
                 continue
             if override.omit is None and not a.init and not _cattrs_include_init_false:
                 continue
@@ -593,7 +755,11 @@ def make_dict_structure_fn_from_attrs(
                 handler = override.struct_hook
             else:
                 handler = find_structure_handler(
-                    a, t, converter, _cattrs_prefer_attrib_converters
+                    a,
+                    t,
+                    converter,
+                    _cattrs_prefer_attrib_converters,
+                    _cattrs_detailed_validation,
                 )
 
             if override.rename is None:
@@ -608,8 +774,9 @@ def make_dict_structure_fn_from_attrs(
                 if handler is not None:
                     struct_handler_name = f"__c_structure_{an}"
                     internal_arg_parts[struct_handler_name] = handler
-                    if handler == converter._structure_call:
-                        internal_arg_parts[struct_handler_name] = t
+                    bound = bind_structure_hook(handler, t, converter)
+                    if bound is not None:
+                        internal_arg_parts[struct_handler_name] = bound
                         pi_line = f"  instance.{an} = {struct_handler_name}(o['{kn}'])"
                     else:
                         tn = f"__c_type_{an}"
@@ -622,28 +789,41 @@ def make_dict_structure_fn_from_attrs(
 
                 pi_lines.append(pi_line)
             else:
+                bound = None
+                inlined = None
                 if handler:
+                    bound = bind_structure_hook(handler, t, converter)
+                if bound is not None:
+                    inlined = inlining.inline(bound, f"o['{kn}']")
+                if inlined is not None:
+                    value = inlined
+                elif handler:
                     struct_handler_name = f"__c_structure_{an}"
                     internal_arg_parts[struct_handler_name] = handler
-                    if handler == converter._structure_call:
-                        internal_arg_parts[struct_handler_name] = t
-                        invocation_line = f"{struct_handler_name}(o['{kn}']),"
+                    if bound is not None:
+                        internal_arg_parts[struct_handler_name] = bound
+                        value = f"{struct_handler_name}(o['{kn}'])"
                     else:
                         tn = f"__c_type_{an}"
                         internal_arg_parts[tn] = t
-                        invocation_line = f"{struct_handler_name}(o['{kn}'], {tn}),"
+                        value = f"{struct_handler_name}(o['{kn}'], {tn})"
                 else:
-                    invocation_line = f"o['{kn}'],"
+                    value = f"o['{kn}']"
+                init_values[an] = value
+                invocation_line = f"{value},"
+                inline_fields.append(
+                    (kn, a.alias if a.kw_only else None, bound, None)
+                    if bound is not None
+                    else (kn, a.alias if a.kw_only else None, handler or None, t)
+                )
 
-                if a.kw_only:
-                    invocation_line = f"{a.alias}={invocation_line}"
-                invocation_lines.append(invocation_line)
+                if a.kw_only or not positional:
+                    kwarg_lines.append(f"{a.alias}={invocation_line}")
+                else:
+                    invocation_lines.append(invocation_line)
 
         # The second loop is for optional args.
         if non_required:
-            invocation_lines.append("**res,")
-            lines.append("  res = {}")
-
             for a in non_required:
                 an = a.name
                 override = kwargs.get(an, neutral)
@@ -661,11 +841,14 @@ def make_dict_structure_fn_from_attrs(
                     handler = override.struct_hook
                 else:
                     handler = find_structure_handler(
-                        a, t, converter, _cattrs_prefer_attrib_converters
+                        a,
+                        t,
+                        converter,
+                        _cattrs_prefer_attrib_converters,
+                        _cattrs_detailed_validation,
                     )
 
                 struct_handler_name = f"__c_structure_{an}"
-                internal_arg_parts[struct_handler_name] = handler
 
                 if override.rename is None:
                     kn = an if not _cattrs_use_alias else a.alias
@@ -675,10 +858,12 @@ def make_dict_structure_fn_from_attrs(
                     kn = override.rename
                 allowed_fields.add(kn)
                 if not a.init:
+                    internal_arg_parts[struct_handler_name] = handler
                     pi_lines.append(f"  if '{kn}' in o:")
                     if handler:
-                        if handler == converter._structure_call:
-                            internal_arg_parts[struct_handler_name] = t
+                        bound = bind_structure_hook(handler, t, converter)
+                        if bound is not None:
+                            internal_arg_parts[struct_handler_name] = bound
                             pi_lines.append(
                                 f"    instance.{an} = {struct_handler_name}(o['{kn}'])"
                             )
@@ -691,21 +876,50 @@ def make_dict_structure_fn_from_attrs(
                     else:
                         pi_lines.append(f"    instance.{an} = o['{kn}']")
                 else:
-                    post_lines.append(f"  if '{kn}' in o:")
+                    bound = inlined = None
                     if handler:
-                        if handler == converter._structure_call:
-                            internal_arg_parts[struct_handler_name] = t
-                            post_lines.append(
-                                f"    res['{a.alias}'] = {struct_handler_name}(o['{kn}'])"
-                            )
+                        bound = bind_structure_hook(handler, t, converter)
+                    if bound is not None:
+                        inlined = inlining.inline(bound, f"o['{kn}']")
+                    if inlined is not None:
+                        value = inlined
+                    elif handler:
+                        internal_arg_parts[struct_handler_name] = handler
+                        if bound is not None:
+                            internal_arg_parts[struct_handler_name] = bound
+                            value = f"{struct_handler_name}(o['{kn}'])"
                         else:
                             tn = f"__c_type_{an}"
                             internal_arg_parts[tn] = t
-                            post_lines.append(
-                                f"    res['{a.alias}'] = {struct_handler_name}(o['{kn}'], {tn})"
-                            )
+                            value = f"{struct_handler_name}(o['{kn}'], {tn})"
                     else:
-                        post_lines.append(f"    res['{a.alias}'] = o['{kn}']")
+                        value = f"o['{kn}']"
+
+                    if isinstance(a.default, Factory) and a.default.takes_self:
+                        # The default needs the instance, so it's left to
+                        # `__init__`.
+                        if not res_lines:
+                            lines.append("  res = {}")
+                        init_values[an] = None
+                        res_lines.append(f"  if '{kn}' in o:")
+                        res_lines.append(f"    res['{a.alias}'] = {value}")
+                        if not a.kw_only:
+                            positional = False
+                        continue
+
+                    value = (
+                        f"{value} if '{kn}' in o else "
+                        f"{_default_expr(a, internal_arg_parts)}"
+                    )
+                    init_values[an] = value
+                    if a.kw_only or not positional:
+                        kwarg_lines.append(f"{a.alias}={value},")
+                    else:
+                        invocation_lines.append(f"{value},")
+        post_lines += res_lines
+        invocation_lines += kwarg_lines
+        if res_lines:
+            invocation_lines.append("**res,")
         if not pi_lines:
             instantiation_lines = (
                 ["  return __cl("]
@@ -722,47 +936,186 @@ def make_dict_structure_fn_from_attrs(
 
         if _cattrs_forbid_extra_keys:
             post_lines += [
-                "  unknown_fields = set(o.keys()) - __c_a",
-                "  if unknown_fields:",
-                "    raise __c_feke('', __cl, unknown_fields)",
+                "  if not o.keys() <= __c_a:",
+                "    raise __c_feke('', __cl, set(o.keys()) - __c_a)",
             ]
 
+    if _cattrs_bypass_init:
+        instantiation_lines = _bypass_init_lines(
+            cl, attrs, init_values, internal_arg_parts
+        )
+        if not pi_lines:
+            pi_lines.append("  return instance")
+
     # At the end, we create the function header.
     internal_arg_line = ", ".join([f"{i}={i}" for i in internal_arg_parts])
     globs.update(internal_arg_parts)
 
-    total_lines = [
-        f"def {fn_name}(o, _=__cl, {internal_arg_line}):",
-        *lines,
-        *post_lines,
-        *instantiation_lines,
-        *pi_lines,
-    ]
+    body = [*lines, *post_lines, *instantiation_lines, *pi_lines]
+    if "__c_detailed" in internal_arg_parts:
+        body = [
+            "  try:",
+            *[f"  {line}" for line in body],
+            "  except Exception:",
+            # Nested one-shot iterables may have been consumed, so the
+            # detailed pass is only trusted to raise.
+            "    __c_detailed(o, _)",
+            "    raise",
+        ]
+    total_lines = [f"def {fn_name}(o, _=__cl, {internal_arg_line}):", *body]
 
     script = "\n".join(total_lines)
-    fname = generate_unique_filename(
-        cl, "structure", lines=total_lines if _cattrs_use_linecache else []
-    )
+    if _cattrs_use_linecache == "from_converter":
+        # BaseConverter doesn't have it so we're careful.
+        _cattrs_use_linecache = getattr(converter, "use_linecache", True)
+    fname = source_filename(cl, "structure", total_lines, _cattrs_use_linecache, globs)
 
-    eval(compile(script, fname, "exec"), globs)
+    compile_and_exec(script, fname, globs, cl)
 
     res = globs[fn_name]
     res.overrides = kwargs
+    for attr, variant in variants.items():
+        setattr(res, attr, variant)
+    if (
+        not _cattrs_detailed_validation
+        and not _cattrs_forbid_extra_keys
+        and not non_required
+        and not pi_lines
+        and not _cattrs_bypass_init
+    ):
+        res._cattrs_inline = _inline_dict_structure(cl, inline_fields)
 
     return res
 
 
+def _can_bypass_init(
+    cl: type, attrs: list[Attribute], prefer_attrib_converters: bool
+) -> bool:
+    """Whether instances of the class can be created without calling `__init__`."""
+    if has(cl):
+        props = cl.__attrs_props__
+        if (
+            not props.added_init
+            or props.hashability is ClassProps.Hashability.HASHABLE_CACHED
+        ):
+            # A handwritten `__init__`, or one also resetting the hash cache.
+            return False
+    elif not is_dataclass(cl) or not cl.__dataclass_params__.init:
+        return False
+    return (
+        cl.__new__ is object.__new__
+        and not any(
+            hasattr(cl, m)
+            for m in ("__attrs_pre_init__", "__attrs_post_init__", "__post_init__")
+        )
+        and not (
+            prefer_attrib_converters and any(a.converter is not None for a in attrs)
+        )
+    )
+
+
+def _bypass_init_lines(
+    cl: type,
+    attrs: list[Attribute],
+    values: dict[str, str | None],
+    internal_arg_parts: dict[str, Any],
+) -> list[str]:
+    """The lines creating `instance` without calling `__init__`.
+
+    Fields are set in order, like `__init__` does, so factories taking `self` see
+    the fields before them.
+
+    :param values: The expressions for the values of the structured fields, or
+        `None` for optional fields structured into `res`.
+    """
+    internal_arg_parts["__c_new"] = object.__new__
+    lines = ["  instance = __c_new(__cl)"]
+    uses_dict = False
+    for a in attrs:
+        an = a.name
+        if an in values and values[an] is not None:
+            value = values[an]
+        elif a.default is NOTHING:
+            # Left unset, like `init=False` fields without defaults.
+            continue
+        else:
+            value = _default_expr(a, internal_arg_parts)
+            if an in values:
+                value = f"res['{a.alias}'] if '{a.alias}' in res else {value}"
+
+        descriptor = getattr_static(cl, an, None)
+        if isinstance(descriptor, MemberDescriptorType):
+            # A slot, set through its descriptor to skip `__setattr__`.
+            setter = f"__c_set_{an}"
+            internal_arg_parts[setter] = descriptor.__set__
+            lines.append(f"  {setter}(instance, {value})")
+        else:
+            if not uses_dict:
+                lines.append("  __c_d = instance.__dict__")
+                uses_dict = True
+            lines.append(f"  __c_d['{an}'] = {value}")
+    return lines
+
+
+def _default_expr(a: Attribute, internal_arg_parts: dict[str, Any]) -> str:
+    """An expression for the default of a field, for filling it in `instance`."""
+    default = a.default
+    if isinstance(default, Factory):
+        if not default.takes_self and default.factory in (list, dict):
+            return "[]" if default.factory is list else "{}"
+        name = f"__c_df_{a.name}"
+        internal_arg_parts[name] = default.factory
+        return f"{name}(instance)" if default.takes_self else f"{name}()"
+    if type(default) in (bool, int, str, NoneType):
+        return repr(default)
+    name = f"__c_df_{a.name}"
+    internal_arg_parts[name] = default
+    return name
+
+
+def _inline_dict_structure(
+    cl: type, fields: list[tuple[str | int, str | None, Any, Any]]
+) -> InlineHook:
+    """Inline a dict (or tuple, with indices as keys) structuring function with only
+    required arguments."""
+
+    @inline_class
+    def inline(o: str, inlining: Inlining) -> str:
+        args = []
+        for kn, kw, handler, t in fields:
+            if not args and len(fields) > 1:
+                # The mapping is only evaluated once.
+                local = inlining.new_local()
+                arg = f"({local} := {o})[{kn!r}]"
+                o = local
+            else:
+                arg = f"{o}[{kn!r}]"
+            if handler is not None:
+                bound = handler if t is None else None
+                arg = inlining.structure(handler, bound, t, arg)
+            args.append(arg if kw is None else f"{kw}={arg}")
+        return f"{inlining.add_global(cl)}({', '.join(args)})"
+
+    return inline
+
+
 def make_dict_structure_fn(
     cl: type[T],
     converter: BaseConverter,
     _cattrs_forbid_extra_keys: bool | Literal["from_converter"] = "from_converter",
-    _cattrs_use_linecache: bool = True,
+    _cattrs_use_linecache: LinecacheMode | Literal["from_converter"] = (
+        "from_converter"
+    ),
     _cattrs_prefer_attrib_converters: (
         bool | Literal["from_converter"]
     ) = "from_converter",
-    _cattrs_detailed_validation: bool | Literal["from_converter"] = "from_converter",
+    _cattrs_detailed_validation: (
+        bool | Literal["optimistic", "from_converter"]
+    ) = "from_converter",
     _cattrs_use_alias: bool | Literal["from_converter"] = "from_converter",
     _cattrs_include_init_false: bool = False,
+    _cattrs_inline_depth: int | Literal["from_converter"] = "from_converter",
+    _cattrs_bypass_init: bool | Literal["from_converter"] = "from_converter",
     **kwargs: AttributeOverride,
 ) -> SimpleStructureHook[Mapping[str, Any], T]:
     """
@@ -775,15 +1128,28 @@ def make_dict_structure_fn(
     :param _cattrs_forbid_extra_keys: Whether the structuring function should raise a
         `ForbiddenExtraKeysError` if unknown keys are encountered.
     :param _cattrs_use_linecache: Whether to store the source code in the Python
-        linecache.
+        linecache, or register it lazily (`lazy`), when formatting tracebacks.
+        Takes its value from the given converter by default.
     :param _cattrs_prefer_attrib_converters: If an _attrs_ converter is present on a
         field, use it instead of processing the field normally.
     :param _cattrs_detailed_validation: Whether to use a slower mode that produces
-        more detailed errors.
+        more detailed errors. If `optimistic`, the faster mode is used, and the
+        slower mode only to produce the errors if it fails.
     :param _cattrs_use_alias: If true, the attribute alias will be used as the
         dictionary key by default.
     :param _cattrs_include_init_false: If true, _attrs_ fields marked as `init=False`
         will be included.
+    :param _cattrs_inline_depth: How many levels of nested class hooks generated by
+        cattrs are inlined into this function, instead of being called. Only used
+        without detailed validation. Takes its value from the given converter by
+        default.
+    :param _cattrs_bypass_init: Whether to create instances without calling
+        `__init__`, setting their fields directly. This skips validators, and
+        _attrs_ converters and `on_setattr` hooks, so should only be used for
+        trusted data. Classes with `__attrs_pre_init__`, `__attrs_post_init__` or
+        `__post_init__` methods, a custom `__init__` or `__new__`, or fields
+        structured by their _attrs_ converters are still instantiated normally.
+        Takes its value from the given converter by default.
 
     .. versionadded:: 23.2.0 *_cattrs_use_alias*
     .. versionadded:: 23.2.0 *_cattrs_include_init_false*
@@ -799,6 +1165,12 @@ def make_dict_structure_fn(
     .. versionchanged:: 26.1.0
         `typing.Annotated[T, override()]` is now recognized and can be used to customize
         unstructuring.
+    .. versionadded:: NEXT *_cattrs_inline_depth*
+    .. versionadded:: NEXT *_cattrs_bypass_init*
+    .. versionchanged:: NEXT
+        `_cattrs_detailed_validation` can be `optimistic`, and `_cattrs_use_linecache`
+        `lazy`. `_cattrs_use_linecache` takes its value from the given converter by
+        default.
     """
 
     mapping = {}
@@ -840,6 +1212,8 @@ def make_dict_structure_fn(
             _cattrs_detailed_validation=_cattrs_detailed_validation,
             _cattrs_use_alias=_cattrs_use_alias,
             _cattrs_include_init_false=_cattrs_include_init_false,
+            _cattrs_inline_depth=_cattrs_inline_depth,
+            _cattrs_bypass_init=_cattrs_bypass_init,
             **kwargs,
         )
     finally:
@@ -848,6 +1222,446 @@ def make_dict_structure_fn(
             del already_generating.working_set
 
 
+def make_tuple_unstructure_fn(
+    cl: type[T],
+    converter: BaseConverter,
+    _cattrs_use_linecache: LinecacheMode | Literal["from_converter"] = (
+        "from_converter"
+    ),
+    _cattrs_inline_depth: int | Literal["from_converter"] = "from_converter",
+    **kwargs: AttributeOverride,
+) -> Callable[[T], tuple[Any, ...]]:
+    """
+    Generate a specialized tuple unstructuring function for an attrs class or a
+    dataclass.
+
+    The tuple contains the values of the fields in order, like
+    :meth:`BaseConverter.unstructure_attrs_astuple`. Fields are left out only when
+    overridden with `omit=True`; the other options of overrides, apart from
+    `unstruct_hook`, do not apply to positions.
+
+    Any provided overrides are attached to the generated function under the
+    `overrides` attribute.
+
+    :param _cattrs_use_linecache: Whether to store the source code in the Python
+        linecache, or register it lazily (`lazy`), when formatting tracebacks.
+        Takes its value from the given converter by default.
+    :param _cattrs_inline_depth: How many levels of nested class hooks generated by
+        cattrs are inlined into this function, instead of being called. Takes its
+        value from the given converter by default.
+
+    .. versionadded:: NEXT
+    """
+    origin = get_origin(cl)
+    attrs = adapted_fields(origin or cl)  # type: ignore
+
+    mapping = {}
+    if is_generic(cl):
+        mapping = generate_mapping(cl, mapping)
+
+        if origin is not None:
+            cl = origin
+
+    # We keep track of what we're generating to help with recursive
+    # class graphs.
+    try:
+        working_set = already_generating.working_set
+    except AttributeError:
+        working_set = set()
+        already_generating.working_set = working_set
+    if cl in working_set:
+        raise RecursionError()
+
+    working_set.add(cl)
+
+    try:
+        fn_name = "unstructure_" + cl.__name__
+        internal_arg_parts = {}
+        if _cattrs_inline_depth == "from_converter":
+            # BaseConverter doesn't have it so we're careful.
+            _cattrs_inline_depth = getattr(converter, "inline_depth", 0)
+        inlining = Inlining(internal_arg_parts, _cattrs_inline_depth)
+        items = []
+        # The fields, as (attribute name, hook) pairs, for inlining this function
+        # into others.
+        inline_fields = []
+
+        for a in attrs:
+            an = a.name
+            if an in kwargs:
+                override = kwargs[an]
+            else:
+                override = _annotated_override_or_default(a.type, neutral)
+                if override != neutral:
+                    kwargs[an] = override
+            if override.omit:
+                continue
+
+            handler = _find_unstructure_handler(a, override, cl, converter, mapping)
+            if handler == identity:
+                items.append(f"instance.{an},")
+                inline_fields.append((an, None))
+                continue
+            inline_fields.append((an, handler))
+            inlined = inlining.inline(handler, f"instance.{an}")
+            if inlined is None:
+                handler_name = f"__c_unstr_{an}"
+                internal_arg_parts[handler_name] = handler
+                inlined = f"{handler_name}(instance.{an})"
+            items.append(f"{inlined},")
+    finally:
+        working_set.remove(cl)
+        if not working_set:
+            del already_generating.working_set
+
+    internal_arg_line = "".join([f", {i}={i}" for i in internal_arg_parts])
+    total_lines = [
+        f"def {fn_name}(instance{internal_arg_line}):",
+        "  return (",
+        *[f"    {item}" for item in items],
+        "  )",
+    ]
+    globs = dict(internal_arg_parts)
+    if _cattrs_use_linecache == "from_converter":
+        # BaseConverter doesn't have it so we're careful.
+        _cattrs_use_linecache = getattr(converter, "use_linecache", True)
+    fname = source_filename(
+        cl, "unstructure_astuple", total_lines, _cattrs_use_linecache, globs
+    )
+
+    compile_and_exec("\n".join(total_lines), fname, globs, cl)
+
+    res = globs[fn_name]
+    res.overrides = kwargs
+    res._cattrs_inline = _inline_tuple_unstructure(inline_fields)
+
+    return res
+
+
+def _inline_tuple_unstructure(fields: list[tuple[str, Any]]) -> InlineHook:
+    """Inline a tuple unstructuring function."""
+
+    @inline_class
+    def inline(instance: str, inlining: Inlining) -> str:
+        items = []
+        for attr_name, handler in fields:
+            if not items and len(fields) > 1:
+                # The instance is only evaluated once.
+                local = inlining.new_local()
+                invoke = f"({local} := {instance}).{attr_name}"
+                instance = local
+            else:
+                invoke = f"{instance}.{attr_name}"
+            if handler is not None:
+                invoke = inlining.call(handler, invoke)
+            items.append(f"{invoke},")
+        return f"({' '.join(items)})"
+
+    return inline
+
+
+def make_tuple_structure_fn(
+    cl: type[T],
+    converter: BaseConverter,
+    _cattrs_use_linecache: LinecacheMode | Literal["from_converter"] = (
+        "from_converter"
+    ),
+    _cattrs_prefer_attrib_converters: (
+        bool | Literal["from_converter"]
+    ) = "from_converter",
+    _cattrs_detailed_validation: (
+        bool | Literal["optimistic", "from_converter"]
+    ) = "from_converter",
+    _cattrs_inline_depth: int | Literal["from_converter"] = "from_converter",
+    **kwargs: AttributeOverride,
+) -> SimpleStructureHook[Sequence[Any], T]:
+    """
+    Generate a specialized tuple structuring function for an attrs class or
+    dataclass.
+
+    The function structures sequences produced by the functions generated by
+    :func:`make_tuple_unstructure_fn`, with the same overrides. The values of fields
+    with `init=False` are skipped, and trailing values for fields with defaults
+    may be missing. Extra values are ignored.
+
+    Any provided overrides are attached to the generated function under the
+    `overrides` attribute.
+
+    :param _cattrs_use_linecache: Whether to store the source code in the Python
+        linecache, or register it lazily (`lazy`), when formatting tracebacks.
+        Takes its value from the given converter by default.
+    :param _cattrs_prefer_attrib_converters: If an _attrs_ converter is present on a
+        field, use it instead of processing the field normally.
+    :param _cattrs_detailed_validation: Whether to use a slower mode that produces
+        more detailed errors. If `optimistic`, the faster mode is used, and the
+        slower mode only to produce the errors if it fails.
+    :param _cattrs_inline_depth: How many levels of nested class hooks generated by
+        cattrs are inlined into this function, instead of being called. Only used
+        without detailed validation. Takes its value from the given converter by
+        default.
+
+    .. versionadded:: NEXT
+    """
+
+    mapping = {}
+    if is_generic(cl):
+        base = get_origin(cl)
+        mapping = generate_mapping(cl, mapping)
+        if base is not None:
+            cl = base
+
+    for base in getattr(cl, "__orig_bases__", ()):
+        if is_generic(base) and not str(base).startswith("typing.Generic"):
+            mapping = generate_mapping(base, mapping)
+            break
+
+    if _cattrs_detailed_validation == "from_converter":
+        _cattrs_detailed_validation = converter.detailed_validation
+    if _cattrs_prefer_attrib_converters == "from_converter":
+        _cattrs_prefer_attrib_converters = converter._prefer_attrib_converters
+    if _cattrs_use_linecache == "from_converter":
+        # BaseConverter doesn't have it so we're careful.
+        _cattrs_use_linecache = getattr(converter, "use_linecache", True)
+    if _cattrs_inline_depth == "from_converter":
+        # BaseConverter doesn't have it so we're careful.
+        _cattrs_inline_depth = getattr(converter, "inline_depth", 0)
+
+    # We keep track of what we're generating to help with recursive
+    # class graphs.
+    try:
+        working_set = already_generating.working_set
+    except AttributeError:
+        working_set = set()
+        already_generating.working_set = working_set
+    else:
+        if cl in working_set:
+            raise RecursionError()
+
+    working_set.add(cl)
+
+    try:
+        internal_arg_parts = {"__cl": cl}
+        variants = {}
+        if _cattrs_detailed_validation == "optimistic":
+            # The function generated is the fast one, falling back to the detailed
+            # one. Hooks calling this one call either variant directly instead.
+            for attr, detailed in (("_cattrs_fast", False), ("_cattrs_detailed", True)):
+                variants[attr] = _make_tuple_structure_fn(
+                    adapted_fields(cl),
+                    cl,
+                    converter,
+                    mapping,
+                    {"__cl": cl},
+                    _cattrs_use_linecache,
+                    _cattrs_prefer_attrib_converters,
+                    detailed,
+                    _cattrs_inline_depth,
+                    kwargs,
+                )
+            internal_arg_parts["__c_detailed"] = variants["_cattrs_detailed"]
+            _cattrs_detailed_validation = False
+        res = _make_tuple_structure_fn(
+            adapted_fields(cl),
+            cl,
+            converter,
+            mapping,
+            internal_arg_parts,
+            _cattrs_use_linecache,
+            _cattrs_prefer_attrib_converters,
+            _cattrs_detailed_validation,
+            _cattrs_inline_depth,
+            kwargs,
+        )
+        for attr, variant in variants.items():
+            setattr(res, attr, variant)
+        return res
+    finally:
+        working_set.remove(cl)
+        if not working_set:
+            del already_generating.working_set
+
+
+def _make_tuple_structure_fn(
+    attrs: list[Attribute],
+    cl: type,
+    converter: BaseConverter,
+    typevar_map: dict[str, Any],
+    internal_arg_parts: dict[str, Any],
+    use_linecache: LinecacheMode,
+    prefer_attrib_converters: bool,
+    detailed_validation: bool,
+    inline_depth: int,
+    kwargs: dict[str, AttributeOverride],
+) -> SimpleStructureHook[Sequence[Any], T]:
+    """Generate the function for `make_tuple_structure_fn`."""
+    fn_name = "structure_" + cl.__name__
+    internal_arg_parts["__cl"] = cl
+    inlining = Inlining(internal_arg_parts, inline_depth)
+    lines = []
+    args = []
+    # The fields, as (index, keyword, hook, type) tuples, for inlining this
+    # function into others. The type is `None` for hooks taking a single argument.
+    inline_fields = []
+
+    positions = []
+    for a in attrs:
+        an = a.name
+        if an in kwargs:
+            override = kwargs[an]
+        else:
+            override = _annotated_override_or_default(a.type, neutral)
+            if override != neutral:
+                kwargs[an] = override
+        if not override.omit:
+            positions.append((a, override))
+        elif a.init and not a.kw_only:
+            # Later arguments cannot be passed by position anymore.
+            positions.append((a, None))
+
+    # Values from this index on may be missing.
+    optional_from = 0
+    ix = 0
+    for a, override in positions:
+        if override is None:
+            continue
+        if a.init and a.default is NOTHING:
+            optional_from = ix + 1
+        ix += 1
+
+    # Whether some arguments are collected into `res`, instead of passed directly.
+    uses_res = False
+    if detailed_validation:
+        internal_arg_parts["__c_cve"] = ClassValidationError
+        internal_arg_parts["__c_avn"] = AttributeValidationNote
+        lines.append("  res = {}")
+        lines.append("  errors = []")
+        uses_res = True
+    if ix > optional_from:
+        lines.append("  n = len(o)")
+        if not detailed_validation:
+            lines.append("  res = {}")
+            uses_res = True
+
+    by_position = True
+    ix = -1
+    for a, override in positions:
+        if override is None:
+            by_position = False
+            continue
+        ix += 1
+        if not a.init:
+            continue
+        an = a.name
+        t = a.type
+        if isinstance(t, TypeVar):
+            t = typevar_map.get(t.__name__, t)
+        elif is_generic(t) and not is_bare(t) and not is_annotated(t):
+            t = deep_copy_with(t, typevar_map, cl)
+
+        # For each attribute, we try resolving the type here and now.
+        # If a type is manually overwritten, this function should be
+        # regenerated.
+        if override.struct_hook is not None:
+            # If the user has requested an override, just use that.
+            handler = override.struct_hook
+        else:
+            handler = find_structure_handler(
+                a, t, converter, prefer_attrib_converters, detailed_validation
+            )
+
+        bound = bind_structure_hook(handler, t, converter) if handler else None
+        if detailed_validation:
+            value = None
+        elif bound is not None:
+            value = inlining.inline(bound, f"o[{ix}]")
+        else:
+            value = None
+        if value is None:
+            if not handler:
+                value = f"o[{ix}]"
+            elif bound is not None:
+                internal_arg_parts[f"__c_structure_{an}"] = bound
+                value = f"__c_structure_{an}(o[{ix}])"
+            else:
+                internal_arg_parts[f"__c_structure_{an}"] = handler
+                internal_arg_parts[f"__c_type_{an}"] = t
+                value = f"__c_structure_{an}(o[{ix}], __c_type_{an})"
+
+        i = "  "
+        if ix >= optional_from:
+            lines.append(f"{i}if n > {ix}:")
+            i = f"{i}  "
+            by_position = False
+        elif not detailed_validation:
+            if a.kw_only or not by_position:
+                args.append(f"{a.alias}={value}")
+                by_position = False
+            else:
+                args.append(value)
+            inline_fields.append(
+                (ix, a.alias if not by_position else None, bound, None)
+                if bound is not None
+                else (ix, a.alias if not by_position else None, handler or None, t)
+            )
+            continue
+
+        if detailed_validation:
+            internal_arg_parts[f"__c_type_{an}"] = t
+            lines.extend(
+                [
+                    f"{i}try:",
+                    f"{i}  res['{a.alias}'] = {value}",
+                    f"{i}except Exception as e:",
+                    f"{i}  e.__notes__ = getattr(e, '__notes__', []) + [__c_avn('Structuring class {cl.__qualname__} @ attribute {an}', '{an}', __c_type_{an})]",
+                    f"{i}  errors.append(e)",
+                ]
+            )
+        else:
+            lines.append(f"{i}res['{a.alias}'] = {value}")
+
+    if detailed_validation:
+        lines.append(
+            f"  if errors: raise __c_cve('While structuring ' + {cl.__name__!r}, errors, __cl)"
+        )
+        body = [
+            *lines,
+            "  try:",
+            "    return __cl(**res)",
+            "  except Exception as exc:",
+            f"    raise __c_cve('While structuring ' + {cl.__name__!r}, [exc], __cl)",
+        ]
+    else:
+        if uses_res:
+            args.append("**res")
+        body = [*lines, f"  return __cl({', '.join(args)})"]
+    if "__c_detailed" in internal_arg_parts:
+        body = [
+            "  try:",
+            *[f"  {line}" for line in body],
+            "  except Exception:",
+            # Nested one-shot iterables may have been consumed, so the
+            # detailed pass is only trusted to raise.
+            "    __c_detailed(o, _)",
+            "    raise",
+        ]
+
+    internal_arg_line = ", ".join([f"{i}={i}" for i in internal_arg_parts])
+    total_lines = [f"def {fn_name}(o, _=__cl, {internal_arg_line}):", *body]
+    globs = dict(internal_arg_parts)
+    fname = source_filename(
+        cl, "structure_fromtuple", total_lines, use_linecache, globs
+    )
+
+    compile_and_exec("\n".join(total_lines), fname, globs, cl)
+
+    res = globs[fn_name]
+    res.overrides = kwargs
+    if not detailed_validation and not lines:
+        res._cattrs_inline = _inline_dict_structure(cl, inline_fields)
+
+    return res
+
+
 IterableUnstructureFn = Callable[[Iterable[Any]], Any]
 
 
@@ -860,7 +1674,7 @@ def make_hetero_tuple_structure_fn(
     cl: Any,
     converter: BaseConverter,
     detailed_validation: bool | Literal["from_converter"] = "from_converter",
-    use_linecache: bool = True,
+    use_linecache: LinecacheMode | Literal["from_converter"] = "from_converter",
 ) -> HeteroTupleStructureFn:
     """Generate a specialized structuring function for a heterogeneous tuple.
 
@@ -887,8 +1701,9 @@ def make_hetero_tuple_structure_fn(
             type_name = f"__c_type_{ix}"
             internal_arg_parts[struct_handler_name] = handler
             internal_arg_parts[type_name] = t
-            if handler == converter._structure_call:
-                internal_arg_parts[struct_handler_name] = t
+            bound = bind_structure_hook(handler, t, converter)
+            if bound is not None:
+                internal_arg_parts[struct_handler_name] = bound
                 invocation = f"{struct_handler_name}(o[{ix}])"
             else:
                 invocation = f"{struct_handler_name}(o[{ix}], {type_name})"
@@ -928,8 +1743,9 @@ def make_hetero_tuple_structure_fn(
             type_name = f"__c_type_{ix}"
             internal_arg_parts[struct_handler_name] = handler
             internal_arg_parts[type_name] = t
-            if handler == converter._structure_call:
-                internal_arg_parts[struct_handler_name] = t
+            bound = bind_structure_hook(handler, t, converter)
+            if bound is not None:
+                internal_arg_parts[struct_handler_name] = bound
                 invocation = f"{struct_handler_name}(o[{ix}])"
             else:
                 invocation = f"{struct_handler_name}(o[{ix}], {type_name})"
@@ -949,10 +1765,11 @@ def make_hetero_tuple_structure_fn(
     globs.update(internal_arg_parts)
     script = "\n".join([f"def {fn_name}(o, _=__cl, {internal_arg_line}):", *lines])
 
-    fname = generate_unique_filename(
-        cl, "structure", lines=script.splitlines() if use_linecache else []
-    )
-    eval(compile(script, fname, "exec"), globs)
+    if use_linecache == "from_converter":
+        # BaseConverter doesn't have it so we're careful.
+        use_linecache = getattr(converter, "use_linecache", True)
+    fname = source_filename(cl, "structure", script.splitlines(), use_linecache, globs)
+    compile_and_exec(script, fname, globs)
     return globs[fn_name]
 
 
@@ -996,7 +1813,7 @@ def make_hetero_tuple_unstructure_fn(
 
     total_lines = [*lines, "    return res"]
 
-    eval(compile("\n".join(total_lines), "", "exec"), globs)
+    compile_and_exec("\n".join(total_lines), "", globs)
 
     return globs[fn_name]
 
@@ -1048,7 +1865,8 @@ def mapping_unstructure_factory(
 
     lines = [f"def {fn_name}(mapping):"]
 
-    if unstructure_to is dict or (unstructure_to is None and origin is dict):
+    to_dict = unstructure_to is dict or (unstructure_to is None and origin is dict)
+    if to_dict:
         if kh is None and val_handler is None:
             # Simplest path.
             return dict
@@ -1062,9 +1880,37 @@ def mapping_unstructure_factory(
 
         lines = [*lines, "    return res"]
 
-    eval(compile("\n".join(lines), "", "exec"), globs)
+    compile_and_exec("\n".join(lines), "", globs)
 
-    return globs[fn_name]
+    res = globs[fn_name]
+    res._cattrs_inline = _inline_mapping_unstructure(
+        None if to_dict else unstructure_to or cl, kh, val_handler
+    )
+    return res
+
+
+def _inline_mapping_unstructure(
+    cl: Any, key_handler: Any, val_handler: Any
+) -> InlineHook:
+    """Inline a mapping unstructuring function.
+
+    :param cl: The class to unstructure to, or `None` for dicts.
+    """
+
+    def inline(obj: str, inlining: Inlining) -> str | None:
+        if not can_iterate(obj):
+            return None
+        k = inlining.new_local()
+        v = inlining.new_local()
+        k_u = inlining.call(key_handler, k) if key_handler is not None else k
+        v_u = inlining.call(val_handler, v) if val_handler is not None else v
+        if cl is None:
+            return f"{{{k_u}: {v_u} for {k}, {v} in {obj}.items()}}"
+        return (
+            f"{inlining.add_global(cl)}(({k_u}, {v_u}) for {k}, {v} in {obj}.items())"
+        )
+
+    return inline
 
 
 make_mapping_unstructure_fn: Final = mapping_unstructure_factory
@@ -1077,9 +1923,15 @@ def mapping_structure_factory(
     structure_to: type = dict,
     key_type=NOTHING,
     val_type=NOTHING,
-    detailed_validation: bool | Literal["from_converter"] = "from_converter",
+    detailed_validation: (
+        bool | Literal["optimistic", "from_converter"]
+    ) = "from_converter",
 ) -> SimpleStructureHook[Mapping[Any, Any], T]:
-    """Generate a specialized structure function for a mapping."""
+    """Generate a specialized structure function for a mapping.
+
+    ..  versionchanged:: NEXT
+        `detailed_validation` can be `optimistic`.
+    """
     fn_name = "structure_mapping"
 
     if detailed_validation == "from_converter":
@@ -1090,6 +1942,22 @@ def mapping_structure_factory(
     lines = []
     internal_arg_parts = {}
 
+    variants = {}
+    if detailed_validation == "optimistic":
+        # The function generated is the fast one, falling back to the detailed one.
+        # Hooks calling this one call either variant directly instead.
+        for attr, detailed in (("_cattrs_fast", False), ("_cattrs_detailed", True)):
+            variants[attr] = mapping_structure_factory(
+                cl,
+                converter,
+                structure_to,
+                key_type,
+                val_type,
+                detailed_validation=detailed,
+            )
+        internal_arg_parts["__c_detailed"] = variants["_cattrs_detailed"]
+        detailed_validation = False
+
     # Let's try fishing out the type args.
     if not is_bare(cl):
         args = get_args(cl)
@@ -1112,28 +1980,40 @@ def mapping_structure_factory(
         is_bare_dict = val_type in ANIES and key_type in ANIES
         if not is_bare_dict:
             # We can do the dispatch here and now.
-            key_handler = converter.get_structure_hook(key_type, cache_result=False)
-            if key_handler == converter._structure_call:
-                key_handler = key_type
+            key_handler = validation_variant(
+                converter.get_structure_hook(key_type, cache_result=False),
+                key_type,
+                converter,
+                detailed_validation,
+            )
+            key_bound = bind_structure_hook(key_handler, key_type, converter)
 
-            val_handler = converter.get_structure_hook(val_type, cache_result=False)
-            if val_handler == converter._structure_call:
-                val_handler = val_type
+            val_handler = validation_variant(
+                converter.get_structure_hook(val_type, cache_result=False),
+                val_type,
+                converter,
+                detailed_validation,
+            )
+            val_bound = bind_structure_hook(val_handler, val_type, converter)
 
             globs["__cattr_k_t"] = key_type
             globs["__cattr_v_t"] = val_type
-            globs["__cattr_k_s"] = key_handler
-            globs["__cattr_v_s"] = val_handler
-            k_s = (
-                "__cattr_k_s(k, __cattr_k_t)"
-                if key_handler != key_type
-                else "__cattr_k_s(k)"
-            )
-            v_s = (
-                "__cattr_v_s(v, __cattr_v_t)"
-                if val_handler != val_type
-                else "__cattr_v_s(v)"
-            )
+            globs["__cattr_k_s"] = key_bound if key_bound is not None else key_handler
+            globs["__cattr_v_s"] = val_bound if val_bound is not None else val_handler
+            # Keys and values trusted to be of the right type are used as is.
+            if key_bound is None:
+                k_s = "__cattr_k_s(k, __cattr_k_t)"
+            elif key_bound is identity:
+                k_s = "k"
+            else:
+                k_s = "__cattr_k_s(k)"
+            if val_bound is None:
+                v_s = "__cattr_v_s(v, __cattr_v_t)"
+            elif val_bound is identity:
+                v_s = "v"
+            else:
+                v_s = "__cattr_v_s(v)"
+            is_bare_dict = key_bound is identity and val_bound is identity
     else:
         is_bare_dict = True
 
@@ -1187,12 +2067,58 @@ def mapping_structure_factory(
 
     globs["cl"] = cl
     def_line = f"def {fn_name}(mapping, cl=cl{internal_arg_line}):"
-    total_lines = [def_line, *lines, "  return res"]
+    body = [*lines, "  return res"]
+    if "__c_detailed" in internal_arg_parts:
+        body = [
+            "  try:",
+            *[f"  {line}" for line in body],
+            "  except Exception:",
+            # Nested one-shot iterables may have been consumed, so the
+            # detailed pass is only trusted to raise.
+            "    __c_detailed(mapping)",
+            "    raise",
+        ]
+    total_lines = [def_line, *body]
     script = "\n".join(total_lines)
 
-    eval(compile(script, "", "exec"), globs)
+    compile_and_exec(script, "", globs)
 
-    return globs[fn_name]
+    res = globs[fn_name]
+    for attr, variant in variants.items():
+        setattr(res, attr, variant)
+    if is_bare_dict:
+        res._cattrs_inline = inline_copy(structure_to)
+    elif not detailed_validation:
+        res._cattrs_inline = _inline_mapping_structure(
+            structure_to,
+            (key_handler, key_bound, key_type),
+            (val_handler, val_bound, val_type),
+        )
+    return res
+
+
+def _inline_mapping_structure(
+    cl: type, key: tuple[Any, Any, Any], val: tuple[Any, Any, Any]
+) -> InlineHook:
+    """Inline a mapping structuring function without detailed validation.
+
+    :param key: The key hook, the hook as bound to the key type, and the key type.
+    :param val: The value hook, the hook as bound to the value type, and the value
+        type.
+    """
+
+    def inline(obj: str, inlining: Inlining) -> str | None:
+        if not can_iterate(obj):
+            return None
+        k = inlining.new_local()
+        v = inlining.new_local()
+        res = (
+            f"{{{inlining.structure(*key, k)}: {inlining.structure(*val, v)} "
+            f"for {k}, {v} in {obj}.items()}}"
+        )
+        return res if cl is dict else f"{inlining.add_global(cl)}({res})"
+
+    return inline
 
 
 make_mapping_structure_fn: Final = mapping_structure_factory
@@ -1220,7 +2146,11 @@ def iterable_unstructure_factory(
             type_arg = getattr(type_arg, "__default__", Any)
             if type_arg is NoDefault:
                 type_arg = Any
-        handler = converter.get_unstructure_hook(type_arg, cache_result=False)
+        try:
+            handler = converter.get_unstructure_hook(type_arg, cache_result=False)
+        except RecursionError:
+            # Break the cycle by using late binding.
+            handler = LateUnstructureHook(converter, type_arg)
         if handler == identity:
             # Save ourselves the trouble of iterating over it all.
             return unstructure_to or cl
@@ -1228,6 +2158,10 @@ def iterable_unstructure_factory(
     def unstructure_iterable(iterable, _seq_cl=unstructure_to or cl, _hook=handler):
         return _seq_cl(_hook(i) for i in iterable)
 
+    unstructure_iterable._cattrs_inline = inline_iterable(
+        unstructure_to or cl, lambda inlining, e: inlining.call(handler, e)
+    )
+    bind_late_hooks(unstructure_iterable)
     return unstructure_iterable
 
 
@@ -0,0 +1,143 @@
+"""Compilation of generated functions."""
+
+from __future__ import annotations
+
+import marshal
+import os
+import sys
+from contextlib import suppress
+from hashlib import sha256
+from importlib.util import MAGIC_NUMBER
+from pathlib import Path
+from threading import get_ident
+from time import perf_counter
+from types import CodeType, FunctionType
+from typing import Any
+
+from .._compat import class_cache
+from ..dispatch import _generating
+from ._shared import bind_late_hooks
+
+# The directory compiled code is cached in, if any.
+_code_cache: Path | None = None
+
+
+def set_code_cache(directory: str | os.PathLike[str] | None) -> None:
+    """Cache the code of generated functions in a directory, or stop caching if
+    `None`.
+
+    Generated functions are still generated on every start, but their code is
+    loaded from the cache instead of compiled when it was compiled before.
+    Cached code is keyed by the generated source (which reflects the fields of
+    the classes, overrides and converter options) and the Python version, so
+    it never goes stale; the directory may be cleared at any time.
+
+    The directory is created if needed. Since the cache contains code that is
+    executed, it must not be writable by untrusted users.
+
+    .. versionadded:: NEXT
+    """
+    global _code_cache
+    if directory is None:
+        _code_cache = None
+        return
+    path = Path(directory) / (sys.implementation.cache_tag or "cattrs")
+    path.mkdir(parents=True, exist_ok=True)
+    _code_cache = path
+
+
+def _compile(script: str, filename: str) -> tuple[CodeType, bool]:
+    """Compile the script, or load its code from the cache.
+
+    :return: The code, and whether it was loaded from the cache.
+    """
+    cache = _code_cache
+    if cache is None:
+        return compile(script, filename, "exec"), False
+
+    key = sha256(MAGIC_NUMBER)
+    key.update(filename.encode())
+    key.update(b"\0")
+    key.update(script.encode())
+    digest = key.digest()
+    path = cache / digest.hex()
+    # Entries start with the magic number of the Python version and the digest of
+    # the source they were compiled from, so entries for other versions or other
+    # sources (like renamed or corrupted files) are never loaded.
+    header = MAGIC_NUMBER + digest
+    try:
+        data = path.read_bytes()
+        if data[: len(header)] == header:
+            # The directory is trusted (see `set_code_cache`), and the header
+            # shows this entry was written by us, for this source and version.
+            code = marshal.loads(data[len(header) :])  # noqa: S302
+        else:
+            code = None
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    else:
+        if isinstance(code, CodeType):
+            return code, True
+
+    code = compile(script, filename, "exec")
+    # Written to a temporary file first, so other threads and processes never
+    # read partial entries.
+    tmp = path.with_name(f"{path.name}.{os.getpid()}-{get_ident()}.tmp")
+    try:
+        tmp.write_bytes(header + marshal.dumps(code))
+        tmp.replace(path)
+    except OSError:
+        with suppress(OSError):
+            tmp.unlink(missing_ok=True)
+    return code, False
+
+
+def compile_and_exec(
+    script: str, filename: str, globs: dict[str, Any], owner: Any = None
+) -> None:
+    """Compile the script and execute it, with `globs` as its globals.
+
+    If the script is being generated for a dispatch collecting statistics, the
+    compilation is recorded there.
+    Late hooks used by the functions defined are bound to them.
+
+    :param owner: The class the script is generated for. If it is generic, its
+        code is cached on it, and shared by its parametrizations: their scripts
+        usually only differ in the hooks passed in `globs`.
+    """
+    observer = getattr(_generating, "observer", None)
+    if observer is not None:
+        # Used for exporting hooks, see `cattrs.gen.export`.
+        observer.compiling(script, globs)
+    stack = getattr(_generating, "stack", None)
+    stats = stack[-1][0]._stats if stack else None
+    codes = None
+    code = None
+    if (
+        getattr(owner, "__parameters__", None)
+        and (cache := class_cache(owner)) is not None
+    ):
+        codes = cache.setdefault(compile_and_exec, {})
+        code = codes.get((filename, script))
+    if code is not None:
+        eval(code, globs)
+        if stats is not None:
+            stats.code_cache_hits += 1
+    elif stats is None:
+        code = _compile(script, filename)[0]
+        eval(code, globs)
+    else:
+        start = perf_counter()
+        code, cached = _compile(script, filename)
+        eval(code, globs)
+        if cached:
+            stats.code_cache_hits += 1
+        else:
+            stats.compile_time += perf_counter() - start
+            stats.compiled += 1
+    if codes is not None:
+        codes[(filename, script)] = code
+
+    for value in list(globs.values()):
+        if isinstance(value, FunctionType) and value.__globals__ is globs:
+            bind_late_hooks(value)
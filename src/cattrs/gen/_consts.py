@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import Counter, OrderedDict, deque
 from threading import local
 from typing import Any, Callable
 
@@ -17,3 +18,25 @@ class AttributeOverride:
 
 neutral = AttributeOverride()
 already_generating = local()
+
+#: Factories always producing equal values when called without arguments, so
+#: defaults using them can be created once for comparisons.
+pure_factories = frozenset(
+    [
+        list,
+        dict,
+        set,
+        frozenset,
+        tuple,
+        str,
+        bytes,
+        bytearray,
+        int,
+        float,
+        complex,
+        bool,
+        deque,
+        OrderedDict,
+        Counter,
+    ]
+)
@@ -1,6 +1,49 @@
 """Line-cache functionality."""
 
+from __future__ import annotations
+
 import linecache
+from collections import deque
+from hashlib import sha1
+from typing import Any, Literal
+
+from .._compat import TypeAlias
+
+#: How the source code of generated functions is made available to `linecache`:
+#: stored right away (`True`), only when formatting tracebacks (`"lazy"`), or
+#: not at all (`False`).
+LinecacheMode: TypeAlias = bool | Literal["lazy"]
+
+_limit: int | None = None
+# The filenames stored in the linecache, oldest first.
+_stored: deque[str] = deque()
+
+
+def set_linecache_limit(limit: int | None) -> None:
+    """Limit how many generated functions have their source code stored in the
+    linecache, or remove the limit if `None`.
+
+    Past the limit, the source code of the oldest functions is removed first,
+    and tracebacks going through them lack source lines.
+    Functions with lazily registered source code do not count.
+
+    .. versionadded:: NEXT
+    """
+    global _limit
+    _limit = limit
+    _evict()
+
+
+def _evict() -> None:
+    limit = _limit
+    if limit is None:
+        return
+    while len(_stored) > limit:
+        try:
+            filename = _stored.popleft()
+        except IndexError:  # Emptied by another thread.
+            return
+        linecache.cache.pop(filename, None)
 
 
 def generate_unique_filename(cls: type, func_name: str, lines: list[str] = []) -> str:
@@ -20,9 +63,54 @@ def generate_unique_filename(cls: type, func_name: str, lines: list[str] = []) -
         if not lines:
             return unique_filename
         cache_line = (len("\n".join(lines)), None, lines, unique_filename)
+        # `setdefault` is atomic, even on free-threaded Python, so concurrent
+        # generations never overwrite each other's lines.
         if linecache.cache.setdefault(unique_filename, cache_line) == cache_line:
+            if linecache.cache[unique_filename] is cache_line:
+                _stored.append(unique_filename)
+                _evict()
             return unique_filename
 
         # Looks like this spot is taken. Try again.
         count += 1
         extra = f"-{count}"
+
+
+class _SourceLoader:
+    """Provides the source code of a generated function to `linecache`."""
+
+    __slots__ = ("source",)
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+
+    def get_source(self, name: str) -> str:
+        return self.source
+
+
+def source_filename(
+    cls: type,
+    func_name: str,
+    lines: list[str],
+    mode: LinecacheMode,
+    globs: dict[str, Any],
+) -> str:
+    """Create a "filename" for a function being generated, making its source code
+    available to `linecache` as requested.
+
+    In lazy mode, the source code is kept in the globals of the function, where
+    `linecache` finds it when a traceback going through the function is formatted.
+    The filename is then derived from the source code, since it is registered
+    too late to detect duplicates.
+    """
+    if mode != "lazy":
+        return generate_unique_filename(cls, func_name, lines if mode else [])
+    source = "\n".join(lines)
+    globs["__name__"] = "cattrs.gen"
+    globs["__loader__"] = _SourceLoader(source)
+    digest = sha1(source.encode(), usedforsecurity=False).hexdigest()[:12]
+    # `linecache` never loads filenames starting with `<` and ending with `>`
+    # lazily.
+    return "<cattrs generated {} {}.{}>#{}".format(
+        func_name, cls.__module__, getattr(cls, "__qualname__", cls.__name__), digest
+    )
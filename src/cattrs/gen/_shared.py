@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from types import FunctionType
 from typing import TYPE_CHECKING, Any
 
 from attrs import NOTHING, Attribute, Factory
 
-from .._compat import get_args, is_annotated, is_bare_final
+from .._compat import NoneType, get_args, is_annotated, is_bare_final
 from ..dispatch import StructureHook
 from ..errors import StructureHandlerNotFoundError
-from ..fns import raise_error
+from ..fns import identity, raise_error
 from ._consts import AttributeOverride
 
 if TYPE_CHECKING:
@@ -29,12 +32,54 @@ def _annotated_override_or_default(
     return default
 
 
+def bind_structure_hook(
+    hook: StructureHook, type: Any, converter: BaseConverter
+) -> Callable[[Any], Any] | None:
+    """Bind a structure hook to its type, producing a single-argument hook.
+
+    Hooks simply calling the type are bound to the type itself, hooks trusting
+    values to be of the right type to `identity`, and hooks defaulting their
+    second argument to the type (like generated hooks) are already bound.
+
+    Return `None` if the hook cannot be bound without wrapping it.
+    """
+    if hook == converter._structure_call:
+        return type
+    if hook == converter._structure_trusted:
+        return identity
+    if not isinstance(hook, FunctionType):
+        return None
+    code = hook.__code__
+    defaults = hook.__defaults__ or ()
+    required = code.co_argcount - len(defaults)
+    if (
+        code.co_argcount < 2
+        or required > 1
+        or len(hook.__kwdefaults__ or ()) < code.co_kwonlyargcount
+    ):
+        return None
+    try:
+        if defaults[1 - required] == type:
+            return hook
+    except Exception:  # noqa: S110
+        pass
+    return None
+
+
 def find_structure_handler(
-    a: Attribute, type: Any, c: BaseConverter, prefer_attrs_converters: bool = False
+    a: Attribute,
+    type: Any,
+    c: BaseConverter,
+    prefer_attrs_converters: bool = False,
+    detailed_validation: bool | None = None,
 ) -> StructureHook | None:
     """Find the appropriate structure handler to use.
 
     Return `None` if no handler should be used.
+
+    :param detailed_validation: Whether the handler is for a hook with detailed
+        validation, to pick the right variant of optimistic hooks; see
+        `validation_variant`.
     """
     try:
         if a.converter is not None and prefer_attrs_converters:
@@ -74,7 +119,242 @@ def find_structure_handler(
                 handler = c.get_structure_hook(type, cache_result=False)
         else:
             handler = c.structure
-        return handler
+        if handler == c._structure_trusted:
+            # The value is used as is.
+            return None
     except RecursionError:
         # This means we're dealing with a reference cycle, so use late binding.
-        return c.structure
+        handler = LateStructureHook(c, type)
+    if handler is None or detailed_validation is None:
+        return handler
+    return validation_variant(handler, type, c, detailed_validation)
+
+
+def validation_variant(
+    hook: StructureHook, type: Any, converter: BaseConverter, detailed: bool
+) -> StructureHook:
+    """The variant of a hook to call from a hook with or without detailed validation,
+    for converters using optimistic detailed validation.
+
+    Optimistic hooks try structuring without detailed validation, and fall back to
+    it to produce the errors. Hooks calling them already do that themselves, so
+    they call the fast or detailed variant directly instead. Otherwise failures
+    would be retried at every level.
+    """
+    if converter.detailed_validation != "optimistic":
+        return hook
+    attr = "_cattrs_detailed" if detailed else "_cattrs_fast"
+    variant = getattr(hook, attr, None)
+    if variant is not None:
+        return variant
+    if isinstance(hook, LateStructureHook):
+        return LateStructureHook(converter, hook.type, attr)
+    if hook == converter._structure_optional:
+        # The optional hook dispatches at run time, so it is replaced.
+        union_params = type.__args__
+        other = union_params[0] if union_params[1] is NoneType else union_params[1]
+        try:
+            inner = converter.get_structure_hook(other)
+        except RecursionError:
+            inner = LateStructureHook(converter, other)
+        inner = validation_variant(inner, other, converter, detailed)
+
+        def structure_optional(obj, _=type, _hook=inner, _other=other):
+            return None if obj is None else _hook(obj, _other)
+
+        bind_late_hooks(structure_optional)
+        return structure_optional
+    return hook
+
+
+class _LateHook(ABC):
+    """A hook for a type whose hook cannot be produced yet, since it is being
+    generated higher up the stack (the classes reference each other).
+
+    The hook is fetched from the converter on first use, when generation is over.
+    Generated functions having late hooks as defaults (see `bind_late_hooks`) then
+    get them replaced by the fetched hooks, calling those directly from then on.
+    """
+
+    __slots__ = ("converter", "hook", "owners", "type", "variant")
+
+    def __init__(
+        self, converter: BaseConverter, type: Any, variant: str | None = None
+    ) -> None:
+        self.converter = converter
+        self.type = type
+        #: The attribute holding the variant of the fetched hook to use, if any.
+        #: See `validation_variant`.
+        self.variant = variant
+        self.hook: Callable[..., Any] | None = None
+        self.owners: list[FunctionType] = []
+
+    @abstractmethod
+    def _get_hook(self) -> Callable[..., Any]:
+        """Fetch the hook from the converter."""
+
+    def _resolve(self) -> Callable[..., Any]:
+        hook = self._get_hook()
+        owners, self.owners = self.owners, []
+        for owner in owners:
+            owner.__defaults__ = tuple(
+                hook if d is self else d for d in owner.__defaults__
+            )
+        self.hook = hook
+        return hook
+
+
+class LateStructureHook(_LateHook):
+    """A structure hook bound late, for breaking reference cycles."""
+
+    __slots__ = ()
+
+    def _get_hook(self) -> StructureHook:
+        hook = self.converter.get_structure_hook(self.type)
+        if self.variant is None:
+            return hook
+        return getattr(hook, self.variant, hook)
+
+    def __call__(self, obj: Any, _: Any = None) -> Any:
+        hook = self.hook
+        if hook is None:
+            hook = self._resolve()
+        return hook(obj, self.type)
+
+
+class LateUnstructureHook(_LateHook):
+    """An unstructure hook bound late, for breaking reference cycles."""
+
+    __slots__ = ()
+
+    def _get_hook(self) -> Callable[[Any], Any]:
+        return self.converter.get_unstructure_hook(self.type)
+
+    def __call__(self, obj: Any) -> Any:
+        hook = self.hook
+        if hook is None:
+            hook = self._resolve()
+        return hook(obj)
+
+
+def bind_late_hooks(fn: FunctionType) -> None:
+    """Have the late hooks among the defaults of `fn` replace themselves with
+    their hooks once fetched."""
+    for d in fn.__defaults__ or ():
+        if isinstance(d, _LateHook) and d.hook is None:
+            d.owners.append(fn)
+
+
+class Inlining:
+    """The state of inlining hooks into a function being generated."""
+
+    __slots__ = ("_names", "depth", "locals", "parts")
+
+    def __init__(self, parts: dict[str, Any], depth: int) -> None:
+        #: The globals of the function, which inlined hooks add their own to.
+        self.parts = parts
+        #: How many more levels of class hooks may be inlined.
+        self.depth = depth
+        self.locals = 0
+        # The names of the globals added, by id.
+        self._names: dict[int, str] = {}
+
+    def add_global(self, value: Any) -> str:
+        """Add a global of an inlined hook, returning its name."""
+        name = self._names.get(id(value))
+        if name is None:
+            name = self._names[id(value)] = f"__c_i{len(self._names)}"
+            self.parts[name] = value
+        return name
+
+    def new_local(self) -> str:
+        """Return the name of a new local variable."""
+        self.locals += 1
+        return f"__c_v{self.locals}"
+
+    def inline(self, hook: Any, arg: str) -> str | None:
+        """An expression inlining a hook generated by cattrs, applied to `arg`.
+
+        Return `None` if the hook cannot be inlined.
+        """
+        inline: InlineHook | None = (
+            getattr(hook, "_cattrs_inline", None)
+            if isinstance(hook, FunctionType)
+            else None
+        )
+        return inline(arg, self) if inline is not None else None
+
+    def call(self, hook: Any, arg: str) -> str:
+        """An expression applying a single-argument hook to `arg`, inlining it if
+        possible."""
+        res = self.inline(hook, arg)
+        return res if res is not None else f"{self.add_global(hook)}({arg})"
+
+    def structure(self, hook: Any, bound: Any, type: Any, arg: str) -> str:
+        """An expression structuring `arg` using a hook, and the hook as bound to
+        the type by `bind_structure_hook` (if it could be)."""
+        if bound is None:
+            return f"{self.add_global(hook)}({arg}, {self.add_global(type)})"
+        if bound is identity:
+            return arg
+        return self.call(bound, arg)
+
+
+def inline_class(inline: InlineHook) -> InlineHook:
+    """Make an inline hook for a class use up a level of the inlining depth.
+
+    Hooks for collections are inlined regardless of the depth, since they do not
+    nest any further by themselves.
+    """
+
+    def inline_nested(arg: str, inlining: Inlining) -> str | None:
+        if inlining.depth <= 0:
+            return None
+        inlining.depth -= 1
+        try:
+            return inline(arg, inlining)
+        finally:
+            inlining.depth += 1
+
+    return inline_nested
+
+
+def inline_copy(cl: Any) -> InlineHook:
+    """Inline a hook copying a collection into `cl`."""
+
+    def inline(obj: str, inlining: Inlining) -> str:
+        return f"{inlining.add_global(cl)}({obj})"
+
+    return inline
+
+
+def can_iterate(obj: str) -> bool:
+    """Whether `obj` can be the iterable of a comprehension.
+
+    Assignment expressions, which inlined class hooks use for their argument,
+    cannot be.
+    """
+    return ":=" not in obj
+
+
+def inline_iterable(cl: Any, element: Callable[[Inlining, str], str]) -> InlineHook:
+    """Inline a hook converting the elements of an iterable into `cl`, using a
+    list comprehension.
+
+    :param element: Produces the expression converting an element.
+    """
+
+    def inline(obj: str, inlining: Inlining) -> str | None:
+        if not can_iterate(obj):
+            return None
+        e = inlining.new_local()
+        res = f"[{element(inlining, e)} for {e} in {obj}]"
+        return res if cl is list else f"{inlining.add_global(cl)}({res})"
+
+    return inline
+
+
+#: Emits the body of a generated hook as an expression applied to the given
+#: expression, for inlining it into another generated hook. Returns `None` if
+#: the hook should be called instead.
+InlineHook = Callable[[str, Inlining], "str | None"]
@@ -0,0 +1,407 @@
+"""Ahead-of-time export of generated hooks into an importable Python module.
+
+Usage::
+
+    python -m cattrs.gen.export myapp.models:ROOT_TYPES --converter myapp:conv \\
+        -o hooks_gen.py
+
+The exported module has a `register(converter)` function, registering the
+exported hooks into a converter configured like the exporting one.
+
+.. versionadded:: NEXT
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from argparse import ArgumentParser
+from collections.abc import Iterable, Sequence
+from enum import Enum
+from importlib import import_module
+from textwrap import indent
+from types import FunctionType, MethodType
+from typing import TYPE_CHECKING, Any, Literal
+from weakref import ref
+
+from attrs import Factory
+
+from .._compat import NoneType, get_args, get_origin, is_literal, is_union_type
+from ..dispatch import MultiStrategyDispatch, _generating
+
+if TYPE_CHECKING:
+    from ..converters import BaseConverter
+
+__all__ = ["export_hooks", "install_hook", "main"]
+
+Direction = Literal["structure", "unstructure"]
+
+
+def install_hook(
+    converter: BaseConverter,
+    direction: Direction,
+    type: Any,
+    hook: Any,
+    deps: Iterable[tuple[Direction, Any]],
+) -> None:
+    """Install an exported hook into a converter, as if it had been generated
+    there.
+
+    The hook is dropped when hooks for any of the types it depends on change.
+
+    Used by exported modules.
+    """
+    dispatches = {
+        "structure": converter._structure_func,
+        "unstructure": converter._unstructure_func,
+    }
+    dispatches[direction].register_cls_list(
+        [(type, hook)], direct=True, deps={(ref(dispatches[d]), t) for d, t in deps}
+    )
+
+
+class _UnexportableError(Exception):
+    """A value cannot be expressed in source code."""
+
+
+class _Compiled:
+    """A function compiled while warming up."""
+
+    __slots__ = ("fn", "globs", "name", "script")
+
+    def __init__(self, script: str, globs: dict[str, Any]) -> None:
+        self.script = script
+        self.globs = globs
+        match = re.search(r"^def (\w+)\(", script, re.MULTILINE)
+        self.name = match.group(1) if match is not None else None
+        self.fn: Any = None
+
+
+class _Observer:
+    """Records the functions compiled, and the hooks fetched, while warming up."""
+
+    def __init__(self) -> None:
+        self.compiled: list[_Compiled] = []
+        self.hooks: dict[int, tuple[MultiStrategyDispatch, Any, Any]] = {}
+
+    def compiling(self, script: str, globs: dict[str, Any]) -> None:
+        self.compiled.append(_Compiled(script, globs))
+
+    def hook_fetched(self, dispatch: MultiStrategyDispatch, typ: Any, hook: Any):
+        # The hook is kept alive, so its id stays unique.
+        self.hooks.setdefault(id(hook), (dispatch, typ, hook))
+
+
+class _Writer:
+    """Turns values into source code expressions."""
+
+    def __init__(self, converter: BaseConverter) -> None:
+        self.converter = converter
+        self.imports: set[str] = set()
+        # Expressions for the functions compiled, by id.
+        self.functions: dict[int, str] = {}
+        self.hooks: dict[int, tuple[Direction, Any]] = {}
+
+    def module_ref(self, module: str) -> str:
+        self.imports.add(module)
+        return "_m_" + module.replace(".", "_")
+
+    def ref(self, obj: Any) -> str:
+        """An expression for an importable object."""
+        if obj is None:
+            return "None"
+        if obj is Ellipsis:
+            return "..."
+        module = getattr(obj, "__module__", None)
+        qualname = getattr(obj, "__qualname__", None) or getattr(obj, "_name", None)
+        if not isinstance(module, str) or not isinstance(qualname, str):
+            raise _UnexportableError(obj)
+        if "<" in qualname:
+            raise _UnexportableError(obj)
+        try:
+            res = import_module(module)
+            for part in qualname.split("."):
+                res = getattr(res, part)
+        except (ImportError, AttributeError):
+            raise _UnexportableError(obj) from None
+        if res is not obj:
+            raise _UnexportableError(obj)
+        if module == "builtins":
+            return qualname
+        return f"{self.module_ref(module)}.{qualname}"
+
+    def type_expr(self, typ: Any) -> str:
+        """An expression for a type, including typing constructs."""
+        try:
+            return self.ref(typ)
+        except _UnexportableError:
+            pass
+        if typ is NoneType:
+            return "type(None)"
+        args = get_args(typ)
+        if is_literal(typ):
+            items = [self.constant(a) for a in args]
+            res = f"{self.module_ref('typing')}.Literal[{', '.join(items)}]"
+        elif is_union_type(typ):
+            items = [self.type_expr(a) for a in args]
+            res = f"{self.module_ref('typing')}.Union[{', '.join(items)}]"
+        else:
+            origin = get_origin(typ)
+            if origin is None or not args:
+                raise _UnexportableError(typ)
+            name = getattr(typ, "_name", None)
+            base = (
+                f"{self.module_ref('typing')}.{name}"
+                if name is not None and type(typ).__module__ == "typing"
+                else self.type_expr(origin)
+            )
+            res = f"{base}[{', '.join(self.type_expr(a) for a in args)}]"
+        self.check(res, typ)
+        return res
+
+    def constant(self, value: Any) -> str:
+        """An expression for a constant.
+
+        Mutable collections are recreated rather than shared, which is fine for
+        the defaults generated functions compare against.
+        """
+        if type(value) in (bool, int, float, str, bytes, NoneType):
+            res = repr(value)
+        elif type(value) in (tuple, list, set, frozenset):
+            items = "".join(f"{self.constant(v)}, " for v in value)
+            res = f"{type(value).__name__}(({items}))"
+        elif type(value) is dict:
+            items = ", ".join(
+                f"{self.constant(k)}: {self.constant(v)}" for k, v in value.items()
+            )
+            res = f"{{{items}}}"
+        elif isinstance(value, Enum):
+            res = f"{self.ref(type(value))}.{value.name}"
+        else:
+            raise _UnexportableError(value)
+        self.check(res, value)
+        return res
+
+    def check(self, expr: str, value: Any) -> None:
+        """Make sure the expression evaluates to (something equal to) the value."""
+        namespace = {
+            "_m_" + m.replace(".", "_"): import_module(m) for m in self.imports
+        }
+        try:
+            same = eval(expr, namespace) == value
+        except Exception:
+            same = False
+        if not same:
+            raise _UnexportableError(value)
+
+    def deps(self, typ: Any, direction: Direction) -> str:
+        """An expression for the dependencies of the hook for a type, so it can
+        be dropped when they change."""
+        dispatch = (
+            self.converter._structure_func
+            if direction == "structure"
+            else self.converter._unstructure_func
+        )
+        if typ not in dispatch._cache:
+            # Not generated on its own, so the dependencies are unknown.
+            raise _UnexportableError(typ)
+        directions = {
+            self.converter._structure_func: "structure",
+            self.converter._unstructure_func: "unstructure",
+        }
+        items = []
+        for dispatch_ref, t in dispatch._cache.get_deps(typ):
+            d = directions.get(dispatch_ref())
+            if d is None:
+                raise _UnexportableError(typ)
+            items.append(f"({d!r}, {self.type_expr(t)}), ")
+        return f"({''.join(sorted(items))})"
+
+    def value(self, value: Any) -> str:
+        """An expression for a value in the globals of a generated function."""
+        if id(value) in self.functions:
+            return self.functions[id(value)]
+        try:
+            return self.ref(value)
+        except _UnexportableError:
+            pass
+        if isinstance(value, MethodType) and value.__self__ is self.converter:
+            name = value.__func__.__name__
+            if getattr(self.converter, name, None) == value:
+                return f"converter.{name}"
+        if id(value) in self.hooks:
+            direction, typ = self.hooks[id(value)]
+            getter = "_s" if direction == "structure" else "_u"
+            return f"{getter}({self.type_expr(typ)})"
+        if isinstance(value, Factory):
+            return (
+                f"{self.module_ref('attrs')}.Factory("
+                f"{self.value(value.factory)}, takes_self={value.takes_self!r})"
+            )
+        if isinstance(value, (type, FunctionType)) or get_origin(value) is not None:
+            return self.type_expr(value)
+        return self.constant(value)
+
+
+def export_hooks(
+    converter: BaseConverter,
+    types: Iterable[Any],
+    directions: Iterable[Direction] = ("structure", "unstructure"),
+) -> str:
+    """Generate the hooks for the given types (and the types nested in them), and
+    return the source code of a module containing them.
+
+    The module has a `register(converter)` function, registering the hooks into a
+    converter. The converter needs to be configured (with the same options and
+    hooks) like the one the hooks were exported from.
+
+    Hooks which cannot be exported, because they refer to objects that cannot be
+    imported (like lambdas or local classes), are left out, and generated as
+    usual when needed.
+
+    The given converter is not modified; hooks are generated in a copy.
+
+    .. versionadded:: NEXT
+    """
+    conv = converter.copy()
+    for dispatch in (conv._structure_func, conv._unstructure_func):
+        dispatch._fork()
+        dispatch.clear_cache()
+
+    observer = _Observer()
+    _generating.observer = observer
+    try:
+        conv._warmup(list(types), list(directions))
+    finally:
+        del _generating.observer
+
+    writer = _Writer(conv)
+    dispatches: dict[Any, Direction] = {
+        conv._structure_func: "structure",
+        conv._unstructure_func: "unstructure",
+    }
+    compiled = [c for c in observer.compiled if c.name is not None]
+    for c in compiled:
+        c.fn = c.globs.get(c.name)
+    for dispatch, typ, hook in observer.hooks.values():
+        writer.hooks[id(hook)] = (dispatches[dispatch], typ)
+
+    # Functions are exported in the order they were compiled, which is also a
+    # valid order for them to refer to each other, unless they fail to export
+    # (in which case the functions referring to them fall back to fetching hooks
+    # from the converter).
+    factories = []
+    calls = []
+    # Nested hooks are sometimes generated more than once, identically.
+    made: dict[tuple[str, tuple[str, ...]], str] = {}
+    for c in compiled:
+        params = [k for k in c.globs if k != "__builtins__" and k != c.name]
+        try:
+            args = tuple(writer.value(c.globs[k]) for k in params)
+        except _UnexportableError:
+            continue
+        key = (c.script, args)
+        if key in made:
+            writer.functions[id(c.fn)] = made[key]
+            continue
+        var = made[key] = f"_h{len(made)}"
+        factories.append(
+            f"def _make{var}({', '.join(params)}):\n"
+            f"{indent(c.script.strip(), '    ')}\n"
+            f"    return {c.name}\n"
+        )
+        calls.append(f"    {var} = _make{var}({', '.join(args)})")
+        if id(c.fn) in writer.hooks:
+            direction, typ = writer.hooks[id(c.fn)]
+            try:
+                type_expr = writer.type_expr(typ)
+                deps_expr = writer.deps(typ, direction)
+            except _UnexportableError:
+                pass
+            else:
+                calls.append(
+                    f"    _install(converter, {direction!r}, {type_expr}, {var}, "
+                    f"{deps_expr})"
+                )
+        writer.functions[id(c.fn)] = var
+
+    lines = [
+        '"""Hooks generated by cattrs. Do not edit; export them again instead."""',
+        "",
+        *(f"import {m} as _m_{m.replace('.', '_')}" for m in sorted(writer.imports)),
+        "",
+        "from cattrs.gen.export import install_hook as _install",
+        "",
+        "",
+        *(f"{f}\n" for f in factories),
+        "",
+        "def register(converter):",
+        '    """Register the hooks into a converter."""',
+        "    _s = converter.get_structure_hook",
+        "    _u = converter.get_unstructure_hook",
+        *calls,
+        "",
+    ]
+    res = "\n".join(lines)
+    compile(res, "<cattrs export>", "exec")
+    return res
+
+
+def _load(spec: str) -> Any:
+    """Load an object from a `module:attribute` spec."""
+    module, _, attr = spec.partition(":")
+    res = import_module(module)
+    for part in filter(None, attr.split(".")):
+        res = getattr(res, part)
+    return res
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """The command line interface of the exporter."""
+    parser = ArgumentParser(
+        prog="python -m cattrs.gen.export",
+        description="Export generated cattrs hooks into a Python module.",
+    )
+    parser.add_argument(
+        "types",
+        nargs="+",
+        help="Types to export hooks for, as `module:attribute`. Attributes may "
+        "also be iterables of types.",
+    )
+    parser.add_argument(
+        "--converter",
+        help="The converter, as `module:attribute`. Defaults to the global converter.",
+    )
+    parser.add_argument(
+        "--direction",
+        choices=["structure", "unstructure"],
+        action="append",
+        help="Only export hooks for this direction. Defaults to both.",
+    )
+    parser.add_argument("-o", "--output", help="The output file. Defaults to stdout.")
+    args = parser.parse_args(argv)
+
+    if args.converter is None:
+        from .. import global_converter as converter  # noqa: PLC0415
+    else:
+        converter = _load(args.converter)
+    types = []
+    for spec in args.types:
+        obj = _load(spec)
+        if isinstance(obj, (list, tuple, set, frozenset)):
+            types.extend(obj)
+        else:
+            types.append(obj)
+
+    source = export_hooks(
+        converter, types, args.direction or ("structure", "unstructure")
+    )
+    if args.output is None:
+        sys.stdout.write(source)
+    else:
+        with open(args.output, "w") as f:
+            f.write(source)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import re
 import sys
 from collections.abc import Mapping
 from inspect import get_annotations
@@ -10,6 +9,7 @@ from attrs import NOTHING, Attribute
 from typing_extensions import _TypedDictMeta
 
 from .._compat import (
+    cache_per_class,
     get_full_type_hints,
     get_notrequired_base,
     get_origin,
@@ -26,10 +26,15 @@ from ..errors import (
 )
 from ..fns import identity
 from . import AttributeOverride
+from ._compile import compile_and_exec
 from ._consts import already_generating, neutral
 from ._generics import generate_mapping
-from ._lc import generate_unique_filename
-from ._shared import _annotated_override_or_default, find_structure_handler
+from ._lc import LinecacheMode, source_filename
+from ._shared import (
+    _annotated_override_or_default,
+    bind_structure_hook,
+    find_structure_handler,
+)
 
 if TYPE_CHECKING:
     from ..converters import BaseConverter
@@ -46,7 +51,9 @@ def get_annots(cl) -> dict[str, Any]:
 def make_dict_unstructure_fn(
     cl: type[T],
     converter: BaseConverter,
-    _cattrs_use_linecache: bool = True,
+    _cattrs_use_linecache: LinecacheMode | Literal["from_converter"] = (
+        "from_converter"
+    ),
     **kwargs: AttributeOverride,
 ) -> Callable[[T], dict[str, Any]]:
     """
@@ -56,8 +63,14 @@ def make_dict_unstructure_fn(
     :param converter: A Converter instance to use for unstructuring nested fields.
     :param kwargs: A mapping of field names to an `AttributeOverride`, for
         customization.
-    :param _cattrs_detailed_validation: Whether to store the generated code in the
-        _linecache_, for easier debugging and better stack traces.
+    :param _cattrs_use_linecache: Whether to store the generated code in the
+        _linecache_, for easier debugging and better stack traces, or register it
+        lazily (`lazy`), when formatting tracebacks. Takes its value from the given
+        converter by default.
+
+    ..  versionchanged:: NEXT
+        `_cattrs_use_linecache` can be `lazy`, and takes its value from the given
+        converter by default.
     """
     origin = get_origin(cl)
     attrs = _adapted_fields(origin or cl)  # type: ignore
@@ -221,11 +234,14 @@ def make_dict_unstructure_fn(
         ]
         script = "\n".join(total_lines)
 
-        fname = generate_unique_filename(
-            cl, "unstructure", lines=total_lines if _cattrs_use_linecache else []
+        if _cattrs_use_linecache == "from_converter":
+            # BaseConverter doesn't have it so we're careful.
+            _cattrs_use_linecache = getattr(converter, "use_linecache", True)
+        fname = source_filename(
+            cl, "unstructure", total_lines, _cattrs_use_linecache, globs
         )
 
-        eval(compile(script, fname, "exec"), globs)
+        compile_and_exec(script, fname, globs, cl)
 
         res = globs[fn_name]
         res.overrides = kwargs
@@ -241,7 +257,9 @@ def make_dict_structure_fn(
     cl: Any,
     converter: BaseConverter,
     _cattrs_forbid_extra_keys: bool | Literal["from_converter"] = "from_converter",
-    _cattrs_use_linecache: bool = True,
+    _cattrs_use_linecache: LinecacheMode | Literal["from_converter"] = (
+        "from_converter"
+    ),
     _cattrs_detailed_validation: bool | Literal["from_converter"] = "from_converter",
     **kwargs: AttributeOverride,
 ) -> Callable[[dict, Any], Any]:
@@ -255,12 +273,17 @@ def make_dict_structure_fn(
         more detailed errors.
     :param _cattrs_forbid_extra_keys: Whether the structuring function should raise a
         `ForbiddenExtraKeysError` if unknown keys are encountered.
-    :param _cattrs_detailed_validation: Whether to store the generated code in the
-        _linecache_, for easier debugging and better stack traces.
+    :param _cattrs_use_linecache: Whether to store the generated code in the
+        _linecache_, for easier debugging and better stack traces, or register it
+        lazily (`lazy`), when formatting tracebacks. Takes its value from the given
+        converter by default.
 
     ..  versionchanged:: 23.2.0
         The `_cattrs_forbid_extra_keys` and `_cattrs_detailed_validation` parameters
         take their values from the given converter by default.
+    ..  versionchanged:: NEXT
+        `_cattrs_use_linecache` can be `lazy`, and takes its value from the given
+        converter by default.
     """
 
     mapping = {}
@@ -280,22 +303,15 @@ def make_dict_structure_fn(
     cl_name = cl.__name__
     fn_name = "structure_" + cl_name
 
-    # We have generic parameters and need to generate a unique name for the function
+    # The function is named after the class only, so parametrizations of generic
+    # classes share their code; see `compile_and_exec`.
     for p in getattr(cl, "__parameters__", ()):
-        try:
-            name_base = mapping[p.__name__]
-        except KeyError:
-            pn = p.__name__
+        pn = p.__name__
+        if pn not in mapping:
             raise StructureHandlerNotFoundError(
                 f"Missing type for generic argument {pn}, specify it when structuring.",
                 p,
-            ) from None
-        name = getattr(name_base, "__name__", None) or str(name_base)
-        # `<>` can be present in lambdas
-        # `|` can be present in unions
-        name = re.sub(r"[\[\.\] ,<>]", "_", name)
-        name = re.sub(r"\|", "u", name)
-        fn_name += f"_{name}"
+            )
 
     internal_arg_parts = {"__cl": cl}
     globs = {}
@@ -381,8 +397,9 @@ def make_dict_structure_fn(
             tn = f"__c_type_{ix}"
             internal_arg_parts[tn] = t
 
-            if handler == converter._structure_call:
-                internal_arg_parts[struct_handler_name] = t
+            bound = bind_structure_hook(handler, t, converter)
+            if bound is not None:
+                internal_arg_parts[struct_handler_name] = bound
                 lines.append(f"{i}res['{an}'] = {struct_handler_name}(o['{kn}'])")
             else:
                 lines.append(f"{i}res['{an}'] = {struct_handler_name}(o['{kn}'], {tn})")
@@ -449,8 +466,9 @@ def make_dict_structure_fn(
 
             struct_handler_name = f"__c_structure_{ix}"
             internal_arg_parts[struct_handler_name] = handler
-            if handler == converter._structure_call:
-                internal_arg_parts[struct_handler_name] = t
+            bound = bind_structure_hook(handler, t, converter)
+            if bound is not None:
+                internal_arg_parts[struct_handler_name] = bound
                 invocation_line = f"  res['{an}'] = {struct_handler_name}(o['{kn}'])"
             else:
                 tn = f"__c_type_{ix}"
@@ -499,8 +517,9 @@ def make_dict_structure_fn(
                 kn = an if override.rename is None else override.rename
                 allowed_fields.add(kn)
                 post_lines.append(f"  if '{kn}' in o:")
-                if handler == converter._structure_call:
-                    internal_arg_parts[struct_handler_name] = t
+                bound = bind_structure_hook(handler, t, converter)
+                if bound is not None:
+                    internal_arg_parts[struct_handler_name] = bound
                     post_lines.append(
                         f"    res['{ian}'] = {struct_handler_name}(o['{kn}'])"
                     )
@@ -533,16 +552,18 @@ def make_dict_structure_fn(
     ]
 
     script = "\n".join(total_lines)
-    fname = generate_unique_filename(
-        cl, "structure", lines=total_lines if _cattrs_use_linecache else []
-    )
+    if _cattrs_use_linecache == "from_converter":
+        # BaseConverter doesn't have it so we're careful.
+        _cattrs_use_linecache = getattr(converter, "use_linecache", True)
+    fname = source_filename(cl, "structure", total_lines, _cattrs_use_linecache, globs)
 
-    eval(compile(script, fname, "exec"), globs)
+    compile_and_exec(script, fname, globs, cl)
     res = globs[fn_name]
     res.overrides = kwargs
     return res
 
 
+@cache_per_class
 def _adapted_fields(cls: Any) -> list[Attribute]:
     annotations = get_annots(cls)
     hints = get_full_type_hints(cls)
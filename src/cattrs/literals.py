@@ -1,11 +1,12 @@
 from enum import Enum
 from typing import Any
 
-from ._compat import is_literal
+from ._compat import KIND_ALIAS, KIND_OTHER, is_literal, matches_kinds
 
 __all__ = ["is_literal", "is_literal_containing_enums"]
 
 
+@matches_kinds(KIND_ALIAS | KIND_OTHER)
 def is_literal_containing_enums(type: Any) -> bool:
     """Is this a literal containing at least one Enum?"""
     return is_literal(type) and any(isinstance(val, Enum) for val in type.__args__)
@@ -28,6 +28,27 @@ def wrap(_: Callable[P, Any]) -> Callable[[Callable[..., T]], Callable[P, T]]:
     return impl
 
 
+ConverterT = TypeVar("ConverterT", bound=Converter)
+
+
+def converter_factory(template: ConverterT) -> Callable[[], ConverterT]:
+    """Create a function making copies of a template converter, cheaply.
+
+    The copies are made without registering hooks again, and share the hooks of
+    the template until they are customized. The template must not be changed
+    afterwards.
+
+    .. versionadded:: NEXT
+    """
+    # Objects of the template known not to reference it, shared between copies.
+    stable: dict[int, Any] = {}
+
+    def make_converter() -> ConverterT:
+        return template._clone(stable)
+
+    return make_converter
+
+
 def is_primitive_enum(type: Any, include_bare_enums: bool = False) -> bool:
     """Is this a string or int enum that can be passed through?"""
     return is_subclass(type, Enum) and (
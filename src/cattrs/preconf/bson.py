@@ -1,7 +1,7 @@
 """Preconfigured converters for bson."""
 
 from base64 import b85decode, b85encode
-from collections.abc import Set
+from collections.abc import Callable, Set
 from datetime import date, datetime
 from typing import Any, TypeVar, Union
 
@@ -15,6 +15,7 @@ from ..fns import identity
 from ..literals import is_literal_containing_enums
 from ..strategies import configure_union_passthrough
 from . import (
+    converter_factory,
     is_primitive_enum,
     literals_with_enums_unstructure_factory,
     validate_datetime,
@@ -119,3 +120,15 @@ def make_converter(*args: Any, **kwargs: Any) -> BsonConverter:
     configure_converter(res)
 
     return res
+
+
+@wrap(BsonConverter)
+def make_converter_factory(*args: Any, **kwargs: Any) -> Callable[[], BsonConverter]:
+    """Create a function making converters like `make_converter`, cheaply.
+
+    A converter is made once, and copied on every call. See
+    `cattrs.preconf.converter_factory`.
+
+    .. versionadded:: NEXT
+    """
+    return converter_factory(make_converter(*args, **kwargs))
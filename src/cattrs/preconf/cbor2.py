@@ -1,6 +1,6 @@
 """Preconfigured converters for cbor2."""
 
-from collections.abc import Set
+from collections.abc import Callable, Set
 from datetime import date, datetime, timezone
 from typing import Any, TypeVar, Union
 
@@ -10,7 +10,12 @@ from ..converters import BaseConverter, Converter
 from ..fns import identity
 from ..literals import is_literal_containing_enums
 from ..strategies import configure_union_passthrough
-from . import is_primitive_enum, literals_with_enums_unstructure_factory, wrap
+from . import (
+    converter_factory,
+    is_primitive_enum,
+    literals_with_enums_unstructure_factory,
+    wrap,
+)
 
 T = TypeVar("T")
 
@@ -54,3 +59,15 @@ def make_converter(*args: Any, **kwargs: Any) -> Cbor2Converter:
     configure_converter(res)
 
     return res
+
+
+@wrap(Cbor2Converter)
+def make_converter_factory(*args: Any, **kwargs: Any) -> Callable[[], Cbor2Converter]:
+    """Create a function making converters like `make_converter`, cheaply.
+
+    A converter is made once, and copied on every call. See
+    `cattrs.preconf.converter_factory`.
+
+    .. versionadded:: NEXT
+    """
+    return converter_factory(make_converter(*args, **kwargs))
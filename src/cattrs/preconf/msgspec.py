@@ -32,9 +32,14 @@ from ..fns import identity
 from ..gen import make_hetero_tuple_unstructure_fn
 from ..literals import is_literal_containing_enums
 from ..strategies import configure_union_passthrough
-from . import literals_with_enums_unstructure_factory, wrap
+from . import converter_factory, literals_with_enums_unstructure_factory, wrap
 
-__all__ = ["MsgspecJsonConverter", "configure_converter", "make_converter"]
+__all__ = [
+    "MsgspecJsonConverter",
+    "configure_converter",
+    "make_converter",
+    "make_converter_factory",
+]
 
 T = TypeVar("T")
 _already_probing = local()
@@ -107,6 +112,20 @@ def make_converter(*args: Any, **kwargs: Any) -> MsgspecJsonConverter:
     return res
 
 
+@wrap(MsgspecJsonConverter)
+def make_converter_factory(
+    *args: Any, **kwargs: Any
+) -> Callable[[], MsgspecJsonConverter]:
+    """Create a function making converters like `make_converter`, cheaply.
+
+    A converter is made once, and copied on every call. See
+    `cattrs.preconf.converter_factory`.
+
+    .. versionadded:: NEXT
+    """
+    return converter_factory(make_converter(*args, **kwargs))
+
+
 def configure_passthroughs(converter: Converter) -> None:
     """Configure optimizing passthroughs.
 
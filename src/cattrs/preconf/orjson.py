@@ -1,7 +1,7 @@
 """Preconfigured converters for orjson."""
 
 from base64 import b85decode, b85encode
-from collections.abc import Set
+from collections.abc import Callable, Set
 from datetime import date, datetime
 from enum import Enum
 from functools import partial
@@ -15,9 +15,19 @@ from ..converters import Converter
 from ..fns import identity
 from ..literals import is_literal_containing_enums
 from ..strategies import configure_union_passthrough
-from . import is_primitive_enum, literals_with_enums_unstructure_factory, wrap
-
-__all__ = ["OrjsonConverter", "configure_converter", "make_converter"]
+from . import (
+    converter_factory,
+    is_primitive_enum,
+    literals_with_enums_unstructure_factory,
+    wrap,
+)
+
+__all__ = [
+    "OrjsonConverter",
+    "configure_converter",
+    "make_converter",
+    "make_converter_factory",
+]
 
 T = TypeVar("T")
 
@@ -106,3 +116,15 @@ def make_converter(*args: Any, **kwargs: Any) -> OrjsonConverter:
     configure_converter(res)
 
     return res
+
+
+@wrap(OrjsonConverter)
+def make_converter_factory(*args: Any, **kwargs: Any) -> Callable[[], OrjsonConverter]:
+    """Create a function making converters like `make_converter`, cheaply.
+
+    A converter is made once, and copied on every call. See
+    `cattrs.preconf.converter_factory`.
+
+    .. versionadded:: NEXT
+    """
+    return converter_factory(make_converter(*args, **kwargs))
@@ -1,5 +1,6 @@
 """Preconfigured converters for pyyaml."""
 
+from collections.abc import Callable
 from datetime import date, datetime
 from functools import partial
 from typing import Any, TypeVar, Union
@@ -10,9 +11,14 @@ from .._compat import FrozenSetSubscriptable
 from ..cols import is_namedtuple, namedtuple_unstructure_factory
 from ..converters import BaseConverter, Converter
 from ..strategies import configure_union_passthrough
-from . import validate_datetime, wrap
+from . import converter_factory, validate_datetime, wrap
 
-__all__ = ["PyyamlConverter", "configure_converter", "make_converter"]
+__all__ = [
+    "PyyamlConverter",
+    "configure_converter",
+    "make_converter",
+    "make_converter_factory",
+]
 
 T = TypeVar("T")
 
@@ -72,3 +78,15 @@ def make_converter(*args: Any, **kwargs: Any) -> PyyamlConverter:
     configure_converter(res)
 
     return res
+
+
+@wrap(PyyamlConverter)
+def make_converter_factory(*args: Any, **kwargs: Any) -> Callable[[], PyyamlConverter]:
+    """Create a function making converters like `make_converter`, cheaply.
+
+    A converter is made once, and copied on every call. See
+    `cattrs.preconf.converter_factory`.
+
+    .. versionadded:: NEXT
+    """
+    return converter_factory(make_converter(*args, **kwargs))
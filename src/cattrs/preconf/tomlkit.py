@@ -1,7 +1,7 @@
 """Preconfigured converters for tomlkit."""
 
 from base64 import b85decode, b85encode
-from collections.abc import Set
+from collections.abc import Callable, Set
 from datetime import date, datetime
 from enum import Enum
 from operator import attrgetter
@@ -14,9 +14,14 @@ from .._compat import is_mapping, is_subclass
 from ..converters import BaseConverter, Converter
 from ..fns import identity
 from ..strategies import configure_union_passthrough
-from . import validate_datetime, wrap
+from . import converter_factory, validate_datetime, wrap
 
-__all__ = ["TomlkitConverter", "configure_converter", "make_converter"]
+__all__ = [
+    "TomlkitConverter",
+    "configure_converter",
+    "make_converter",
+    "make_converter_factory",
+]
 
 T = TypeVar("T")
 _enum_value_getter = attrgetter("_value_")
@@ -93,3 +98,15 @@ def make_converter(*args: Any, **kwargs: Any) -> TomlkitConverter:
     configure_converter(res)
 
     return res
+
+
+@wrap(TomlkitConverter)
+def make_converter_factory(*args: Any, **kwargs: Any) -> Callable[[], TomlkitConverter]:
+    """Create a function making converters like `make_converter`, cheaply.
+
+    A converter is made once, and copied on every call. See
+    `cattrs.preconf.converter_factory`.
+
+    .. versionadded:: NEXT
+    """
+    return converter_factory(make_converter(*args, **kwargs))
@@ -5,7 +5,7 @@ from __future__ import annotations
 import sys
 from typing import TYPE_CHECKING, Any
 
-from ._compat import is_generic
+from ._compat import KIND_ALIAS, KIND_OTHER, is_generic, matches_kinds
 from ._generics import deep_copy_with
 from .dispatch import StructureHook
 from .gen._generics import generate_mapping
@@ -19,6 +19,7 @@ if sys.version_info >= (3, 12):
     from types import GenericAlias
     from typing import TypeAliasType
 
+    @matches_kinds(KIND_ALIAS | KIND_OTHER)
     def is_type_alias(type: Any) -> bool:
         """Is this a PEP 695 type alias?"""
         return isinstance(
@@ -27,6 +28,7 @@ if sys.version_info >= (3, 12):
 
 else:
 
+    @matches_kinds(KIND_ALIAS | KIND_OTHER)
     def is_type_alias(type: Any) -> bool:
         """Is this a PEP 695 type alias?"""
         return False
@@ -0,0 +1,78 @@
+"""Tests for structuring without calling `__init__`."""
+
+from dataclasses import dataclass
+from dataclasses import field as dc_field
+
+import pytest
+from attrs import Factory, define, field, frozen, validators
+from hypothesis import given
+
+from cattrs import Converter
+from cattrs.errors import ClassValidationError
+from cattrs.gen import make_dict_structure_fn
+
+from .typed import nested_typed_classes
+
+
+@frozen
+class Frozen:
+    a: int = field(validator=validators.gt(0))
+    b: str = "b"
+    c: list[int] = Factory(list)
+    d: int = Factory(lambda self: self.a + 1, takes_self=True)
+    e: int = field(init=False, default=5)
+
+
+@define(slots=False)
+class Dict:
+    a: int = field(validator=validators.gt(0))
+    b: float = 1.0
+
+
+@dataclass(frozen=True)
+class Dataclass:
+    a: int
+    b: list[int] = dc_field(default_factory=list)
+
+
+@define
+class PostInit:
+    a: int
+    b: int = field(init=False)
+
+    def __attrs_post_init__(self):
+        self.b = self.a * 2
+
+
+@given(cl_and_vals=nested_typed_classes(allow_nan=False), detailed_validation=...)
+def test_roundtrip(cl_and_vals, detailed_validation: bool):
+    """Instances created without `__init__` are equal to the originals."""
+    cl, vals, kwargs = cl_and_vals
+    inst = cl(*vals, **kwargs)
+    converter = Converter(detailed_validation=detailed_validation, bypass_init=True)
+
+    assert converter.structure(converter.unstructure(inst), cl) == inst
+
+
+@given(detailed_validation=...)
+def test_bypass(detailed_validation: bool):
+    """Validators are skipped, and defaults and factories filled in."""
+    converter = Converter(detailed_validation=detailed_validation, bypass_init=True)
+
+    res = converter.structure({"a": -1}, Frozen)
+    assert (res.a, res.b, res.c, res.d, res.e) == (-1, "b", [], 0, 5)
+    assert converter.structure({"a": 1, "c": [1], "d": 3}, Frozen).d == 3
+
+    assert converter.structure({"a": "-1"}, Dict).__dict__ == {"a": -1, "b": 1.0}
+    assert converter.structure({"a": 1}, Dataclass) == Dataclass(1, [])
+
+
+def test_init_called():
+    """Classes relying on `__init__` are still instantiated normally."""
+    converter = Converter(bypass_init=True)
+
+    assert converter.structure({"a": 1}, PostInit).b == 2
+
+    hook = make_dict_structure_fn(Frozen, converter, _cattrs_bypass_init=False)
+    with pytest.raises(ClassValidationError):
+        hook({"a": -1}, Frozen)
@@ -0,0 +1,102 @@
+"""Tests for converter factories, cloning prebuilt converters."""
+
+from datetime import datetime, timezone
+from typing import Union
+
+from attrs import define
+
+from cattrs import Converter
+from cattrs.preconf.json import JsonConverter
+from cattrs.preconf.json import make_converter as json_make_converter
+from cattrs.preconf.json import make_converter_factory as json_make_converter_factory
+
+
+@define
+class Inner:
+    a: int
+    dt: datetime
+
+
+@define
+class Outer:
+    inner: Inner
+    inners: list[Inner]
+    other: Union[int, str, None] = None
+
+
+RAW = {
+    "inner": {"a": 1, "dt": "2024-01-01T00:00:00+00:00"},
+    "inners": [{"a": 2, "dt": "2024-01-02T00:00:00+00:00"}],
+    "other": "a",
+}
+
+
+def test_factory_converters():
+    """Converters from factories behave like freshly made ones."""
+    factory = json_make_converter_factory(omit_if_default=True)
+    c = factory()
+    expected = json_make_converter(omit_if_default=True)
+
+    assert isinstance(c, JsonConverter)
+    assert c.omit_if_default
+    assert c.structure(RAW, Outer) == expected.structure(RAW, Outer)
+    obj = expected.structure(RAW, Outer)
+    assert c.unstructure(obj) == expected.unstructure(obj)
+    assert c.loads(c.dumps(obj), Outer) == obj
+    assert factory() is not c
+
+
+def test_factory_converters_independent():
+    """Hooks registered on a factory converter stay on it."""
+    factory = json_make_converter_factory()
+    first = factory()
+    second = factory()
+
+    first.register_structure_hook(int, lambda v, _: int(v) + 1)
+    first.register_unstructure_hook(
+        datetime, lambda dt: dt.replace(tzinfo=None).isoformat()
+    )
+
+    assert first.structure("1", int) == 2
+    assert second.structure(1, int) == 1
+    assert factory().structure(1, int) == 1
+
+    dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert first.unstructure(dt) == "2024-01-01T00:00:00"
+    assert second.unstructure(dt) == "2024-01-01T00:00:00+00:00"
+    assert factory().unstructure(dt) == "2024-01-01T00:00:00+00:00"
+
+
+def test_clone_rebinds():
+    """Hooks and predicates of clones refer to the clones."""
+    c = Converter()
+    clone = c._clone()
+
+    assert clone._structure_func is not c._structure_func
+    assert clone._union_struct_registry is not c._union_struct_registry
+
+    # Union hooks registered on the clone are picked up by its own predicates.
+    clone.register_structure_hook(
+        Union[int, str], lambda v, _: "clone" if v is None else v
+    )
+    assert clone.structure(None, Union[int, str]) == "clone"
+    assert c._union_struct_registry == {}
+
+    # Nested hooks are fetched from the clone.
+    clone.register_structure_hook(int, lambda v, _: int(v) * 2)
+    assert clone.structure([1], list[int]) == [2]
+    assert c.structure([1], list[int]) == [1]
+
+
+def test_clone_copy():
+    """Clones can be copied."""
+    factory = json_make_converter_factory()
+    clone = factory()
+    clone.structure(RAW, Outer)
+
+    copy = clone.copy()
+    assert copy.structure(RAW, Outer) == clone.structure(RAW, Outer)
+
+    copy.register_structure_hook(int, lambda v, _: -v)
+    assert copy.structure(1, int) == -1
+    assert clone.structure(1, int) == 1
@@ -0,0 +1,101 @@
+"""Tests for the code cache of generated functions."""
+
+import pytest
+from attrs import define
+
+from cattrs import Converter
+from cattrs.gen import set_code_cache
+
+
+@define
+class Inner:
+    a: int
+
+
+@define
+class Outer:
+    inner: Inner
+    inners: dict[str, Inner]
+
+
+@pytest.fixture
+def code_cache(tmp_path):
+    set_code_cache(tmp_path)
+    yield next(tmp_path.iterdir())
+    set_code_cache(None)
+
+
+def roundtrip(c: Converter) -> None:
+    raw = {"inner": {"a": 1}, "inners": {"a": {"a": 2}}}
+    assert c.unstructure(c.structure(raw, Outer)) == raw
+
+
+def test_code_cache(code_cache):
+    """Generated code is cached, and loaded instead of compiled later."""
+    c = Converter()
+    c.enable_stats()
+    roundtrip(c)
+    stats = c.stats()
+    compiled = stats.structure.compiled + stats.unstructure.compiled
+    loaded = stats.structure.code_cache_hits + stats.unstructure.code_cache_hits
+
+    assert compiled > 0
+    assert len(list(code_cache.iterdir())) == compiled
+
+    c = Converter()
+    c.enable_stats()
+    roundtrip(c)
+    stats = c.stats()
+
+    assert stats.structure.compiled == stats.unstructure.compiled == 0
+    assert (
+        stats.structure.code_cache_hits + stats.unstructure.code_cache_hits
+        == compiled + loaded
+    )
+
+
+def test_code_cache_options(code_cache):
+    """Different converter options lead to different entries."""
+    roundtrip(Converter())
+    entries = set(code_cache.iterdir())
+
+    c = Converter(forbid_extra_keys=True)
+    c.enable_stats()
+    roundtrip(c)
+
+    assert c.stats().structure.compiled > 0
+    assert c.stats().unstructure.compiled == 0
+    assert set(code_cache.iterdir()) > entries
+
+
+def test_code_cache_corrupted(code_cache):
+    """Corrupted entries are compiled again."""
+    roundtrip(Converter())
+    for entry in code_cache.iterdir():
+        entry.write_bytes(b"garbage")
+
+    c = Converter()
+    c.enable_stats()
+    roundtrip(c)
+
+    assert c.stats().structure.compiled > 0
+    assert all(entry.read_bytes() != b"garbage" for entry in code_cache.iterdir())
+
+
+def test_code_cache_mismatched(code_cache):
+    """Entries are only loaded for the source they were compiled from."""
+    roundtrip(Converter())
+    entries = sorted(code_cache.iterdir())
+    contents = entries[0].read_bytes()
+    for entry in entries[1:]:
+        entry.write_bytes(contents)
+
+    c = Converter()
+    c.enable_stats()
+    roundtrip(c)
+
+    assert (
+        c.stats().structure.compiled + c.stats().unstructure.compiled
+        == len(entries) - 1
+    )
+    assert len({entry.read_bytes() for entry in code_cache.iterdir()}) == len(entries)
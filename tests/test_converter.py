@@ -811,6 +811,28 @@ def test_hook_getting(converter: BaseConverter):
     assert structure({"a": 1}, Test) == Test(1)
 
 
+def test_bound_hook_getting(converter: BaseConverter):
+    """Converters can produce single-argument structure hooks."""
+
+    @define
+    class Test:
+        a: int
+        b: list[str]
+
+    class Custom:
+        def __init__(self, a):
+            self.a = a
+
+    converter.register_structure_hook(Custom, lambda v, t: t(v))
+
+    assert converter.get_bound_structure_hook(int) is int
+    assert converter.get_bound_structure_hook(Test)({"a": 1, "b": [1]}) == Test(
+        1, ["1"]
+    )
+    assert converter.get_bound_structure_hook(list[int])(["1"]) == [1]
+    assert converter.get_bound_structure_hook(Custom)(1).a == 1
+
+
 def test_decorators(converter: BaseConverter):
     """The decorator versions work."""
 
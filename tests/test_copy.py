@@ -237,3 +237,66 @@ def test_col_overrides(
 
     assert c.unstructure(Simple(1)) == 1
     assert copy.unstructure(Simple(1)) == 1
+
+
+@define
+class Nested:
+    simple: Simple
+    simples: list[Simple]
+
+
+def test_copies_share_hooks(converter_cls: type[BaseConverter]):
+    """Copies share the hooks of the original, per direction."""
+    c = converter_cls()
+    c.structure({"simple": {"a": 1}, "simples": []}, Nested)
+    c.unstructure(Nested(Simple(1), []))
+
+    copy = c.copy(detailed_validation=False)
+
+    assert copy.get_unstructure_hook(Nested) is c.get_unstructure_hook(Nested)
+    assert copy.get_structure_hook(Nested) is not c.get_structure_hook(Nested)
+
+    # Hooks for new types are generated once, by the original converter.
+    copy = c.copy()
+    assert copy.get_structure_hook(list[Nested]) is c.get_structure_hook(list[Nested])
+
+
+def test_copies_fork_on_divergence(converter_cls: type[BaseConverter]):
+    """Copies stop sharing hooks when either converter changes."""
+    c = converter_cls()
+    raw = {"simple": {"a": 1}, "simples": [{"a": 1}]}
+    assert c.structure(raw, Nested) == Nested(Simple(1), [Simple(1)])
+
+    copy = c.copy()
+    copy_of_copy = copy.copy()
+    assert copy.structure(raw, Nested) == Nested(Simple(1), [Simple(1)])
+    assert copy_of_copy.structure(raw, Nested) == Nested(Simple(1), [Simple(1)])
+
+    copy.register_structure_hook(int, lambda v, _: v + 1)
+
+    assert c.structure(raw, Nested) == Nested(Simple(1), [Simple(1)])
+    assert copy.structure(raw, Nested) == Nested(Simple(2), [Simple(2)])
+    assert copy_of_copy.structure(raw, Nested) == Nested(Simple(1), [Simple(1)])
+
+    other_copy = c.copy()
+    assert other_copy.structure(raw, Nested) == Nested(Simple(1), [Simple(1)])
+
+    c.register_structure_hook(int, lambda v, _: v + 2)
+
+    assert c.structure(raw, Nested) == Nested(Simple(3), [Simple(3)])
+    assert other_copy.structure(raw, Nested) == Nested(Simple(1), [Simple(1)])
+    assert copy.structure(raw, Nested) == Nested(Simple(2), [Simple(2)])
+    assert copy_of_copy.structure(raw, Nested) == Nested(Simple(1), [Simple(1)])
+
+
+def test_copies_with_other_strategy(converter_cls: type[BaseConverter]):
+    """Copies with another unstructuring strategy do not share hooks."""
+    c = converter_cls()
+    assert c.structure({"a": 1}, Simple) == Simple(1)
+    assert c.unstructure(Simple(1)) == {"a": 1}
+
+    copy = c.copy(unstruct_strat=UnstructureStrategy.AS_TUPLE)
+
+    assert copy.structure((1,), Simple) == Simple(1)
+    assert copy.unstructure(Simple(1)) == (1,)
+    assert c.structure({"a": 1}, Simple) == Simple(1)
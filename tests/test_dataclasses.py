@@ -1,10 +1,13 @@
 import dataclasses
-from typing import List
+import gc
+from typing import List, Optional
+from weakref import ref
 
 import attr
 import pytest
 
-from cattrs import BaseConverter
+from cattrs import BaseConverter, Converter
+from cattrs._compat import adapted_fields
 
 from ._compat import is_py310_plus
 
@@ -61,3 +64,31 @@ def test_kw_only_propagation(converter: BaseConverter):
     assert converter.structure({"a2": "Value"}, PartialKeywords) == PartialKeywords(
         a1="Default", a2="Value"
     )
+
+
+def test_adapted_fields_cached():
+    """Adapted fields are resolved once per class, and don't keep classes alive."""
+
+    @dataclasses.dataclass
+    class Base:
+        a: "int"
+        b: "Optional[str]" = None
+
+    @dataclasses.dataclass
+    class Sub(Base):
+        c: "List[int]" = dataclasses.field(default_factory=list)
+
+    fields = adapted_fields(Base)
+
+    assert adapted_fields(Base) is fields
+    assert [a.type for a in fields] == [int, Optional[str]]
+    assert [a.type for a in adapted_fields(Sub)] == [int, Optional[str], List[int]]
+
+    c = Converter()
+    assert c.structure({"a": 1, "c": [2]}, Sub) == Sub(1, c=[2])
+
+    r = ref(Sub)
+    del Sub, c
+    gc.collect()
+
+    assert r() is None
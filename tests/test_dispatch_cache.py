@@ -0,0 +1,119 @@
+"""Tests for the dispatch cache modes."""
+
+import gc
+from weakref import ref
+
+import pytest
+from attrs import define, field, make_class
+
+from cattrs import BaseConverter, Converter
+from cattrs.dispatch import MultiStrategyDispatch
+
+
+@pytest.mark.parametrize("converter_cls", [BaseConverter, Converter])
+def test_weak_cache_collects_classes(converter_cls):
+    """Dynamically created classes, and their hooks, can be collected."""
+    c = converter_cls(dispatch_cache="weak", dispatch_cache_maxsize=8)
+
+    refs = []
+    for i in range(50):
+        cl = make_class(f"Dynamic{i}", {"a": field(type=int)})
+        assert c.structure(c.unstructure(cl(1)), cl) == cl(1)
+        assert c.structure([{"a": 1}], list[cl]) == [cl(1)]
+        refs.append(ref(cl))
+        del cl
+
+    gc.collect()
+
+    # Only classes referenced by the bounded cache of generic aliases survive.
+    assert sum(r() is not None for r in refs) <= 8
+
+
+@pytest.mark.parametrize("converter_cls", [BaseConverter, Converter])
+def test_strong_cache_keeps_classes(converter_cls):
+    """The default cache keeps classes alive."""
+    c = converter_cls()
+
+    cl = make_class("Dynamic", {"a": field(type=int)})
+    c.structure({"a": 1}, cl)
+    r = ref(cl)
+    del cl
+
+    gc.collect()
+
+    assert r() is not None
+
+
+@pytest.mark.parametrize("converter_cls", [BaseConverter, Converter])
+def test_weak_cache(converter_cls):
+    """The weak cache works for all kinds of types, and is invalidated."""
+
+    @define
+    class A:
+        a: int
+
+    c = converter_cls(dispatch_cache="weak")
+
+    assert c.structure({"a": "1"}, A) == A(1)
+    assert c.structure("1", int) == 1
+    assert c.structure(["1"], list[int]) == [1]
+    assert c.unstructure(A(1)) == {"a": 1}
+
+    c.register_structure_hook(A, lambda v, _: A(0))
+    c.register_structure_hook(int, lambda v, _: 0)
+
+    assert c.structure({"a": "1"}, A) == A(0)
+    assert c.structure("1", int) == 0
+    assert c.structure(["1"], list[int]) == [0]
+
+    copy = c.copy()
+    assert copy._structure_func._cache.__class__ is c._structure_func._cache.__class__
+    assert copy.structure({"a": "1"}, A) == A(0)
+
+
+def test_weak_caches_are_independent():
+    """Weak caches of different converters do not interfere."""
+
+    @define
+    class A:
+        a: int
+
+    c1 = Converter(dispatch_cache="weak")
+    c2 = Converter(dispatch_cache="weak")
+    c2.register_structure_hook(A, lambda v, _: A(0))
+
+    assert c1.structure({"a": "1"}, A) == A(1)
+    assert c2.structure({"a": "1"}, A) == A(0)
+
+    c1.register_unstructure_hook(A, lambda v: "a")
+    assert c1.unstructure(A(1)) == "a"
+    assert c2.unstructure(A(1)) == {"a": 1}
+
+    del c1
+    gc.collect()
+
+    # Entries of collected caches are cleaned up.
+    assert c2.structure({"a": "1"}, A) == A(0)
+    assert len(A.__cattrs_dispatch_cache__) == 2
+
+
+def test_bounded_strong_cache():
+    """Strong caches can be bounded."""
+    calls = []
+
+    def fallback(t):
+        calls.append(t)
+        return lambda v: v
+
+    dispatch = MultiStrategyDispatch(fallback, BaseConverter(), cache_maxsize=1)
+    dispatch.dispatch(int)
+    dispatch.dispatch(int)
+    dispatch.dispatch(str)
+    dispatch.dispatch(int)
+
+    assert calls == [int, str, int]
+
+
+def test_unknown_cache_mode():
+    with pytest.raises(ValueError):
+        BaseConverter(dispatch_cache="nope")
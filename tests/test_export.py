@@ -0,0 +1,139 @@
+"""Tests for exporting generated hooks."""
+
+from enum import Enum
+from importlib.util import module_from_spec, spec_from_file_location
+from typing import Literal, Optional
+
+import pytest
+from attrs import define, field
+
+from cattrs import Converter
+from cattrs.gen.export import export_hooks, main
+
+
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+@define
+class Inner:
+    a: int
+    b: list[str] = field(factory=list)
+    c: Literal["x", "y"] = "x"
+
+
+@define
+class Outer:
+    inner: Inner
+    inners: dict[str, Inner]
+    color: Color = Color.RED
+    d: dict[str, int] = field(factory=dict)
+    t: tuple[int, ...] = ()
+    o: Optional[int] = None
+
+
+RAW = {
+    "inner": {"a": 1, "b": ["b"]},
+    "inners": {"a": {"a": 2, "c": "y"}},
+    "color": "blue",
+    "d": {"a": 1},
+    "t": [1, 2],
+    "o": 1,
+}
+
+
+def load(path):
+    spec = spec_from_file_location(path.stem, path)
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize("omit_if_default", [False, True])
+def test_export(tmp_path, omit_if_default):
+    """Exported hooks work like generated ones, without compiling anything."""
+    path = tmp_path / "hooks.py"
+    path.write_text(export_hooks(Converter(omit_if_default=omit_if_default), [Outer]))
+    hooks = load(path)
+
+    c = Converter(omit_if_default=omit_if_default)
+    c.enable_stats()
+    hooks.register(c)
+    expected = Converter(omit_if_default=omit_if_default)
+
+    obj = c.structure(RAW, Outer)
+    assert obj == expected.structure(RAW, Outer)
+    assert c.unstructure(obj) == expected.unstructure(obj)
+
+    stats = c.stats()
+    assert stats.structure.compiled == stats.unstructure.compiled == 0
+    assert c.get_structure_hook(Outer).__code__.co_filename == str(path)
+
+
+def test_export_leaves_converter_alone():
+    """Exporting does not generate hooks in the given converter."""
+    c = Converter()
+    export_hooks(c, [Outer])
+
+    assert Outer not in c._structure_func._cache
+
+
+def test_unexportable(tmp_path):
+    """Hooks referring to objects that cannot be imported are left out."""
+
+    @define
+    class Local:
+        inner: Inner
+
+    path = tmp_path / "hooks.py"
+    path.write_text(export_hooks(Converter(), [Local], ["structure"]))
+    hooks = load(path)
+
+    c = Converter()
+    hooks.register(c)
+    c.enable_stats()
+
+    assert c.structure({"inner": {"a": 1}}, Local) == Local(Inner(1))
+    # The hook for `Inner` was exported; the hook for `Local` was generated.
+    assert c.get_structure_hook(Inner).__code__.co_filename == str(path)
+    assert c.stats().structure.compiled == 1
+
+
+def test_registering_after_install(tmp_path):
+    """Installed hooks are dropped when hooks they depend on change."""
+    path = tmp_path / "hooks.py"
+    path.write_text(export_hooks(Converter(), [Outer]))
+    hooks = load(path)
+
+    c = Converter()
+    hooks.register(c)
+    assert c.structure(RAW, Outer).inner == Inner(1, ["b"])
+
+    c.register_structure_hook(int, lambda v, _: 42)
+    c.register_unstructure_hook(str, lambda v: v.upper())
+
+    obj = c.structure(RAW, Outer)
+    assert obj.inner == Inner(42, ["b"])
+    assert obj.t == (42, 42)
+    assert c.unstructure(obj)["inner"]["b"] == ["B"]
+
+
+def test_cli(tmp_path, capsys):
+    """The command line interface writes modules."""
+    path = tmp_path / "hooks.py"
+    main([f"{__name__}:Outer", "--converter", f"{__name__}:CONVERTER", "-o", str(path)])
+    hooks = load(path)
+
+    c = Converter()
+    hooks.register(c)
+    assert c.structure(RAW, Outer) == CONVERTER.structure(RAW, Outer)
+
+    main([f"{__name__}:TYPES", "--direction", "unstructure"])
+    out = capsys.readouterr().out
+    assert "def unstructure_Inner" in out
+    assert "def structure_Inner" not in out
+
+
+CONVERTER = Converter()
+TYPES = [Inner, Outer]
@@ -0,0 +1,68 @@
+"""Tests for frozen converters."""
+
+from typing import Union
+
+import pytest
+from attrs import define
+
+from cattrs import BaseConverter, Converter
+from cattrs.errors import FrozenConverterError
+
+
+@define
+class A:
+    a: int
+
+
+@define
+class B:
+    b: list[A]
+
+
+@pytest.mark.parametrize("converter_cls", [BaseConverter, Converter])
+@pytest.mark.parametrize("dispatch_cache", ["strong", "weak"])
+def test_freeze(converter_cls, dispatch_cache):
+    """Frozen converters keep working, and refuse registrations."""
+    c = converter_cls(dispatch_cache=dispatch_cache)
+    c.register_structure_hook(int, lambda v, _: int(v) + 1)
+
+    assert c.structure({"a": "1"}, A) == A(2)
+    assert not c.frozen
+
+    c.freeze()
+
+    assert c.frozen
+    assert c.structure({"a": "1"}, A) == A(2)
+    # Types not seen before are still handled.
+    assert c.structure({"b": [{"a": "1"}]}, B) == B([A(2)])
+    assert c.unstructure(B([A(1)])) == {"b": [{"a": 1}]}
+
+    with pytest.raises(FrozenConverterError):
+        c.register_structure_hook(A, lambda v, _: A(0))
+    with pytest.raises(FrozenConverterError):
+        c.register_unstructure_hook(A, lambda v: 0)
+    with pytest.raises(FrozenConverterError):
+        c.register_structure_hook_func(lambda t: t is A, lambda v, _: A(0))
+    with pytest.raises(FrozenConverterError):
+        c.register_unstructure_hook_factory(lambda t: t is A, lambda t: lambda v: 0)
+    with pytest.raises(FrozenConverterError):
+        c.register_structure_hook(Union[A, B], lambda v, _: A(0))
+
+    assert c.structure({"a": "1"}, A) == A(2)
+
+    copy = c.copy()
+    assert not copy.frozen
+    copy.register_structure_hook(A, lambda v, _: A(0))
+    assert copy.structure({"a": "1"}, A) == A(0)
+
+
+def test_freeze_dispatch_is_dict_lookup():
+    """Frozen dispatches are plain dictionary lookups."""
+    c = Converter(dispatch_cache="weak")
+    c.structure({"a": 1}, A)
+
+    c.freeze()
+
+    cache = c._structure_func.dispatch.__self__
+    assert isinstance(cache, dict)
+    assert A in cache
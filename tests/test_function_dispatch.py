@@ -1,6 +1,42 @@
-from cattrs import BaseConverter
+from collections.abc import Mapping, MutableMapping, MutableSequence, Sequence
+from enum import Enum
+from typing import (
+    AbstractSet,
+    Annotated,
+    Any,
+    Counter,
+    DefaultDict,
+    Deque,
+    Dict,
+    FrozenSet,
+    Generic,
+    List,
+    Literal,
+    NamedTuple,
+    NewType,
+    Optional,
+    Tuple,
+    TypedDict,
+    TypeVar,
+    Union,
+)
+
+import pytest
+from attrs import define
+
+from cattrs import BaseConverter, Converter
+from cattrs._compat import (
+    KIND_ALIAS,
+    KIND_CLASS,
+    KIND_OTHER,
+    KIND_UNION,
+    matches_kinds,
+    type_kind,
+)
 from cattrs.dispatch import FunctionDispatch
 
+T = TypeVar("T")
+
 
 def test_function_dispatch():
     dispatch = FunctionDispatch(BaseConverter())
@@ -44,3 +80,147 @@ def test_function_dispatch_exception():
     dispatch.register(raising_predicate, "error")
 
     assert dispatch.dispatch(float) == "float"
+
+
+def _matches(predicate, typ) -> bool:
+    """Whether `predicate` matches `typ`. Like in dispatch, raising predicates
+    don't match."""
+    try:
+        return bool(predicate(typ))
+    except Exception:
+        return False
+
+
+def _first_match(pairs, typ):
+    """Return the first handler pair matching `typ`."""
+    return next((pair for pair in pairs if _matches(pair[0], typ)), None)
+
+
+@pytest.mark.parametrize("converter_cls", [BaseConverter, Converter])
+def test_kind_index_matches_linear_scan(converter_cls):
+    """The kind index does not change dispatch results for the default hooks."""
+
+    @define
+    class A:
+        a: int
+
+    @define
+    class G(Generic[T]):
+        a: T
+
+    class E(Enum):
+        A = "a"
+
+    class NT(NamedTuple):
+        a: int
+
+    class TD(TypedDict):
+        a: int
+
+    types = [
+        int,
+        str,
+        A,
+        G,
+        G[int],
+        E,
+        NT,
+        TD,
+        list,
+        list[int],
+        List[A],
+        tuple[int, ...],
+        tuple[int, str],
+        Tuple[int, str],
+        dict[str, A],
+        Dict[str, int],
+        Mapping[str, int],
+        MutableMapping[str, int],
+        Counter[str],
+        DefaultDict[str, int],
+        set[int],
+        FrozenSet[int],
+        AbstractSet[int],
+        Sequence[int],
+        MutableSequence[int],
+        Deque[int],
+        Optional[int],
+        Union[int, str],
+        Union[A, None],
+        Literal[1, 2],
+        Literal[E.A],
+        Annotated[int, "meta"],
+        NewType("NT", int),
+        T,
+        Any,
+        "A",
+    ]
+
+    converter = converter_cls()
+    for dispatch in (
+        converter._structure_func._function_dispatch,
+        converter._unstructure_func._function_dispatch,
+    ):
+        for t in types:
+            assert _first_match(dispatch._handlers_for(t), t) == _first_match(
+                dispatch._handler_pairs, t
+            ), t
+
+
+def test_unmarked_predicates_match_all_kinds():
+    """Predicates without kind marks are evaluated for every type."""
+    dispatch = FunctionDispatch(BaseConverter())
+
+    dispatch.register(lambda _: True, "any")
+
+    for t in (int, list[int], Optional[int], Literal[1], T):
+        assert dispatch.dispatch(t) == "any"
+
+
+def test_kind_index_preserves_precedence():
+    """Later registrations take precedence, across kinds."""
+    dispatch = FunctionDispatch(BaseConverter())
+
+    dispatch.register(matches_kinds(KIND_CLASS)(lambda _: True), "class")
+    dispatch.register(matches_kinds(KIND_UNION)(lambda _: True), "union")
+
+    assert dispatch.dispatch(int) == "class"
+    assert dispatch.dispatch(Optional[int]) == "union"
+    assert dispatch.dispatch(list[int]) is None
+
+    dispatch.register(lambda _: True, "any")
+
+    assert dispatch.dispatch(int) == "any"
+    assert dispatch.dispatch(Optional[int]) == "any"
+    assert dispatch.dispatch(list[int]) == "any"
+
+
+def test_kind_index_invalidation():
+    """The kind index is rebuilt after registrations and copies."""
+    dispatch = FunctionDispatch(BaseConverter())
+
+    dispatch.register(lambda _: False, "base")
+    dispatch.register(matches_kinds(KIND_CLASS)(lambda _: True), "class")
+    assert dispatch.dispatch(int) == "class"
+
+    other = FunctionDispatch(BaseConverter())
+    other.register(matches_kinds(KIND_ALIAS)(lambda _: True), "alias")
+    assert other.dispatch(int) is None
+    assert other.dispatch(list[int]) == "alias"
+
+    dispatch.copy_to(other, skip=1)
+
+    assert other.dispatch(int) == "class"
+    assert other.dispatch(list[int]) == "alias"
+
+
+def test_type_kind():
+    """Types are classified into kinds correctly."""
+    assert type_kind(int) == KIND_CLASS
+    assert type_kind(list[int]) == KIND_ALIAS
+    assert type_kind(List[int]) == KIND_ALIAS
+    assert type_kind(Optional[int]) == KIND_UNION
+    assert type_kind(Union[int, str]) == KIND_UNION
+    assert type_kind(Literal[1]) == KIND_ALIAS
+    assert type_kind(T) == KIND_OTHER
+    assert type_kind("int") == KIND_OTHER
@@ -6,7 +6,11 @@ from traceback import format_exc
 from attrs import define
 
 from cattrs import Converter
-from cattrs.gen import make_dict_structure_fn, make_dict_unstructure_fn
+from cattrs.gen import (
+    make_dict_structure_fn,
+    make_dict_unstructure_fn,
+    set_linecache_limit,
+)
 
 
 def test_structure_linecache():
@@ -92,3 +96,49 @@ def test_linecache_dedup():
     c.structure(c.unstructure(LinecacheA(1)), LinecacheA)
 
     assert len(linecache.cache) == after
+
+
+def test_lazy_linecache():
+    """Linecaching can be lazy, only happening when formatting tracebacks."""
+
+    @define
+    class LazyA:
+        a: int
+
+    c = Converter(detailed_validation=False, use_linecache="lazy")
+    before = set(linecache.cache)
+    c.structure(c.unstructure(LazyA(1)), LazyA)
+
+    assert not {f for f in linecache.cache if "LazyA" in f} - before
+
+    try:
+        c.structure({"a": "test"}, LazyA)
+    except ValueError:
+        res = format_exc()
+        assert "'a'" in res
+    assert len({f for f in linecache.cache if "LazyA" in f} - before) == 1
+
+
+def test_linecache_limit():
+    """The number of functions with cached lines can be limited."""
+
+    @define
+    class LimitedA:
+        a: int
+
+    @define
+    class LimitedB:
+        a: int
+
+    c = Converter()
+    set_linecache_limit(1)
+    try:
+        c.structure(c.unstructure(LimitedA(1)), LimitedA)
+        c.structure(c.unstructure(LimitedB(1)), LimitedB)
+    finally:
+        set_linecache_limit(None)
+
+    cached = [f for f in linecache.cache if f.startswith("<cattrs")]
+    assert not [f for f in cached if "LimitedA" in f]
+    # Only the last function generated is left.
+    assert [f.split()[2] for f in cached if "LimitedB" in f] == ["structure"]
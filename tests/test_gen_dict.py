@@ -1,7 +1,8 @@
 """Tests for generated dict functions."""
 
+from inspect import signature
 from math import ceil
-from typing import Annotated, Dict, Literal, Type, Union
+from typing import Annotated, Dict, Literal, Optional, Type, Union
 
 import pytest
 from attrs import NOTHING, Factory, define, field, frozen
@@ -290,6 +291,39 @@ def test_omitting_none(converter: BaseConverter):
     assert not hasattr(converter.structure({"a": 2}, A), "b")
 
 
+def test_omit_if_default_pure_factories(converter: BaseConverter):
+    """Defaults from pure factories are created once, and compared by value."""
+
+    @define
+    class A:
+        a: list[int] = Factory(list)
+        b: dict[str, int] = Factory(dict)
+        c: str = Factory(str)
+        d: list[int] = Factory(lambda: [1])
+        e: Optional[int] = None
+        f: int = field(default=None, converter=lambda v: 1 if v is None else v)
+
+    hook = make_dict_unstructure_fn(A, converter, _cattrs_omit_if_default=True)
+
+    assert hook(A()) == {}
+    assert hook(A([1], {"a": 1}, "c", [2], 1, 2)) == {
+        "a": [1],
+        "b": {"a": 1},
+        "c": "c",
+        "d": [2],
+        "e": 1,
+        "f": 2,
+    }
+    # Equal values are omitted too.
+    assert hook(A([], {}, "", [1], None, 1)) == {}
+
+    params = signature(hook).parameters
+    assert params["__c_def_a"].default == []
+    assert params["__c_def_b"].default == {}
+    assert params["__c_def_c"].default == ""
+    assert callable(params["__c_def_d"].default)
+
+
 @pytest.mark.parametrize("detailed_validation", [True, False])
 def test_omitting_structure(detailed_validation: bool):
     """Omitting fields works with generated structuring functions."""
@@ -319,6 +353,40 @@ def test_omitting_structure(detailed_validation: bool):
     assert not hasattr(structured, "b")
 
 
+@pytest.mark.parametrize("bypass_init", [True, False])
+def test_optional_fields(bypass_init: bool):
+    """Optional fields are structured in order, falling back to their defaults,
+    after omitted fields too."""
+    converter = Converter(detailed_validation=False, bypass_init=bypass_init)
+
+    @define
+    class A:
+        a: int
+        b: Optional[str] = None
+        c: list[int] = Factory(list)
+        d: int = Factory(lambda self: self.a + 1, takes_self=True)
+        e: int = 5
+        f: int = field(default=6, kw_only=True)
+        g: int = 7
+
+    converter.register_structure_hook(
+        A, make_dict_structure_fn(A, converter, b=override(omit=True))
+    )
+
+    assert converter.structure({"a": 1}, A) == A(1)
+    assert converter.structure({"a": 1}, A).c is not converter.structure({"a": 1}, A).c
+    assert converter.structure(
+        {"a": 1, "b": "b", "c": [2], "d": 3, "e": 4, "f": 5, "g": 6}, A
+    ) == A(1, None, [2], 3, 4, f=5, g=6)
+    assert converter.structure({"a": 1, "g": 2}, A) == A(1, g=2)
+
+    with pytest.raises(ForbiddenExtraKeysError) as exc_info:
+        make_dict_structure_fn(A, converter, _cattrs_forbid_extra_keys=True)(
+            {"a": 1, "g": 2, "h": 3}, A
+        )
+    assert exc_info.value.extra_fields == {"h"}
+
+
 def test_type_names_with_quotes():
     """Types with quote characters in their reprs should work."""
 
@@ -0,0 +1,121 @@
+"""Tests for generated tuple functions."""
+
+from typing import Optional
+
+import pytest
+from attrs import define, field
+from hypothesis import given
+
+from cattrs import BaseConverter, Converter, UnstructureStrategy
+from cattrs.errors import ClassValidationError
+from cattrs.gen import make_tuple_structure_fn, make_tuple_unstructure_fn, override
+from cattrs.v import transform_error
+
+from .typed import nested_typed_classes
+
+
+@define
+class Inner:
+    a: int
+    b: str = "b"
+
+
+@define
+class Outer:
+    a: int
+    inner: Inner
+    inners: list[Inner]
+    b: Optional[float] = None
+    c: int = field(init=False, default=1)
+    d: int = field(kw_only=True, default=2)
+
+
+@given(cl_and_vals=nested_typed_classes(allow_nan=False), detailed_validation=...)
+def test_roundtrip(cl_and_vals, detailed_validation: bool):
+    """Classes roundtrip through tuples, keyword-only fields included."""
+    cl, vals, kwargs = cl_and_vals
+    inst = cl(*vals, **kwargs)
+    converter = Converter(
+        unstruct_strat=UnstructureStrategy.AS_TUPLE,
+        detailed_validation=detailed_validation,
+    )
+
+    unstructured = converter.unstructure(inst)
+
+    assert isinstance(unstructured, tuple)
+    assert converter.structure(unstructured, cl) == inst
+
+
+@pytest.mark.parametrize("detailed_validation", [True, False, "optimistic"])
+def test_generated(detailed_validation):
+    """Generated hooks behave like the `BaseConverter` ones, skipping fields with
+    `init=False` and accepting missing trailing values."""
+    converter = Converter(
+        unstruct_strat=UnstructureStrategy.AS_TUPLE,
+        detailed_validation=detailed_validation,
+    )
+    inst = Outer(1, Inner(2, "c"), [Inner(3)], 4.0, d=5)
+
+    unstructured = converter.unstructure(inst)
+
+    assert unstructured == (1, (2, "c"), [(3, "b")], 4.0, 1, 5)
+    assert unstructured == BaseConverter(
+        unstruct_strat=UnstructureStrategy.AS_TUPLE
+    ).unstructure(inst)
+    assert converter.structure(unstructured, Outer) == inst
+    assert converter.structure([1, [2], []], Outer) == Outer(1, Inner(2), [])
+
+
+def test_overrides():
+    """Fields can be omitted, and their hooks overridden."""
+    converter = Converter(unstruct_strat=UnstructureStrategy.AS_TUPLE)
+    overrides = {
+        "inner": override(omit=True),
+        "a": override(
+            unstruct_hook=lambda v: str(v), struct_hook=lambda v, _: int(v) * 2
+        ),
+    }
+    unstructure = make_tuple_unstructure_fn(Outer, converter, **overrides)
+    structure = make_tuple_structure_fn(Outer, converter, **overrides)
+
+    unstructured = unstructure(Outer(1, Inner(2), [], d=3))
+
+    assert unstructured == ("1", [], None, 1, 3)
+    with pytest.raises(ClassValidationError):
+        # `inner` is required.
+        structure(unstructured, Outer)
+
+    @define
+    class Defaults:
+        a: int
+        b: int = 2
+        c: int = 3
+
+    unstructure = make_tuple_unstructure_fn(Defaults, converter, b=override(omit=True))
+    structure = make_tuple_structure_fn(Defaults, converter, b=override(omit=True))
+
+    assert unstructure(Defaults(1, 4, 5)) == (1, 5)
+    assert structure((1, 5), Defaults) == Defaults(1, 2, 5)
+
+
+@pytest.mark.parametrize("detailed_validation", [True, "optimistic"])
+def test_detailed_validation(detailed_validation):
+    """Errors are reported per field."""
+    converter = Converter(
+        unstruct_strat=UnstructureStrategy.AS_TUPLE,
+        detailed_validation=detailed_validation,
+    )
+
+    with pytest.raises(ClassValidationError) as exc_info:
+        converter.structure(["a", [1], [[2], ["c"]], "d"], Outer)
+
+    assert transform_error(exc_info.value) == [
+        "invalid value for type, expected int @ $.a",
+        "invalid value for type, expected int @ $.inners[1].a",
+        "invalid value for type, expected Optional @ $.b",
+    ]
+
+    with pytest.raises(ClassValidationError) as exc_info:
+        converter.structure([1], Outer)
+
+    assert [type(e) for e in exc_info.value.exceptions] == [IndexError, IndexError]
@@ -60,6 +60,34 @@ def test_able_to_structure_generics(converter: BaseConverter, t, t2, t3, result)
     assert res == result
 
 
+@pytest.mark.parametrize("detailed_validation", [True, False])
+def test_parametrizations_share_code(detailed_validation: bool):
+    """Hooks for parametrizations of a generic class share their code, and only
+    differ in the hooks they use."""
+    converter = Converter(detailed_validation=detailed_validation)
+
+    structure_int = converter.get_structure_hook(GenericCols[int])
+    structure_float = converter.get_structure_hook(GenericCols[float])
+
+    assert structure_int.__code__ is structure_float.__code__
+    assert structure_int(
+        {"a": "1", "b": ["2"], "c": {"c": "3"}}, GenericCols[int]
+    ) == GenericCols(1, [2], {"c": 3})
+    assert structure_float(
+        {"a": 1, "b": [2], "c": {"c": 3}}, GenericCols[float]
+    ) == GenericCols(1.0, [2.0], {"c": 3.0})
+
+    other = Converter(detailed_validation=detailed_validation)
+
+    assert other.get_structure_hook(GenericCols[bool]).__code__ is (
+        structure_int.__code__
+    )
+    assert (
+        converter.get_unstructure_hook(GenericCols[int]).__code__
+        is converter.get_unstructure_hook(GenericCols[float]).__code__
+    )
+
+
 @pytest.mark.parametrize(
     ("t", "result"),
     ((int, GenericCols(1, [2], {"3": 3})), (str, GenericCols("1", ["2"], {"3": "3"}))),
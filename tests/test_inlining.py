@@ -0,0 +1,145 @@
+"""Tests for inlining nested class hooks into generated hooks."""
+
+from __future__ import annotations
+
+from types import FunctionType
+from typing import Optional
+
+from attrs import Factory, define
+from hypothesis import given
+
+from cattrs import Converter
+
+from .typed import nested_typed_classes
+
+
+@define
+class Leaf:
+    a: int
+    b: str
+
+
+@define
+class Middle:
+    a: Leaf
+    b: Leaf
+
+
+@define
+class Top:
+    a: Middle
+    b: int
+
+
+@define
+class Node:
+    value: int
+    next: Optional[Node] = None
+
+
+def _called(hook) -> set[str]:
+    """The names of the generated class hooks a generated hook calls."""
+    return {
+        f.__name__
+        for f in hook.__defaults__ or ()
+        if isinstance(f, FunctionType)
+        and f.__name__.startswith(("structure_", "unstructure_"))
+    }
+
+
+@given(
+    cl_and_vals=nested_typed_classes(allow_nan=False),
+    detailed_validation=...,
+    omit_if_default=...,
+)
+def test_roundtrip(cl_and_vals, detailed_validation: bool, omit_if_default: bool):
+    """Inlined hooks behave like the hooks they inline."""
+    cl, vals, kwargs = cl_and_vals
+    inst = cl(*vals, **kwargs)
+    expected = Converter(
+        detailed_validation=detailed_validation, omit_if_default=omit_if_default
+    )
+    converter = Converter(
+        detailed_validation=detailed_validation,
+        omit_if_default=omit_if_default,
+        inline_depth=3,
+    )
+
+    unstructured = converter.unstructure(inst)
+    assert unstructured == expected.unstructure(inst)
+    assert converter.structure(unstructured, cl) == inst
+
+
+def test_inlined():
+    """Nested class hooks are inlined instead of called, up to the depth."""
+    inst = Top(Middle(Leaf(1, "a"), Leaf(2, "b")), 3)
+    raw = {"a": {"a": {"a": 1, "b": "a"}, "b": {"a": 2, "b": "b"}}, "b": 3}
+
+    for depth, called in ((0, Middle), (1, Leaf), (2, None)):
+        converter = Converter(detailed_validation=False, inline_depth=depth)
+        unstructure = converter.get_unstructure_hook(Top)
+        structure = converter.get_structure_hook(Top)
+        assert unstructure(inst) == raw
+        assert structure(raw, Top) == inst
+
+        assert _called(unstructure) | _called(structure) == (
+            {f"unstructure_{called.__name__}", f"structure_{called.__name__}"}
+            if called is not None
+            else set()
+        )
+
+
+def test_not_inlined():
+    """Custom hooks, and structure hooks with detailed validation, are called."""
+    converter = Converter(inline_depth=2)
+    converter.register_unstructure_hook(Leaf, lambda leaf: leaf.a)
+
+    inst = Middle(Leaf(1, "a"), Leaf(2, "b"))
+    assert converter.unstructure(inst) == {"a": 1, "b": 2}
+
+    raw = {"a": {"a": 1, "b": "a"}, "b": {"a": 2, "b": "b"}}
+    assert converter.structure(raw, Middle) == inst
+    assert _called(converter.get_structure_hook(Middle)) == {"structure_Leaf"}
+
+
+def test_recursive():
+    """Recursive classes are still called."""
+    converter = Converter(detailed_validation=False, inline_depth=5)
+    inst = Node(1, Node(2, Node(3)))
+    raw = {"value": 1, "next": {"value": 2, "next": {"value": 3, "next": None}}}
+
+    assert converter.unstructure(inst) == raw
+    assert converter.structure(raw, Node) == inst
+
+
+@define
+class Containers:
+    a: list[Leaf]
+    b: dict[str, int]
+    c: tuple[str, ...]
+    d: list[int] = Factory(list)
+
+
+def test_inlined_collections():
+    """Collection hooks are inlined as comprehensions, regardless of the depth."""
+    inst = Containers([Leaf(1, "a")], {"b": 2}, ("c",), [3])
+    raw = {"a": [{"a": 1, "b": "a"}], "b": {"b": 2}, "c": ["c"], "d": [3]}
+
+    converter = Converter(detailed_validation=False)
+    unstructure = converter.get_unstructure_hook(Containers)
+    structure = converter.get_structure_hook(Containers)
+
+    assert unstructure(inst) == raw
+    assert structure(raw, Containers) == inst
+    assert not {
+        f.__name__
+        for f in (*unstructure.__defaults__, *structure.__defaults__)
+        if isinstance(f, FunctionType)
+    } & {"structure_list", "structure_mapping", "structure_tuple"}
+
+    # Detailed validation needs the collection hooks to collect errors.
+    converter = Converter()
+    assert (
+        "__c_structure_a"
+        in converter.get_structure_hook(Containers).__code__.co_varnames
+    )
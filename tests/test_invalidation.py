@@ -0,0 +1,156 @@
+"""Tests for targeted hook invalidation on registration."""
+
+from typing import Optional, Union
+
+import pytest
+from attrs import define
+
+from cattrs import BaseConverter, Converter
+
+
+@define
+class Inner:
+    a: int
+
+
+@define
+class Outer:
+    inner: Inner
+    inners: list[Inner]
+    opt: Optional[Inner] = None
+
+
+@define
+class Unrelated:
+    a: int
+    b: list[str]
+
+
+@pytest.fixture(params=["strong", "weak"])
+def dispatch_cache(request):
+    return request.param
+
+
+@pytest.mark.parametrize("converter_cls", [BaseConverter, Converter])
+def test_late_structure_registration(converter_cls, dispatch_cache):
+    """Late structure hook registrations reach generated dependents."""
+    c = converter_cls(dispatch_cache=dispatch_cache)
+
+    raw = {"inner": {"a": 1}, "inners": [{"a": 1}], "opt": {"a": 1}}
+    assert c.structure(raw, Outer) == Outer(Inner(1), [Inner(1)], Inner(1))
+    unrelated_hook = c.get_structure_hook(Unrelated)
+
+    c.register_structure_hook(Inner, lambda v, _: Inner(v["a"] + 1))
+
+    assert c.structure(raw, Outer) == Outer(Inner(2), [Inner(2)], Inner(2))
+    assert c.get_structure_hook(Unrelated) is unrelated_hook
+
+
+@pytest.mark.parametrize("converter_cls", [BaseConverter, Converter])
+def test_late_unstructure_registration(converter_cls, dispatch_cache):
+    """Late unstructure hook registrations reach generated dependents."""
+    c = converter_cls(dispatch_cache=dispatch_cache)
+
+    obj = Outer(Inner(1), [Inner(1)], Inner(1))
+    assert c.unstructure(obj) == {
+        "inner": {"a": 1},
+        "inners": [{"a": 1}],
+        "opt": {"a": 1},
+    }
+    unrelated_hook = c.get_unstructure_hook(Unrelated)
+
+    c.register_unstructure_hook(Inner, lambda v: v.a)
+
+    assert c.unstructure(obj) == {"inner": 1, "inners": [1], "opt": 1}
+    assert c.get_unstructure_hook(Unrelated) is unrelated_hook
+
+
+def test_late_primitive_registration(dispatch_cache):
+    """Registrations for primitives reach generated dependents."""
+    c = Converter(dispatch_cache=dispatch_cache)
+
+    assert c.structure({"a": "1", "b": [1]}, Unrelated) == Unrelated(1, ["1"])
+    outer_hook = c.get_structure_hook(Outer)
+
+    c.register_structure_hook(str, lambda v, _: f"s{v}")
+
+    assert c.structure({"a": "1", "b": [1]}, Unrelated) == Unrelated(1, ["s1"])
+    # `Outer` does not depend on `str`.
+    assert c.get_structure_hook(Outer) is outer_hook
+
+
+def test_late_predicate_registration(dispatch_cache):
+    """Predicate registrations only invalidate matching types."""
+    c = Converter(dispatch_cache=dispatch_cache)
+
+    c.structure({"inner": {"a": 1}, "inners": []}, Outer)
+    unrelated_hook = c.get_structure_hook(Unrelated)
+
+    c.register_structure_hook_func(lambda t: t is Inner, lambda v, _: Inner(v["a"] + 1))
+
+    assert c.structure({"inner": {"a": 1}, "inners": []}, Outer) == Outer(Inner(2), [])
+    assert c.get_structure_hook(Unrelated) is unrelated_hook
+
+
+def test_late_subclass_registration():
+    """Registrations for base classes reach subclasses."""
+
+    @define
+    class Base:
+        a: int
+
+    @define
+    class Child(Base):
+        b: int = 0
+
+    @define
+    class Container:
+        child: Child
+
+    c = Converter()
+
+    assert c.structure({"child": {"a": 1}}, Container) == Container(Child(1))
+
+    c.register_structure_hook(Base, lambda v, t: t(v["a"] + 1))
+
+    assert c.structure({"child": {"a": 1}}, Container) == Container(Child(2))
+
+
+def test_late_union_registration():
+    """Union registrations reach generated dependents."""
+
+    @define
+    class A:
+        a: int
+
+    @define
+    class B:
+        b: int
+
+    @define
+    class Container:
+        field: Union[A, B]
+
+    c = Converter()
+
+    assert c.structure({"field": {"b": 1}}, Container) == Container(B(1))
+
+    c.register_structure_hook(Union[A, B], lambda v, _: A(0))
+
+    assert c.structure({"field": {"b": 1}}, Container) == Container(A(0))
+
+
+def test_cross_converter_dependencies():
+    """Hooks borrowed from other converters are invalidated too."""
+    c1 = Converter()
+    c2 = Converter()
+
+    c2.register_structure_hook_factory(
+        lambda t: t is Unrelated, lambda _: c1.get_structure_hook(Inner)
+    )
+
+    assert c2.structure({"a": 1}, Unrelated) == Inner(1)
+
+    c1.register_structure_hook(Inner, lambda v, _: Inner(v["a"] + 1))
+
+    assert c2.structure({"a": 1}, Unrelated) == Inner(2)
@@ -0,0 +1,128 @@
+"""Tests for optimistic detailed validation."""
+
+from __future__ import annotations
+
+from inspect import signature
+from typing import Optional
+
+import pytest
+from attrs import define, field, make_class
+from hypothesis import given
+
+from cattrs import ClassValidationError, Converter, transform_error
+
+from .typed import nested_typed_classes
+
+
+@define
+class Leaf:
+    a: int
+    b: str = "b"
+
+
+@define
+class Classes:
+    a: list[int]
+    b: dict[str, Leaf]
+    c: Leaf
+    d: tuple[int, ...] = ()
+
+
+def _errors(converter: Converter, obj, cl) -> tuple[type[Exception], list[str]]:
+    try:
+        converter.structure(obj, cl)
+    except Exception as exc:
+        return type(exc), transform_error(exc)
+    raise AssertionError("no errors")
+
+
+@given(cl_and_vals=nested_typed_classes(allow_nan=False))
+def test_roundtrip(cl_and_vals):
+    """Valid input is structured like in other modes."""
+    cl, vals, kwargs = cl_and_vals
+    inst = cl(*vals, **kwargs)
+    converter = Converter(detailed_validation="optimistic")
+
+    assert converter.structure(converter.unstructure(inst), cl) == inst
+
+
+def test_errors():
+    """Invalid input produces the same errors as in detailed mode."""
+    optimistic = Converter(detailed_validation="optimistic")
+    detailed = Converter()
+
+    for obj in (
+        {"a": [1, "a"], "b": {"b": {"a": "b"}}, "c": {}, "d": ["d"]},
+        {"a": [1], "b": {}, "c": {"a": 1}, "d": ["d"]},
+        {"a": [1], "b": {"b": None}, "c": {"a": 1}},
+        {"a": [1], "b": {}},
+        [],
+    ):
+        assert _errors(optimistic, obj, Classes) == _errors(detailed, obj, Classes)
+
+    assert _errors(optimistic, [1, "a"], list[int]) == _errors(
+        detailed, [1, "a"], list[int]
+    )
+    assert _errors(optimistic, {"a": "a"}, dict[str, int]) == _errors(
+        detailed, {"a": "a"}, dict[str, int]
+    )
+
+
+def test_one_shot_iterables():
+    """One-shot iterables are not silently lost when the fast path fails."""
+    optimistic = Converter(detailed_validation="optimistic")
+    detailed = Converter()
+
+    assert _errors(optimistic, (e for e in ("1", "a", "3")), list[int]) == _errors(
+        detailed, (e for e in ("1", "a", "3")), list[int]
+    )
+    assert optimistic.structure((e for e in ("1", "3")), list[int]) == [1, 3]
+
+    # Nested iterables are consumed by the fast path, so its error is raised.
+    with pytest.raises(ValueError):
+        optimistic.structure(
+            {"a": (e for e in ("1", "a")), "b": {}, "c": {"a": 1}}, Classes
+        )
+
+
+def test_fast_path():
+    """The generated hooks do not collect errors unless structuring fails."""
+    converter = Converter(detailed_validation="optimistic")
+    hook = converter.get_structure_hook(Classes)
+
+    detailed = signature(hook).parameters["__c_detailed"].default
+    assert "errors" not in hook.__code__.co_varnames
+    assert "errors" in detailed.__code__.co_varnames
+
+
+@pytest.mark.parametrize(
+    ("wrap", "wrap_val"),
+    [
+        (lambda t: t, lambda v: v),
+        (lambda t: list[t], lambda v: [v]),
+        (lambda t: tuple[t, ...], lambda v: [v]),
+        (lambda t: dict[str, t], lambda v: {"a": v}),
+        (lambda t: Optional[t], lambda v: v),
+    ],
+)
+def test_failures_retried_once(wrap, wrap_val):
+    """Failures are retried once in detail, not once per level of nesting."""
+    converter = Converter(detailed_validation="optimistic")
+    calls = []
+
+    def structure_leaf(val, _):
+        calls.append(val)
+        raise ValueError("Invalid leaf")
+
+    converter.register_structure_hook(Leaf, structure_leaf)
+
+    for depth in (1, 4, 8):
+        cl, val = Leaf, {}
+        for ix in range(depth):
+            cl = make_class(f"Nested{ix}", {"a": field(type=wrap(cl))})
+            val = {"a": wrap_val(val)}
+
+        calls.clear()
+        with pytest.raises(ClassValidationError):
+            converter.structure(val, cl)
+        assert len(calls) == 2
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 
+import pytest
 from attr import define
 
 from cattr import Converter
+from cattrs.errors import ClassValidationError
+from cattrs.gen._shared import LateStructureHook, LateUnstructureHook
+from cattrs.v import transform_error
 
 
 @define
@@ -23,3 +27,82 @@ def test_simple_recursive():
     assert unstructured == {"inner": [{"inner": []}]}
 
     assert c.structure(unstructured, A) == orig
+
+
+@define
+class Node:
+    value: int
+    children: List[Node]
+    next: Optional[Node] = None
+
+
+@pytest.mark.parametrize("detailed_validation", [True, False, "optimistic"])
+def test_late_binding(detailed_validation):
+    """Recursive references end up calling the generated hooks directly."""
+    c = Converter(detailed_validation=detailed_validation)
+
+    orig = Node(1, [Node(2, [], Node(3, []))], Node(4, [Node(5, [])]))
+    unstructured = c.unstructure(orig)
+
+    assert unstructured == {
+        "value": 1,
+        "children": [
+            {
+                "value": 2,
+                "children": [],
+                "next": {"value": 3, "children": [], "next": None},
+            }
+        ],
+        "next": {
+            "value": 4,
+            "children": [{"value": 5, "children": [], "next": None}],
+            "next": None,
+        },
+    }
+    assert c.structure(unstructured, Node) == orig
+
+    # The late hooks have replaced themselves, and nothing dispatches again.
+    late = (LateStructureHook, LateUnstructureHook)
+    for hook in (c.get_structure_hook(Node), c.get_unstructure_hook(Node)):
+        for default in hook.__defaults__:
+            for d in (default, *(getattr(default, "__defaults__", None) or ())):
+                assert not isinstance(d, late)
+                assert d not in (c.structure, c.unstructure)
+
+
+def test_late_binding_errors():
+    """Errors in late bound hooks are reported like others."""
+    c = Converter()
+
+    with pytest.raises(ClassValidationError) as exc_info:
+        c.structure({"value": 1, "children": [{"value": "a", "children": []}]}, Node)
+
+    assert transform_error(exc_info.value) == [
+        "invalid value for type, expected int @ $.children[0].value"
+    ]
+
+
+@define
+class Left:
+    right: List[Right]
+
+
+@define
+class Right:
+    left: List[Left]
+
+
+def test_late_binding_invalidation():
+    """Late bound hooks are regenerated when the hooks they fetch change."""
+    c = Converter()
+
+    assert c.structure({"right": [{"left": [{"right": []}]}]}, Left) == Left(
+        [Right([Left([])])]
+    )
+    assert c.unstructure(Left([Right([])])) == {"right": [{"left": []}]}
+
+    c.register_structure_hook(Left, lambda _, __: "CUSTOM")
+    c.register_unstructure_hook(Left, lambda _: "CUSTOM")
+
+    assert c.structure({"left": [{"right": []}]}, Right) == Right(["CUSTOM"])
+    assert c.unstructure(Right([Left([])])) == {"left": ["CUSTOM"]}
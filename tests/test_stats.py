@@ -0,0 +1,74 @@
+"""Tests for converter statistics."""
+
+import pytest
+from attrs import define
+
+from cattrs import BaseConverter, Converter
+
+
+@define
+class A:
+    a: int
+    b: list[str]
+
+
+@pytest.mark.parametrize("converter_cls", [BaseConverter, Converter])
+@pytest.mark.parametrize("dispatch_cache", ["strong", "weak"])
+def test_stats(converter_cls, dispatch_cache):
+    """Statistics are collected once enabled."""
+    c = converter_cls(dispatch_cache=dispatch_cache)
+
+    c.structure({"a": 1, "b": []}, A)
+    stats = c.stats()
+    assert stats.structure.hits == stats.structure.misses == 0
+    assert stats.structure.cache_size > 0
+
+    c.enable_stats()
+    c.structure({"a": 1, "b": ["b"]}, A)
+    c.structure([{"a": 1, "b": ["b"]}], list[A])
+    c.structure([{"a": 1, "b": ["b"]}], list[A])
+
+    stats = c.stats().structure
+    assert stats.hits >= 2
+    assert stats.misses >= 1
+    assert stats.resolutions >= 1
+    assert stats.predicate_calls >= 1
+    assert list[A] in stats.generation_times
+    if converter_cls is Converter:
+        assert stats.compiled == 0  # `A` was generated before.
+
+    c.unstructure(A(1, ["b"]))
+    stats = c.stats().unstructure
+    assert stats.misses >= 1
+    assert A in stats.generation_times
+    if converter_cls is Converter:
+        assert stats.compiled == 1
+        assert stats.compile_time > 0
+
+    # Snapshots are not affected by further activity.
+    hits = stats.hits
+    c.unstructure(A(1, ["b"]))
+    assert stats.hits == hits
+
+    assert c.stats().unstructure.hits > hits
+
+    # Collected statistics are kept, but not updated anymore.
+    c.disable_stats()
+    hits = c.stats().unstructure.hits
+    c.unstructure(A(1, ["b"]))
+    assert c.stats().unstructure.hits == hits
+
+    c.enable_stats()
+    assert c.stats().unstructure.hits == 0
+
+
+def test_stats_survive_freezing():
+    """Freezing keeps collecting statistics."""
+    c = Converter(dispatch_cache="weak")
+    c.enable_stats()
+    c.structure({"a": 1, "b": []}, A)
+
+    c.freeze()
+    c.structure({"a": 1, "b": []}, A)
+
+    assert c.stats().structure.hits == 1
@@ -0,0 +1,142 @@
+"""Tests for concurrent hook generation."""
+
+from __future__ import annotations
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier, Event, Lock
+from time import sleep
+from typing import Optional
+
+import pytest
+from attrs import define, field, has, make_class, resolve_types
+
+from cattrs import BaseConverter, Converter
+from cattrs.gen import make_dict_structure_fn
+
+THREADS = 16
+
+
+@pytest.mark.parametrize("converter_cls", [BaseConverter, Converter])
+@pytest.mark.parametrize("dispatch_cache", ["strong", "weak"])
+def test_hooks_generated_once(converter_cls, dispatch_cache):
+    """Concurrent first uses of a type generate its hook only once."""
+    c = converter_cls(dispatch_cache=dispatch_cache)
+    generated = Counter()
+    lock = Lock()
+
+    def factory(cl):
+        with lock:
+            generated[cl] += 1
+        sleep(0.01)  # Widen the window for races.
+        return make_dict_structure_fn(cl, c)
+
+    c.register_structure_hook_factory(has, factory)
+
+    classes = [make_class(f"C{i}", {"a": field(type=int)}) for i in range(20)]
+    barrier = Barrier(THREADS)
+
+    def work(_):
+        barrier.wait()
+        return [(c.structure({"a": 1}, cl), c.get_structure_hook(cl)) for cl in classes]
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        results = list(pool.map(work, range(THREADS)))
+
+    assert all(generated[cl] == 1 for cl in classes)
+    for res in results:
+        for (obj, hook), (expected_obj, expected_hook) in zip(res, results[0]):
+            assert obj == expected_obj
+            assert hook is expected_hook
+
+
+@define
+class Node:
+    children: list[Node]
+    parent: Optional[Node] = None
+
+
+resolve_types(Node)
+
+
+@pytest.mark.parametrize("converter_cls", [BaseConverter, Converter])
+def test_concurrent_recursive_types(converter_cls):
+    """Recursive types work under concurrent first use."""
+    c = converter_cls()
+    barrier = Barrier(THREADS)
+    raw = {"children": [{"children": [], "parent": None}], "parent": None}
+
+    def work(i):
+        barrier.wait()
+        if i % 2:
+            return c.structure([raw], list[Node])[0]
+        return c.structure(raw, Node)
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        results = list(pool.map(work, range(THREADS)))
+
+    assert all(r == Node([Node([])]) for r in results)
+
+
+@define
+class A:
+    b: B
+
+
+@define
+class B:
+    a: Optional[A]
+
+
+def test_mutually_dependent_generation():
+    """Threads generating mutually dependent hooks do not deadlock."""
+    c = Converter()
+    started = {A: Event(), B: Event()}
+    other = {A: B, B: A}
+
+    def factory(cl):
+        if not started[cl].is_set():
+            # Make sure both threads are generating before going any further.
+            started[cl].set()
+            assert started[other[cl]].wait(5)
+            sleep(0.01)
+        return make_dict_structure_fn(cl, c)
+
+    c.register_structure_hook_factory(lambda t: t in (A, B), factory)
+
+    with ThreadPoolExecutor(2) as pool:
+        a = pool.submit(c.structure, {"b": {"a": None}}, A)
+        b = pool.submit(c.structure, {"a": {"b": {"a": None}}}, B)
+
+        assert a.result(10) == A(B(None))
+        assert b.result(10) == B(A(B(None)))
+
+
+@pytest.mark.parametrize("dispatch_cache", ["strong", "weak"])
+def test_registering_while_dispatching(dispatch_cache):
+    """Hooks can be registered while other threads dispatch."""
+    c = Converter(dispatch_cache=dispatch_cache)
+    classes = [make_class(f"C{i}", {"a": field(type=int)}) for i in range(50)]
+    stop = Event()
+
+    def dispatch(_):
+        while not stop.is_set():
+            for cl in classes:
+                assert c.structure({"a": 1}, cl).a in (1, 2)
+                assert c.structure([1], list[int]) == [1]
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        futures = [pool.submit(dispatch, i) for i in range(THREADS - 1)]
+        for i, cl in enumerate(classes):
+            # Alternate between singledispatch and predicate registrations.
+            if i % 2:
+                c.register_structure_hook(cl, lambda _, cl: cl(2))
+            else:
+                c.register_structure_hook_func(
+                    lambda t, cl=cl: t is cl, lambda _, cl: cl(2)
+                )
+        stop.set()
+        for future in futures:
+            future.result(10)
+
+    assert all(c.structure({"a": 1}, cl).a == 2 for cl in classes)
@@ -0,0 +1,115 @@
+"""Tests for converters trusting primitives."""
+
+from enum import Enum, IntEnum
+from typing import Optional
+
+from attrs import define
+from hypothesis import given
+
+from cattrs import Converter
+
+from .typed import nested_typed_classes
+
+
+@define
+class Primitives:
+    a: int
+    b: float
+    c: str
+    d: bytes
+    e: list[int]
+    f: dict[str, float]
+    g: set[str]
+    h: tuple[int, ...]
+    i: int = 0
+
+
+class IntColor(IntEnum):
+    RED = 1
+
+
+class StrColor(str, Enum):
+    RED = "red"
+
+
+@define
+class Subclasses:
+    a: IntColor
+    b: StrColor
+    c: list[IntColor]
+    d: bool
+
+
+@given(cl_and_vals=nested_typed_classes(allow_nan=False), detailed_validation=...)
+def test_roundtrip(cl_and_vals, detailed_validation: bool):
+    """Trusting converters structure well-typed input like other converters."""
+    cl, vals, kwargs = cl_and_vals
+    inst = cl(*vals, **kwargs)
+    converter = Converter(
+        trust_primitives=True, detailed_validation=detailed_validation
+    )
+
+    assert converter.structure(converter.unstructure(inst), cl) == inst
+
+
+@given(detailed_validation=...)
+def test_passthrough(detailed_validation: bool):
+    """Primitives are used as is, and collections of them are copied."""
+    converter = Converter(
+        trust_primitives=True, detailed_validation=detailed_validation
+    )
+    raw = {
+        "a": "1",
+        "b": 2,
+        "c": 3,
+        "d": "4",
+        "e": ["5"],
+        "f": {"6": 6},
+        "g": ["7"],
+        "h": ["8"],
+        "i": "9",
+    }
+
+    res = converter.structure(raw, Primitives)
+
+    assert res == Primitives("1", 2, 3, "4", ["5"], {"6": 6}, {"7"}, ("8",), "9")
+    assert res.e is not raw["e"]
+    assert res.f is not raw["f"]
+
+    assert converter.structure("1", int) == "1"
+    assert converter.structure("1", Optional[int]) == "1"
+
+
+def test_copy():
+    """Copies can trust primitives, or stop trusting them."""
+    trusting = Converter(trust_primitives=True)
+    converter = Converter()
+    converter.register_structure_hook(int, lambda v, _: int(v) * 2)
+
+    assert trusting.copy().structure("1", str) == "1"
+    assert trusting.copy().structure(1.0, int) == 1.0
+    assert trusting.copy(trust_primitives=False).structure(1.0, int) == 1
+
+    copy = converter.copy(trust_primitives=True)
+    assert copy.structure(1, str) == 1
+    # Customized hooks stay.
+    assert copy.structure("1", int) == 2
+
+
+@given(detailed_validation=...)
+def test_subclasses(detailed_validation: bool):
+    """Subclasses of primitives, like enums, are not trusted."""
+    converter = Converter(
+        trust_primitives=True, detailed_validation=detailed_validation
+    )
+
+    assert converter.structure(1, IntColor) is IntColor.RED
+    assert converter.structure("red", StrColor) is StrColor.RED
+    assert converter.structure(0, bool) is False
+    assert converter.structure(
+        {"a": 1, "b": "red", "c": [1], "d": 1}, Subclasses
+    ) == Subclasses(IntColor.RED, StrColor.RED, [IntColor.RED], True)
+
+    copy = Converter().copy(trust_primitives=True)
+    assert copy.structure(1, IntColor) is IntColor.RED
+    assert copy.structure("1", int) == "1"
@@ -0,0 +1,124 @@
+"""Tests for warming up converters."""
+
+from dataclasses import dataclass
+from typing import Generic, NewType, Optional, TypedDict, TypeVar
+
+import pytest
+from attrs import define, resolve_types
+
+from cattrs import BaseConverter, Converter
+from cattrs._warmup import walk_types
+
+T = TypeVar("T")
+UserId = NewType("UserId", int)
+
+
+class TD(TypedDict):
+    ids: list[UserId]
+
+
+@dataclass
+class DC:
+    td: TD
+
+
+@define
+class G(Generic[T]):
+    a: T
+    b: tuple[T, ...]
+
+
+@define
+class Root:
+    g: G[DC]
+    parent: Optional["Root"]
+    m: dict[str, frozenset[int]]
+
+
+resolve_types(Root)
+
+
+def test_walk_types():
+    """Nested types are walked, once each."""
+    assert list(walk_types([Root])) == [
+        Root,
+        G[DC],
+        DC,
+        TD,
+        list[UserId],
+        UserId,
+        int,
+        tuple[DC, ...],
+        Optional[Root],
+        type(None),
+        dict[str, frozenset[int]],
+        str,
+        frozenset[int],
+    ]
+
+
+@pytest.mark.parametrize("converter_cls", [BaseConverter, Converter])
+def test_warmup(converter_cls):
+    """After warming up, un/structuring generates no hooks."""
+    c = converter_cls()
+    report = c.warmup([Root])
+
+    assert report.errors == {}
+    assert report.duration > 0
+    assert {Root, G[DC], DC, TD, Optional[Root]} <= set(report.structure)
+    assert {Root, G[DC], DC, TD, Optional[Root]} <= set(report.unstructure)
+
+    c.enable_stats()
+    raw = {"g": {"a": {"td": {"ids": [1]}}, "b": []}, "parent": None, "m": {"a": [1]}}
+    c.unstructure(c.structure(raw, Root))
+    stats = c.stats()
+    assert stats.structure.misses == 0
+    assert stats.unstructure.misses == 0
+
+    again = c.warmup([Root])
+    assert again.structure == again.unstructure == []
+
+
+def test_warmup_directions():
+    """Warmups can be limited to a direction."""
+    c = Converter()
+    report = c.warmup([Root], directions=["structure"])
+
+    assert Root in report.structure
+    assert report.unstructure == []
+    assert Root not in c._unstructure_func._cache
+
+    with pytest.raises(ValueError):
+        c.warmup([Root], directions=["serialize"])
+
+
+class Unsupported:
+    pass
+
+
+@define
+class HasUnsupported:
+    a: int
+    b: Unsupported
+
+
+def test_warmup_errors():
+    """Errors are reported."""
+    c = Converter()
+    report = c.warmup([HasUnsupported])
+
+    assert set(report.errors) == {
+        ("structure", HasUnsupported),
+        ("structure", Unsupported),
+    }
+    assert int in report.structure
+
+
+def test_warmup_background():
+    """Warmups can run in the background."""
+    c = Converter()
+    future = c.warmup([Root], background=True)
+
+    report = future.result(10)
+    assert Root in report.structure
+    assert Root in c._structure_func._cache